@@ -14,7 +14,7 @@ from src.utils.helpers import load_config, create_okx_exchange
 from src.core.order_executor import OrderExecutor
 from src.notifications.discord_notifier import DiscordNotifier
 from src.database.models import init_database
-from src.utils.constants import TradeMode
+from src.utils.constants import TradeMode, TRADE_MODES
 
 async def system_reset():
     logger.info("═══ [시스템 초기화 및 포지션 관리 지침] 기반 리셋 시작 ═══")
@@ -22,7 +22,7 @@ async def system_reset():
     # 1. 설정 로드
     config = load_config()
     mode_str = config["trading"]["mode"]
-    mode = TradeMode(mode_str)
+    mode = TRADE_MODES[mode_str]
     initial_capital = config["risk"].get("initial_capital", 10000.0)
     
     # 2. 거래소 연결
@@ -302,7 +302,7 @@ class Backtester:
 
         # 미청산 포지션 정리
         if position:
-            last_price = df_5m.iloc[-1]["close"]
+            last_price = df_5m["close"].iat[-1]
             quantity = position["quantity"]
             balance += last_price * quantity * (1 - self.fee_rate)
             position = None
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import ccxt
+import numpy as np
 import pandas as pd
 from loguru import logger
 from src.utils.constants import (
+    BALANCE_CACHE_TTL,
     OKX_API_DELAY,
     MAX_CANDLES_CACHE,
     MIN_CANDLES_FOR_INDICATORS,
+    PRICE_CACHE_TTL,
     TIMEFRAME_MAP,
 )
 
@@ -28,7 +32,12 @@ class DataFetcher:
             self.exchange = ccxt.okx({"enableRateLimit": True, "timeout": 15000})
         self._cache: dict[str, pd.DataFrame] = {}
         self._price_cache: dict[str, float] = {}
+        self._price_ts: dict[str, float] = {}  # pair → 조회 시각 (monotonic)
+        # market_type → (조회 시각 monotonic, fetch_balance 원본 응답)
+        self._balance_cache: dict[str, tuple[float, dict]] = {}
+        self._balance_lock = threading.Lock()
         self._last_request_time: float = 0
+        self._rate_lock = threading.Lock()
         self._warn_last_ts: dict[str, float] = {}
         self._warn_suppressed: dict[str, int] = {}
         self._warn_throttle_seconds = 300
@@ -55,11 +64,12 @@ class DataFetcher:
             self._warn_suppressed[key] = self._warn_suppressed.get(key, 0) + 1
 
     def _rate_limit(self):
-        """API Rate Limit 준수"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < OKX_API_DELAY:
-            time.sleep(OKX_API_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """API Rate Limit 준수 (스레드 동시 호출 시 요청 간격 직렬화)"""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < OKX_API_DELAY:
+                time.sleep(OKX_API_DELAY - elapsed)
+            self._last_request_time = time.time()
 
     @staticmethod
     def _resolve_timeframe(interval: str) -> str:
@@ -114,13 +124,16 @@ class DataFetcher:
                 logger.warning(f"[DataFetcher] {pair} {tf} 데이터 비어있음")
                 return None
 
-            # ccxt OHLCV → DataFrame 변환
+            # ccxt OHLCV → DataFrame 변환 (OHLCV 5열만, float64 단일 블록)
+            arr = np.asarray(ohlcv, dtype=np.float64)
             df = pd.DataFrame(
-                ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"]
+                arr[:, 1:6],
+                index=pd.DatetimeIndex(
+                    pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms"),
+                    name="timestamp",
+                ),
+                columns=["open", "high", "low", "close", "volume"],
             )
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-            df = df.set_index("timestamp")
-            df = df[["open", "high", "low", "close", "volume"]].astype(float)
 
             if len(df) < MIN_CANDLES_FOR_INDICATORS:
                 if (
@@ -168,6 +181,7 @@ class DataFetcher:
             price = float(ticker.get("last", 0))
             if price > 0:
                 self._price_cache[pair] = price
+                self._price_ts[pair] = time.monotonic()
                 return price
             return self._price_cache.get(pair)
         except Exception as e:
@@ -178,13 +192,33 @@ class DataFetcher:
             )
             return self._price_cache.get(pair)
 
+    def get_ticker(self, pair: str) -> dict | None:
+        """티커 조회 (24h 변동률 등)"""
+        try:
+            self._rate_limit()
+            return self.exchange.fetch_ticker(pair)
+        except Exception as e:
+            self._log_throttled(
+                f"{pair}:ticker_error",
+                f"[DataFetcher] {pair} 티커 조회 실패: {e!r}",
+                level="warning",
+            )
+            return None
+
     def get_current_prices(self, pairs: list[str]) -> dict[str, float]:
-        """여러 페어 현재가 조회"""
+        """여러 페어 현재가 조회 (PRICE_CACHE_TTL 이내 조회분은 재사용)"""
         pairs = [p for p in pairs if isinstance(p, str) and p]
         if not pairs:
             return {}
 
         result: dict[str, float] = {}
+        now = time.monotonic()
+        for pair in pairs:
+            if now - self._price_ts.get(pair, float("-inf")) < PRICE_CACHE_TTL:
+                result[pair] = self._price_cache[pair]
+        pairs = [p for p in pairs if p not in result]
+        if not pairs:
+            return result
 
         # ccxt fetch_tickers 사용 (배치 조회)
         try:
@@ -196,6 +230,7 @@ class DataFetcher:
                 if price is not None and float(price) > 0:
                     result[pair] = float(price)
                     self._price_cache[pair] = float(price)
+                    self._price_ts[pair] = now
         except Exception as e:
             self._log_throttled(
                 "batch_ticker_error",
@@ -226,6 +261,34 @@ class DataFetcher:
 
     # ── 잔고 조회 ──
 
+    def fetch_balance_raw(
+        self, market_type: str = "swap", max_age: float = BALANCE_CACHE_TTL
+    ) -> dict:
+        """fetch_balance 원본 응답 (max_age초 이내 조회분은 재사용)
+
+        동시 호출은 잠금으로 직렬화되어 REST 요청 1회를 공유한다.
+        """
+        with self._balance_lock:
+            cached = self._balance_cache.get(market_type)
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+
+            self._rate_limit()
+            params = {}
+            if market_type == "swap":
+                params["type"] = "swap"
+            elif market_type == "spot":
+                params["type"] = "spot"
+
+            raw_balance = self.exchange.fetch_balance(params)
+            self._balance_cache[market_type] = (time.monotonic(), raw_balance)
+            return raw_balance
+
+    def invalidate_balance(self) -> None:
+        """잔고 캐시 무효화 (주문 체결 직후 호출)"""
+        with self._balance_lock:
+            self._balance_cache.clear()
+
     def get_balance(self, market_type: str = "swap") -> dict:
         """
         계좌 잔고 조회
@@ -241,14 +304,7 @@ class DataFetcher:
             }
         """
         try:
-            self._rate_limit()
-            params = {}
-            if market_type == "swap":
-                params["type"] = "swap"
-            elif market_type == "spot":
-                params["type"] = "spot"
-
-            raw_balance = self.exchange.fetch_balance(params)
+            raw_balance = self.fetch_balance_raw(market_type)
             result = {}
             
             # API에서 직접 제공하는 Total Equity 확보
@@ -1,6 +1,8 @@
 """기술적 지표 계산 모듈"""
 from __future__ import annotations
 
+from typing import NamedTuple
+
 import pandas as pd
 try:
     import pandas_ta as ta
@@ -10,6 +12,260 @@ except ImportError:
     HAS_PANDAS_TA = False
 import numpy as np
 from loguru import logger
+try:
+    from scipy.signal import lfilter
+    HAS_SCIPY = True
+except ImportError:
+    lfilter = None
+    HAS_SCIPY = False
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과시키는 대체 구현"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+
+@njit(cache=True)
+def _ema_kernel(values: np.ndarray, span: int) -> np.ndarray:
+    """EMA 재귀 계산 (ewm(span, adjust=False)와 동일, NaN은 직전 값 유지)"""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    alpha = 2.0 / (span + 1.0)
+    prev = np.nan
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            out[i] = prev
+        elif np.isnan(prev):
+            prev = x
+            out[i] = x
+        else:
+            prev = alpha * x + (1.0 - alpha) * prev
+            out[i] = prev
+    return out
+
+
+# _calculate_all_numba 출력 행렬의 열 순서
+_FUSED_COLUMNS = (
+    "ema_fast", "ema_slow", "rsi", "bb_upper", "bb_mid", "bb_lower", "atr", "vwap", "vol_ma",
+)
+
+
+@njit(cache=True)
+def _calculate_all_numba(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    day_ids: np.ndarray,
+    ema_fast: int,
+    ema_slow: int,
+    rsi_period: int,
+    bb_period: int,
+    bb_std: float,
+    vol_window: int,
+    out: np.ndarray,
+) -> None:
+    """EMA·RSI·볼린저·ATR·VWAP·거래량 평균을 한 번의 순회로 계산해 out(n, 9)에 기록
+
+    열 순서는 _FUSED_COLUMNS와 같고, 각 값은 개별 calc_* 결과와 동일하다.
+    """
+    n = close.shape[0]
+    a_fast = 2.0 / (ema_fast + 1.0)
+    a_slow = 2.0 / (ema_slow + 1.0)
+    a_rsi = 1.0 / rsi_period
+    base = close[0] if n > 0 else 0.0
+
+    ef = np.nan
+    es = np.nan
+    gain_sum = 0.0
+    loss_sum = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    bb_sum = 0.0
+    bb_sq = 0.0
+    tr_sum = 0.0
+    cum_tp_vol = 0.0
+    cum_vol = 0.0
+    vol_sum = 0.0
+    prev_tr = np.empty(rsi_period, dtype=np.float64)
+
+    for i in range(n):
+        c = close[i]
+        h = high[i]
+        lo = low[i]
+        v = volume[i]
+
+        # EMA (NaN은 직전 값 유지)
+        if not np.isnan(c):
+            ef = c if np.isnan(ef) else a_fast * c + (1.0 - a_fast) * ef
+            es = c if np.isnan(es) else a_slow * c + (1.0 - a_slow) * es
+        out[i, 0] = ef
+        out[i, 1] = es
+
+        # RSI (Wilder, 첫 period개 변화량 평균으로 시작)
+        out[i, 2] = np.nan
+        if i > 0:
+            d = c - close[i - 1]
+            g = d if d > 0.0 else 0.0
+            l_ = -d if d < 0.0 else 0.0
+            if i <= rsi_period:
+                gain_sum += g
+                loss_sum += l_
+                if i == rsi_period:
+                    avg_gain = gain_sum / rsi_period
+                    avg_loss = loss_sum / rsi_period
+            else:
+                avg_gain = (1.0 - a_rsi) * avg_gain + a_rsi * g
+                avg_loss = (1.0 - a_rsi) * avg_loss + a_rsi * l_
+            if i >= rsi_period:
+                if avg_loss == 0.0:
+                    out[i, 2] = np.nan if avg_gain == 0.0 else 100.0
+                else:
+                    out[i, 2] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # 볼린저 밴드 (첫 종가 기준 이동 합/제곱합, 표본 표준편차)
+        x = c - base
+        bb_sum += x
+        bb_sq += x * x
+        if i >= bb_period:
+            xo = close[i - bb_period] - base
+            bb_sum -= xo
+            bb_sq -= xo * xo
+        if i >= bb_period - 1 and bb_period > 1:
+            mean = bb_sum / bb_period
+            var = (bb_sq - bb_sum * mean) / (bb_period - 1)
+            band = bb_std * np.sqrt(var if var > 0.0 else 0.0)
+            mid = mean + base
+            out[i, 3] = mid + band
+            out[i, 4] = mid
+            out[i, 5] = mid - band
+        else:
+            out[i, 3] = np.nan
+            out[i, 4] = np.nan
+            out[i, 5] = np.nan
+
+        # ATR (True Range 단순 이동 평균)
+        tr = h - lo
+        if i > 0:
+            pc = close[i - 1]
+            hc = abs(h - pc)
+            lc = abs(lo - pc)
+            if hc > tr:
+                tr = hc
+            if lc > tr:
+                tr = lc
+        slot = i % rsi_period
+        if i >= rsi_period:
+            tr_sum -= prev_tr[slot]
+        prev_tr[slot] = tr
+        tr_sum += tr
+        out[i, 6] = tr_sum / rsi_period if i >= rsi_period - 1 else np.nan
+
+        # VWAP (일자 경계마다 초기화)
+        if i > 0 and day_ids[i] != day_ids[i - 1]:
+            cum_tp_vol = 0.0
+            cum_vol = 0.0
+        cum_tp_vol += (h + lo + c) / 3.0 * v
+        cum_vol += v
+        out[i, 7] = cum_tp_vol / cum_vol if cum_vol != 0.0 else np.nan
+
+        # 거래량 이동 평균
+        vol_sum += v
+        if i >= vol_window:
+            vol_sum -= volume[i - vol_window]
+        out[i, 8] = vol_sum / vol_window if i >= vol_window - 1 else np.nan
+
+
+@njit(parallel=True, cache=True)
+def _calculate_all_batch_numba(
+    ohlcv: np.ndarray,
+    day_ids: np.ndarray,
+    ema_fast: int,
+    ema_slow: int,
+    rsi_period: int,
+    bb_period: int,
+    bb_std: float,
+    vol_window: int,
+    out: np.ndarray,
+) -> None:
+    """페어별 단일 패스 커널을 스레드 병렬 실행
+
+    ohlcv는 (페어, 4[high/low/close/volume], 봉), out은 (페어, 봉, 9).
+    """
+    for p in prange(ohlcv.shape[0]):
+        _calculate_all_numba(
+            ohlcv[p, 0], ohlcv[p, 1], ohlcv[p, 2], ohlcv[p, 3], day_ids[p],
+            ema_fast, ema_slow, rsi_period, bb_period, bb_std, vol_window, out[p],
+        )
+
+
+def _day_ids(df: pd.DataFrame) -> np.ndarray:
+    """VWAP 일자 초기화용 일자 키 (DatetimeIndex가 아니면 전체가 한 구간)"""
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df.index.normalize().asi8
+    return np.zeros(len(df), dtype=np.int64)
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """EMA (ewm(span, adjust=False)와 동일) — SciPy가 있으면 lfilter, 없거나 NaN이 있으면 JIT 커널"""
+    if HAS_SCIPY and values.shape[0] > 0 and not np.isnan(values).any():
+        alpha = 2.0 / (span + 1.0)
+        return lfilter([alpha], [1.0, -(1.0 - alpha)], values, zi=[(1.0 - alpha) * values[0]])[0]
+    return _ema_kernel(values, span)
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """단순 이동 평균 (rolling(window).mean()과 동일, 앞 window-1개는 NaN)"""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if n >= window:
+        cs = np.concatenate(([0.0], np.cumsum(x)))
+        out[window - 1:] = (cs[window:] - cs[:-window]) / window
+    return out
+
+
+def _wilder_smooth(x: np.ndarray, period: int, seed: float) -> np.ndarray:
+    """Wilder 평활 y[i] = (1-α)·y[i-1] + α·x[i] (α = 1/period, y[-1] = seed)"""
+    alpha = 1.0 / period
+    if HAS_SCIPY:
+        return lfilter([alpha], [1.0, -(1.0 - alpha)], x, zi=[(1.0 - alpha) * seed])[0]
+    # span = 2·period - 1 이면 EMA α가 1/period와 같다 (첫 원소 = seed)
+    return _ema_kernel(np.concatenate(([seed], x)), 2 * period - 1)[1:]
+
+
+# 거래량 평균 창 길이
+_VOL_WINDOW = 20
+
+# float32로 보관하는 파생 지표 열 (OHLCV 원본 제외)
+_FLOAT32_COLUMNS = (
+    "ema_fast", "ema_slow", "rsi", "bb_upper", "bb_mid", "bb_lower", "bb_width", "bb_pctb",
+    "atr", "atr_pct", "vwap", "vol_ma", "vol_ratio",
+)
+
+# (기간, 길이) → 마지막 EMA 가중치 벡터 캐시 (캔들 수는 보통 고정)
+_ema_last_weights: dict[tuple[int, int], np.ndarray] = {}
+
+
+class BollingerBands(NamedTuple):
+    """볼린저 밴드 배열 (상단 / 중간 / 하단)"""
+    upper: np.ndarray
+    mid: np.ndarray
+    lower: np.ndarray
+
+    def as_dataframe(self, index: pd.Index | None = None) -> pd.DataFrame:
+        """bb_upper / bb_mid / bb_lower 열의 DataFrame으로 변환"""
+        return pd.DataFrame(
+            {"bb_upper": self.upper, "bb_mid": self.mid, "bb_lower": self.lower},
+            index=index,
+        )
 
 
 class Indicators:
@@ -25,36 +281,169 @@ class Indicators:
         self.vol_mult = self.cfg["volume_multiplier"]  # 1.5
         self._use_pandas_ta = HAS_PANDAS_TA
 
+    @staticmethod
+    def warmup() -> None:
+        """JIT 커널을 작은 배열로 미리 컴파일 (첫 루프 지연 방지)"""
+        dummy = np.ones(4, dtype=np.float64)
+        _ema_kernel(dummy, 3)
+        _calculate_all_numba(
+            dummy, dummy, dummy, dummy, np.zeros(4, dtype=np.int64),
+            2, 3, 2, 2, 2.0, 2, np.empty((4, len(_FUSED_COLUMNS)), dtype=np.float64),
+        )
+
+    @staticmethod
+    def calc_ema(df: pd.DataFrame, period: int) -> pd.Series:
+        """종가 EMA (ewm(span=period, adjust=False)와 동일)"""
+        close = df["close"].to_numpy(dtype=np.float64)
+        return pd.Series(_ema(close, period), index=df.index)
+
+    @staticmethod
+    def calc_ema_last(close: np.ndarray, period: int) -> float:
+        """마지막 봉의 EMA 값만 계산 (calc_ema(...).iloc[-1]과 동일)
+
+        y_t = (1-α)^(n-1)·x_0 + Σ α(1-α)^(t-k)·x_k 를 가중치 벡터 내적 1회로 계산한다.
+        """
+        x = np.asarray(close, dtype=np.float64)
+        n = x.shape[0]
+        if n == 0:
+            return np.nan
+        if np.isnan(x).any():  # NaN 구간은 직전 값 유지 규칙이 필요하므로 재귀 계산
+            return float(_ema_kernel(x, period)[-1])
+
+        w = _ema_last_weights.get((period, n))
+        if w is None:
+            alpha = 2.0 / (period + 1.0)
+            w = (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+            w[1:] *= alpha
+            _ema_last_weights[(period, n)] = w
+        return float(w @ x)
+
+    def calculate_trend(self, df: pd.DataFrame) -> pd.DataFrame:
+        """추세 판단용 최신 봉 EMA 요약 (1행 DataFrame: close, ema_fast, ema_slow, ema_bullish)
+
+        상위 타임프레임은 최신 봉의 EMA 방향만 사용하므로 전체 지표 계산을 생략한다.
+        """
+        if df is None or df.empty:
+            return df
+
+        close = df["close"].to_numpy(dtype=np.float64)
+        ema_fast = self.calc_ema_last(close, self.ema_fast)
+        ema_slow = self.calc_ema_last(close, self.ema_slow)
+        return pd.DataFrame(
+            {
+                "close": [close[-1]],
+                "ema_fast": [ema_fast],
+                "ema_slow": [ema_slow],
+                "ema_bullish": [bool(ema_fast > ema_slow)],
+            },
+            index=df.index[-1:],
+        )
+
+    def calc_rsi(self, df: pd.DataFrame, period: int | None = None) -> pd.Series:
+        """Wilder RSI (첫 period개 평균으로 시작, 이후 1/period 지수 평활)"""
+        period = period or self.rsi_period
+        close = df["close"].to_numpy(dtype=np.float64)
+        n = close.shape[0]
+        rsi = np.full(n, np.nan)
+        if n > period:
+            diffs = np.diff(close)
+            gain = np.maximum(diffs, 0.0)
+            loss = np.maximum(-diffs, 0.0)
+            seed_gain = gain[:period].mean()
+            seed_loss = loss[:period].mean()
+            avg_gain = np.concatenate(
+                ([seed_gain], _wilder_smooth(gain[period:], period, seed_gain))
+            )
+            avg_loss = np.concatenate(
+                ([seed_loss], _wilder_smooth(loss[period:], period, seed_loss))
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi[period:] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return pd.Series(rsi, index=df.index)
+
+    def calc_bollinger_arr(self, close: np.ndarray) -> BollingerBands:
+        """볼린저 밴드 배열 계산 (표본 표준편차 — rolling().std()와 동일)
+
+        누적합 2회로 모든 창의 합/제곱합을 한 번에 구한다 (첫 값 기준 이동으로 상쇄 오차 완화).
+        """
+        w = self.bb_period
+        close = np.asarray(close, dtype=np.float64)
+        n = close.shape[0]
+        mid = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        if n >= w and w > 1:
+            x = close - close[0]
+            cs = np.concatenate(([0.0], np.cumsum(x)))
+            cs2 = np.concatenate(([0.0], np.cumsum(x * x)))
+            win_sum = cs[w:] - cs[:-w]
+            win_mean = win_sum / w
+            var = ((cs2[w:] - cs2[:-w]) - win_sum * win_mean) / (w - 1)
+            mid[w - 1:] = win_mean + close[0]
+            std[w - 1:] = np.sqrt(np.maximum(var, 0.0))
+
+        band = self.bb_std * std
+        return BollingerBands(mid + band, mid, mid - band)
+
+    def calc_bollinger(self, df: pd.DataFrame) -> pd.DataFrame:
+        """볼린저 밴드 (bb_upper / bb_mid / bb_lower DataFrame)"""
+        return self.calc_bollinger_arr(df["close"].to_numpy()).as_dataframe(df.index)
+
+    def calc_volume_ratio(self, df: pd.DataFrame) -> pd.Series:
+        """거래량 / 20봉 평균 거래량"""
+        volume = df["volume"].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = volume / _rolling_mean(volume, _VOL_WINDOW)
+        return pd.Series(ratio, index=df.index)
+
+    def _calculate_fused(self, df: pd.DataFrame) -> pd.DataFrame:
+        """JIT 단일 패스로 기본 지표 계산 (OHLCV 배열은 한 번만 추출)"""
+        high, low, close, volume = np.ascontiguousarray(
+            df[["high", "low", "close", "volume"]].to_numpy(dtype=np.float64).T
+        )
+        out = np.empty((close.shape[0], len(_FUSED_COLUMNS)), dtype=np.float64)
+        _calculate_all_numba(
+            high, low, close, volume, _day_ids(df),
+            self.ema_fast, self.ema_slow, self.rsi_period,
+            self.bb_period, float(self.bb_std), _VOL_WINDOW, out,
+        )
+        for j, col in enumerate(_FUSED_COLUMNS):
+            df[col] = out[:, j]
+        return self._add_band_ratios(df)
+
     def _calculate_basic_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """pandas_ta 미사용 수동 지표 계산"""
-        df["ema_fast"] = df["close"].ewm(span=self.ema_fast, adjust=False).mean()
-        df["ema_slow"] = df["close"].ewm(span=self.ema_slow, adjust=False).mean()
-
-        # 간단한 RSI 계산
-        delta = df["close"].diff()
-        gain = delta.where(delta > 0, 0.0)
-        loss = (-delta).where(delta < 0, 0.0)
-        avg_gain = gain.rolling(window=self.rsi_period, min_periods=self.rsi_period).mean()
-        avg_loss = loss.rolling(window=self.rsi_period, min_periods=self.rsi_period).mean()
-        rs = avg_gain / avg_loss
-        df["rsi"] = 100 - (100 / (1 + rs))
-
-        # 볼린저 밴드
-        df["bb_mid"] = df["close"].rolling(window=self.bb_period).mean()
-        rolling_std = df["close"].rolling(window=self.bb_period).std()
-        df["bb_upper"] = df["bb_mid"] + (self.bb_std * rolling_std)
-        df["bb_lower"] = df["bb_mid"] - (self.bb_std * rolling_std)
+        """pandas_ta 미사용 수동 지표 계산 (numba 사용 시 단일 패스 커널)"""
+        if HAS_NUMBA:
+            return self._calculate_fused(df)
+        else:
+            df["ema_fast"] = self.calc_ema(df, self.ema_fast)
+            df["ema_slow"] = self.calc_ema(df, self.ema_slow)
+
+            df["rsi"] = self.calc_rsi(df)
+
+            # 볼린저 밴드
+            bb = self.calc_bollinger_arr(df["close"].to_numpy())
+            df["bb_upper"] = bb.upper
+            df["bb_mid"] = bb.mid
+            df["bb_lower"] = bb.lower
+
+            # ATR 계산
+            high_low = df["high"] - df["low"]
+            high_close = (df["high"] - df["close"].shift()).abs()
+            low_close = (df["low"] - df["close"].shift()).abs()
+            tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+            df["atr"] = _rolling_mean(tr.to_numpy(dtype=np.float64), self.rsi_period)
+
+            df["vwap"] = self.calc_vwap(df)
+            df["vol_ma"] = _rolling_mean(df["volume"].to_numpy(dtype=np.float64), _VOL_WINDOW)
+
+        return self._add_band_ratios(df)
+
+    @staticmethod
+    def _add_band_ratios(df: pd.DataFrame) -> pd.DataFrame:
+        """밴드폭 / %B / ATR% 파생 열 추가"""
         df["bb_width"] = (df["bb_upper"] - df["bb_lower"]) / df["bb_mid"]
         df["bb_pctb"] = (df["close"] - df["bb_lower"]) / (df["bb_upper"] - df["bb_lower"])
-
-        # ATR 계산
-        high_low = df["high"] - df["low"]
-        high_close = (df["high"] - df["close"].shift()).abs()
-        low_close = (df["low"] - df["close"].shift()).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df["atr"] = tr.rolling(window=self.rsi_period).mean()
         df["atr_pct"] = df["atr"] / df["close"]
-
         return df
 
     def calculate_all(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -90,6 +479,10 @@ class Indicators:
                     df["atr"] = ta.atr(df["high"], df["low"], df["close"], length=self.rsi_period)
                     df["atr_pct"] = df["atr"] / df["close"]
 
+                    # 5. VWAP (당일 누적) / 거래량 평균
+                    df["vwap"] = self.calc_vwap(df)
+                    df["vol_ma"] = df["volume"].rolling(window=_VOL_WINDOW).mean()
+
                 except Exception as e:
                     # pandas/pandas_ta 버전 호환성 이슈 발생 시 자동으로 수동 계산으로 고정
                     self._use_pandas_ta = False
@@ -98,24 +491,7 @@ class Indicators:
             else:
                 df = self._calculate_basic_indicators(df)
 
-            # EMA 크로스 판별
-            df["ema_cross"] = 0
-            ema_diff = df["ema_fast"] - df["ema_slow"]
-            ema_diff_prev = ema_diff.shift(1)
-            # 골든크로스: 이전 음수 → 현재 양수
-            df.loc[(ema_diff_prev <= 0) & (ema_diff > 0), "ema_cross"] = 1
-            # 데드크로스: 이전 양수 → 현재 음수
-            df.loc[(ema_diff_prev >= 0) & (ema_diff < 0), "ema_cross"] = -1
-            # EMA 상태: fast > slow → True
-            df["ema_bullish"] = df["ema_fast"] > df["ema_slow"]
-
-            # 4. VWAP (당일 누적)
-            df["vwap"] = self._calculate_vwap(df)
-
-            # 5. 거래량 분석
-            df["vol_ma"] = df["volume"].rolling(window=20).mean()
-            df["vol_ratio"] = df["volume"] / df["vol_ma"]
-            df["vol_surge"] = df["vol_ratio"] >= self.vol_mult
+            df = self._finish_indicators(df)
 
             # NaN 제거 (초반 지표 미계산 구간)
             # 주의: dropna 하지 않고, 최신 데이터만 사용하도록 설계
@@ -132,26 +508,99 @@ class Indicators:
 
         return df
 
-    def _calculate_vwap(self, df: pd.DataFrame) -> pd.Series:
-        """VWAP 계산 (당일 기준 누적)"""
+    def _finish_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """EMA 크로스 / 거래량 비율 판별 후 파생 지표를 float32로 정리"""
+        # EMA 크로스 판별: 부호가 바뀐 봉에 새 부호 기록
+        # (골든크로스 이전 ≤0 → 현재 양수 = 1, 데드크로스 이전 ≥0 → 현재 음수 = -1)
+        ema_fast = df["ema_fast"].to_numpy(dtype=np.float64)
+        ema_slow = df["ema_slow"].to_numpy(dtype=np.float64)
+        ema_diff = ema_fast - ema_slow
+        valid = ~np.isnan(ema_diff)
+        sign = np.sign(np.where(valid, ema_diff, 0.0)).astype(np.int8)
+        cross = np.zeros_like(sign)
+        changed = (sign[1:] != sign[:-1]) & valid[1:] & valid[:-1]
+        cross[1:][changed] = sign[1:][changed]
+        df["ema_cross"] = cross
+        # EMA 상태: fast > slow → True
+        df["ema_bullish"] = ema_fast > ema_slow
+
+        # 거래량 분석
+        df["vol_ratio"] = df["volume"] / df["vol_ma"]
+        df["vol_surge"] = df["vol_ratio"] >= self.vol_mult
+
+        # 파생 지표는 비교가 끝난 뒤 float32로 보관 (가격 대비 상대 오차 ~6e-8)
+        for col in _FLOAT32_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].to_numpy(dtype=np.float32)
+        return df
+
+    def calculate_all_batch(self, dfs: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """여러 페어의 지표 일괄 계산 (calculate_all과 같은 결과)
+
+        numba 사용 + 봉 수가 같은 경우 페어 단위로 병렬 커널을 돌리고, 그 외에는 페어별로 계산한다.
+        """
+        if (
+            not HAS_NUMBA
+            or self._use_pandas_ta
+            or len(dfs) < 2
+            or any(df is None or df.empty for df in dfs)
+            or len({len(df) for df in dfs}) != 1
+        ):
+            return [self.calculate_all(df) for df in dfs]
+
+        try:
+            ohlcv = np.stack([
+                df[["high", "low", "close", "volume"]].to_numpy(dtype=np.float64).T
+                for df in dfs
+            ])
+            day_ids = np.stack([_day_ids(df) for df in dfs])
+            out = np.empty((len(dfs), ohlcv.shape[2], len(_FUSED_COLUMNS)), dtype=np.float64)
+            _calculate_all_batch_numba(
+                ohlcv, day_ids,
+                self.ema_fast, self.ema_slow, self.rsi_period,
+                self.bb_period, float(self.bb_std), _VOL_WINDOW, out,
+            )
+
+            results = []
+            for df, values in zip(dfs, out):
+                df = df.copy()
+                for j, col in enumerate(_FUSED_COLUMNS):
+                    df[col] = values[:, j]
+                results.append(self._finish_indicators(self._add_band_ratios(df)))
+            return results
+        except Exception as e:
+            logger.error(f"[Indicators] 일괄 지표 계산 오류: {e}")
+            return [self.calculate_all(df) for df in dfs]
+
+    @staticmethod
+    def calc_vwap(df: pd.DataFrame) -> pd.Series:
+        """VWAP 계산 (당일 기준 누적, DatetimeIndex가 아니면 전체 누적)
+
+        누적합 1회 후 각 일자 시작 직전의 누적값을 빼서 일자별 초기화를 처리한다.
+        """
         try:
-            typical_price = (df["high"] + df["low"] + df["close"]) / 3
-            
+            high = df["high"].to_numpy(dtype=np.float64)
+            low = df["low"].to_numpy(dtype=np.float64)
+            close = df["close"].to_numpy(dtype=np.float64)
+            volume = df["volume"].to_numpy(dtype=np.float64)
+            n = close.shape[0]
+
+            num = np.concatenate(([0.0], np.cumsum((high + low + close) / 3.0 * volume)))
+            den = np.concatenate(([0.0], np.cumsum(volume)))
+
             # Reset VWAP daily if we have datetime index
-            if isinstance(df.index, pd.DatetimeIndex):
-                dates = df.index.date
-                vwap = pd.Series(np.nan, index=df.index, dtype=float)
-                for date in pd.unique(dates):
-                    mask = dates == date
-                    tp_vol = (typical_price[mask] * df["volume"][mask]).cumsum()
-                    vol_cum = df["volume"][mask].cumsum()
-                    vwap[mask] = tp_vol / vol_cum.replace(0, np.nan)
+            if isinstance(df.index, pd.DatetimeIndex) and n > 0:
+                day_ids = df.index.normalize().asi8
+                starts = np.flatnonzero(np.concatenate(([True], day_ids[1:] != day_ids[:-1])))
+                seg_start = np.repeat(starts, np.diff(np.append(starts, n)))
             else:
-                cum_vol = df["volume"].cumsum()
-                cum_tp_vol = (typical_price * df["volume"]).cumsum()
-                vwap = cum_tp_vol / cum_vol
-                vwap = vwap.replace([np.inf, -np.inf], np.nan)
-            return vwap
+                seg_start = np.zeros(n, dtype=np.int64)
+
+            cum_tp_vol = num[1:] - num[seg_start]
+            cum_vol = den[1:] - den[seg_start]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                vwap = np.where(cum_vol != 0.0, cum_tp_vol / cum_vol, np.nan)
+            return pd.Series(vwap, index=df.index)
         except Exception as e:
             logger.error(f"[Indicators] VWAP 계산 오류: {e}")
             return pd.Series(np.nan, index=df.index)
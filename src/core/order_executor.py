@@ -9,6 +9,7 @@ from pathlib import Path
 from loguru import logger
 from src.utils.constants import (
     TradeMode,
+    TRADE_MODES,
     PositionSide,
     MarketType,
     OKX_MIN_ORDER_USDT,
@@ -16,15 +17,25 @@ from src.utils.constants import (
 )
 from src.utils.helpers import create_okx_exchange, now_kst, generate_trade_id
 
+# PAPER 주문 결과의 방향별 고정 필드
+_PAPER_OPEN_FIELDS = {
+    "long": {"side": "buy", "position_side": "long", "mode": "paper"},
+    "short": {"side": "sell", "position_side": "short", "mode": "paper"},
+}
+_PAPER_CLOSE_FIELDS = {
+    "long": {"side": "sell", "position_side": "long", "mode": "paper"},
+    "short": {"side": "buy", "position_side": "short", "mode": "paper"},
+}
 
 class OrderExecutor:
     """OKX 현물+선물 주문 실행기 (ccxt)"""
 
     def __init__(self, config: dict, exchange: ccxt.okx | None = None):
-        self.mode = TradeMode(config["trading"]["mode"])
+        self.mode = TRADE_MODES[config["trading"]["mode"]]
         self.fee_rate = config["risk"]["fee_rate"]
         self.market_type = config["trading"].get("market_type", "swap")  # spot / swap
         self.leverage = int(config["trading"].get("leverage", 1))
+        self._margin_divisor = self.leverage if self.leverage > 0 else 1  # 증거금 = 노셔널 / 레버리지
         self.margin_mode = config["trading"].get("margin_mode", "isolated")
 
         if self.mode in (TradeMode.LIVE, TradeMode.DEMO):
@@ -266,7 +277,7 @@ class OrderExecutor:
                 "price": filled_price,
                 "quantity": filled_qty,
                 "amount_usdt": cost,
-                "initial_margin": cost / self.leverage if self.leverage > 0 else cost,
+                "initial_margin": cost / self._margin_divisor,
                 "fee_usdt": fee,
                 "timestamp": now_kst().isoformat(),
                 "mode": self.mode.value,
@@ -312,7 +323,7 @@ class OrderExecutor:
                 "price": filled_price,
                 "quantity": filled_qty,
                 "amount_usdt": cost,
-                "initial_margin": cost / self.leverage if self.leverage > 0 else cost,
+                "initial_margin": cost / self._margin_divisor,
                 "fee_usdt": fee,
                 "timestamp": now_kst().isoformat(),
                 "mode": self.mode.value,
@@ -378,7 +389,7 @@ class OrderExecutor:
         """PAPER 롱 진입"""
         try:
             # 잔고 체크 시 사용 증거금을 기준으로 확인합니다.
-            margin = amount_usdt / self.leverage if self.leverage > 0 else amount_usdt
+            margin = amount_usdt / self._margin_divisor
 
             price = self._safe_get_current_price(pair)
             if price is None:
@@ -408,17 +419,15 @@ class OrderExecutor:
             )
 
             return {
+                **_PAPER_OPEN_FIELDS["long"],
                 "trade_id": trade_id,
                 "pair": pair,
-                "side": "buy",
-                "position_side": "long",
                 "price": price,
                 "quantity": quantity,
                 "amount_usdt": amount_usdt,
                 "initial_margin": margin,
                 "fee_usdt": fee,
                 "timestamp": now_kst().isoformat(),
-                "mode": "paper",
             }
         except Exception as e:
             logger.error(f"[OrderExecutor] PAPER 롱 진입 오류: {e}")
@@ -429,7 +438,7 @@ class OrderExecutor:
     ) -> dict | None:
         """PAPER 숏 진입"""
         try:
-            margin = amount_usdt / self.leverage if self.leverage > 0 else amount_usdt
+            margin = amount_usdt / self._margin_divisor
 
             price = self._safe_get_current_price(pair)
             if price is None:
@@ -461,17 +470,15 @@ class OrderExecutor:
             )
 
             return {
+                **_PAPER_OPEN_FIELDS["short"],
                 "trade_id": trade_id,
                 "pair": pair,
-                "side": "sell",
-                "position_side": "short",
                 "price": price,
                 "quantity": quantity,
                 "amount_usdt": amount_usdt,
                 "initial_margin": margin,
                 "fee_usdt": fee,
                 "timestamp": now_kst().isoformat(),
-                "mode": "paper",
             }
         except Exception as e:
             logger.error(f"[OrderExecutor] PAPER 숏 진입 오류: {e}")
@@ -482,6 +489,7 @@ class OrderExecutor:
     ) -> dict | None:
         """PAPER 포지션 청산"""
         try:
+            fixed_fields = _PAPER_CLOSE_FIELDS[position_side]  # 잘못된 방향은 상태 변경 전에 실패
             price = self._safe_get_current_price(pair)
             if price is None:
                 return None
@@ -514,16 +522,14 @@ class OrderExecutor:
             )
 
             return {
+                **fixed_fields,
                 "trade_id": trade_id,
                 "pair": pair,
-                "side": "sell" if position_side == "long" else "buy",
-                "position_side": position_side,
                 "price": price,
                 "quantity": quantity,
                 "amount_usdt": amount_usdt,
                 "fee_usdt": fee,
                 "timestamp": now_kst().isoformat(),
-                "mode": "paper",
             }
         except Exception as e:
             logger.error(f"[OrderExecutor] PAPER 포지션 청산 오류: {e}")
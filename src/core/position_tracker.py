@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import json
+import time
+from datetime import datetime
 from pathlib import Path
+import numpy as np
 from loguru import logger
-from src.utils.helpers import now_kst, format_usdt
+from src.utils.helpers import log_enabled, now_kst, format_usdt
+from src.utils.constants import (
+    EXIT_SL_FIXED_PCT,
+    EXIT_SL_CAP_PCT,
+    EXIT_TP1_PCT,
+    EXIT_TP2_PCT,
+    EXIT_TP3_PCT,
+)
 
 
 class PositionTracker:
@@ -14,7 +24,10 @@ class PositionTracker:
     def __init__(self):
         # pair → position dict
         self._positions: dict[str, dict] = {}
+        # 포트폴리오 계산용 SoA 배열 (포지션 변경 시 무효화, 조회 시 재구성)
+        self._arrays: dict | None = None
         self._state_path = Path("data/open_positions.json")
+        self._log_info_enabled = log_enabled("INFO")
         self._load_positions()
 
     @staticmethod
@@ -26,6 +39,25 @@ class PositionTracker:
             return f"{price:,.4f}"
         return f"{price:.6f}"
 
+    @staticmethod
+    def calc_exit_levels(entry_price: float, position_side: str = "long") -> dict:
+        """진입가 기준 TP/SL 가격 테이블 (포지션 오픈 시 1회 계산)"""
+        if position_side == "long":
+            return {
+                "tp1_price": entry_price * (1 + EXIT_TP1_PCT),
+                "tp2_price": entry_price * (1 + EXIT_TP2_PCT),
+                "tp3_price": entry_price * (1 + EXIT_TP3_PCT),
+                "sl_fixed_price": entry_price * (1 - EXIT_SL_FIXED_PCT),
+                "sl_cap_price": entry_price * (1 - EXIT_SL_CAP_PCT),
+            }
+        return {
+            "tp1_price": entry_price * (1 - EXIT_TP1_PCT),
+            "tp2_price": entry_price * (1 - EXIT_TP2_PCT),
+            "tp3_price": entry_price * (1 - EXIT_TP3_PCT),
+            "sl_fixed_price": entry_price * (1 + EXIT_SL_FIXED_PCT),
+            "sl_cap_price": entry_price * (1 + EXIT_SL_CAP_PCT),
+        }
+
     def open_position(
         self,
         pair: str,
@@ -37,8 +69,9 @@ class PositionTracker:
         initial_margin: float,
         position_side: str = "long",
         market_type: str = "swap",
+        entry_time_ts: float | None = None,
     ):
-        """신규 포지션 등록"""
+        """신규 포지션 등록 (entry_time_ts: 보유시간 계산용 epoch 초)"""
         now = now_kst().isoformat()
         self._positions[pair] = {
             "trade_id": trade_id,
@@ -52,26 +85,30 @@ class PositionTracker:
             "position_side": position_side,  # "long" / "short"
             "market_type": market_type,      # "spot" / "swap"
             "entry_time": now,
+            "entry_time_ts": time.time() if entry_time_ts is None else entry_time_ts,
             "peak_price": entry_price,       # 트레일링 스탑용 고점/저점
             "tp_stage_hit": 0,               # 0: None, 1: TP1 hit, 2: TP2 hit
             "trailing_active": False,        # TP1 이후 활성화
+            **self.calc_exit_levels(entry_price, position_side),
         }
+        self._arrays = None
         self._save_positions()
 
-        side_emoji = "📥" if position_side == "long" else "📤"
-        side_label = "LONG" if position_side == "long" else "SHORT"
-        logger.info(
-            f"[Position] {side_emoji} {side_label} 오픈 | {pair} | "
-            f"Entry: {self._format_price(entry_price)} | Qty: {quantity:.6f} | "
-            f"Margin: {initial_margin:.2f} USDT | "
-            f"TP: {self._format_price(take_profit)} | "
-            f"SL: {self._format_price(stop_loss)}"
-        )
+        if self._log_info_enabled:
+            fmt = self._format_price
+            is_long = position_side == "long"
+            logger.info(
+                f"[Position] {'📥 LONG' if is_long else '📤 SHORT'} 오픈 | {pair} | "
+                f"Entry: {fmt(entry_price)} | Qty: {quantity:.6f} | "
+                f"Margin: {initial_margin:.2f} USDT | "
+                f"TP: {fmt(take_profit)} | SL: {fmt(stop_loss)}"
+            )
 
     def update_position(self, pair: str, updates: dict) -> bool:
         """포지션 정보 업데이트 (부분 청산 등)"""
         if pair in self._positions:
             self._positions[pair].update(updates)
+            self._arrays = None
             self._save_positions()
             return True
         return False
@@ -80,9 +117,11 @@ class PositionTracker:
         """포지션 청산 (반환 후 삭제)"""
         position = self._positions.pop(pair, None)
         if position:
+            self._arrays = None
             self._save_positions()
-            side_label = position.get("position_side", "long").upper()
-            logger.info(f"[Position] 🏁 {side_label} 종료 | {pair}")
+            if self._log_info_enabled:
+                side_label = position.get("position_side", "long").upper()
+                logger.info(f"[Position] 🏁 {side_label} 종료 | {pair}")
         return position
 
     def get_position(self, pair: str) -> dict | None:
@@ -124,6 +163,29 @@ class PositionTracker:
             "hold_time": pos["entry_time"],
         }
 
+    def portfolio_arrays(self) -> dict:
+        """전체 포지션을 열 단위 배열로 반환 (pairs 순서와 인덱스 일치)
+
+        sign: 롱 +1 / 숏 -1 → 미실현 손익 = sign * (price - entry) * qty
+        """
+        if self._arrays is None:
+            items = list(self._positions.items())
+            positions = [p for _, p in items]
+            self._arrays = {
+                "pairs": tuple(pair for pair, _ in items),
+                "sides": tuple(p.get("position_side", "long") for p in positions),
+                "entry": np.array([p["entry_price"] for p in positions], dtype=np.float64),
+                "qty": np.array([p["quantity"] for p in positions], dtype=np.float64),
+                "sign": np.array(
+                    [1.0 if p.get("position_side", "long") == "long" else -1.0 for p in positions],
+                    dtype=np.float64,
+                ),
+                "margin": np.array(
+                    [p.get("initial_margin", 0.0) for p in positions], dtype=np.float64
+                ),
+            }
+        return self._arrays
+
     def count(self) -> int:
         return len(self._positions)
 
@@ -159,10 +221,21 @@ class PositionTracker:
                         "tp_stage_hit": int(pos.get("tp_stage_hit", 0)),
                         "trailing_active": bool(pos.get("trailing_active", False)),
                     }
+                    pos_restored = restored[str(pair)]
+                    pos_restored["entry_time_ts"] = self._restore_entry_ts(
+                        pos.get("entry_time_ts"), pos_restored["entry_time"]
+                    )
+                    pos_restored.update(
+                        self.calc_exit_levels(
+                            pos_restored["entry_price"],
+                            pos_restored["position_side"],
+                        )
+                    )
                 except (TypeError, ValueError):
                     continue
 
             self._positions = restored
+            self._arrays = None
             if restored:
                 logger.info(
                     f"[Position] 🔁 오픈 포지션 복구 완료: {len(restored)}개"
@@ -170,6 +243,16 @@ class PositionTracker:
         except Exception as e:
             logger.warning(f"[Position] 포지션 복구 실패: {e}")
 
+    @staticmethod
+    def _restore_entry_ts(entry_time_ts, entry_time: str) -> float:
+        """저장된 epoch 사용, 없으면(구버전 파일) entry_time 문자열에서 1회 변환"""
+        if entry_time_ts is not None:
+            return float(entry_time_ts)
+        try:
+            return datetime.fromisoformat(entry_time).timestamp()
+        except ValueError:
+            return time.time()
+
     def _save_positions(self) -> None:
         """오픈 포지션 저장"""
         try:
@@ -1,8 +1,13 @@
 """리스크 관리 모듈 (OKX)"""
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
 from loguru import logger
-from src.utils.helpers import now_kst
+from src.utils.helpers import KST, log_enabled, now_kst
 from src.utils.constants import OKX_MIN_ORDER_USDT
 
 
@@ -17,8 +22,11 @@ class RiskManager:
         # 일일 카운터 (매일 리셋)
         self.daily_trades = 0
         self.daily_pnl_usdt = 0.0
+        self.daily_wins = 0
+        self.daily_losses = 0
         self.consecutive_losses = 0
         self.daily_date = now_kst().date()
+        self._next_reset_ts = self._midnight_after(self.daily_date)
         self.is_stopped = False
         self.stop_reason = ""
 
@@ -31,16 +39,39 @@ class RiskManager:
         self.max_consec_losses = self.cfg["max_consecutive_losses"]
         self.fee_rate = self.cfg["fee_rate"]
 
+        # 급락 감지 (최근 N봉 고점 대비 현재가 하락률)
+        self.emergency_drop_pct = self.cfg.get("emergency_drop_pct", 0.03)
+        self._emergency_window = int(self.cfg.get("emergency_window", 5))
+
         # 레버리지
         self.leverage = int(config["trading"].get("leverage", 1))
 
+        # 포지션 사이징 한도 (진입마다 설정을 다시 읽지 않음)
+        self._max_margin_pct = self.cfg.get("max_total_margin_pct", 0.20)
+        self._min_avail_pct = self.cfg.get("min_available_balance_pct", 0.50)
+        self._base_margin_pct = self.cfg.get("margin_per_ticker_pct", 0.03)
+        self._target_atr_pct = self.cfg.get("target_atr_pct", 0.003)
+        self._max_per_ticker_pct = self.cfg.get("max_per_ticker_pct", 0.04)
+
+        self._log_info_enabled = log_enabled("INFO")
+
+    @staticmethod
+    def _midnight_after(day) -> float:
+        """해당 날짜 다음 KST 자정의 epoch 초"""
+        return datetime.combine(day + timedelta(days=1), datetime.min.time(), KST).timestamp()
+
     def _check_daily_reset(self):
-        """날짜 변경 시 일일 카운터 리셋"""
+        """날짜 변경 시 일일 카운터 리셋 (다음 자정 전에는 시각 비교 1회)"""
+        if time.time() < self._next_reset_ts:
+            return
         today = now_kst().date()
+        self._next_reset_ts = self._midnight_after(today)
         if today != self.daily_date:
             logger.info(f"[RiskMgr] 📅 일일 리셋: {self.daily_date} → {today}")
             self.daily_trades = 0
             self.daily_pnl_usdt = 0.0
+            self.daily_wins = 0
+            self.daily_losses = 0
             self.consecutive_losses = 0
             self.daily_date = today
             self.is_stopped = False
@@ -71,6 +102,25 @@ class RiskManager:
 
         return True
 
+    def check_emergency(self, df: pd.DataFrame) -> bool:
+        """최근 N봉 고점 대비 급락 시 매매 중단 (True = 이번 호출에서 새로 중단됨)
+
+        봉 수가 창 길이보다 적으면 판단하지 않는다.
+        """
+        if self.is_stopped or df is None or len(df) < self._emergency_window:
+            return False
+
+        tail = df["close"].to_numpy(dtype=np.float64)[-self._emergency_window:]
+        peak = tail.max()
+        if not peak > 0:
+            return False
+
+        drop = 1.0 - tail[-1] / peak
+        if drop >= self.emergency_drop_pct:
+            self._stop(f"급락 감지 ({drop * 100:.2f}% / 최근 {tail.shape[0]}봉)")
+            return True
+        return False
+
     def calculate_position_size(
         self,
         pair: str,
@@ -94,8 +144,8 @@ class RiskManager:
           - 숏 포지션 동일 적용
         """
         # 0. 안전장치 체크
-        max_margin_pct = self.cfg.get("max_total_margin_pct", 0.20)
-        min_avail_pct = self.cfg.get("min_available_balance_pct", 0.50)
+        max_margin_pct = self._max_margin_pct
+        min_avail_pct = self._min_avail_pct
 
         if total_used_margin > total_equity * max_margin_pct:
             logger.warning(
@@ -112,9 +162,9 @@ class RiskManager:
             return None
 
         # 1. 마진 비율 결정
-        base_pct = self.cfg.get("margin_per_ticker_pct", 0.03)
-        target_atr = self.cfg.get("target_atr_pct", 0.003)
-        max_per_ticker_pct = self.cfg.get("max_per_ticker_pct", 0.04)
+        base_pct = self._base_margin_pct
+        target_atr = self._target_atr_pct
+        max_per_ticker_pct = self._max_per_ticker_pct
 
         margin_pct = base_pct
         if current_atr_pct and current_atr_pct > 0:
@@ -139,12 +189,13 @@ class RiskManager:
         risk_amount = notional_usdt * price_risk
 
         # 3. 상세 로그 기록
-        logger.info(
-            f"[RiskMgr] 📥 포지션 사이징: {pair}\n"
-            f"   - 총자산: {total_equity:,.2f} USDT | 가용잔고: {available_balance:,.2f} USDT\n"
-            f"   - 투입마진: {margin_usdt:,.2f} USDT ({margin_pct*100:.2f}%) | 레버리지: {self.leverage}x\n"
-            f"   - 노셔널: {notional_usdt:,.2f} USDT | 사용마진합계: {total_used_margin:,.2f} USDT"
-        )
+        if self._log_info_enabled:
+            logger.info("\n".join((
+                f"[RiskMgr] 📥 포지션 사이징: {pair}",
+                f"   - 총자산: {total_equity:,.2f} USDT | 가용잔고: {available_balance:,.2f} USDT",
+                f"   - 투입마진: {margin_usdt:,.2f} USDT ({margin_pct*100:.2f}%) | 레버리지: {self.leverage}x",
+                f"   - 노셔널: {notional_usdt:,.2f} USDT | 사용마진합계: {total_used_margin:,.2f} USDT",
+            )))
 
         return {
             "order_amount_usdt": notional_usdt,
@@ -172,18 +223,31 @@ class RiskManager:
         self.daily_pnl_usdt += pnl_usdt
 
         if is_win:
+            self.daily_wins += 1
             self.consecutive_losses = 0
         else:
+            self.daily_losses += 1
             self.consecutive_losses += 1
 
         self.current_balance += pnl_usdt
 
-        logger.info(
-            f"[RiskMgr] 거래 #{self.daily_trades} 기록 | "
-            f"PnL: {pnl_usdt:+,.2f} USDT | "
-            f"일일 PnL: {self.daily_pnl_usdt:+,.2f} USDT | "
-            f"연속 손실: {self.consecutive_losses}"
-        )
+        if self._log_info_enabled:
+            logger.info(
+                f"[RiskMgr] 거래 #{self.daily_trades} 기록 | "
+                f"PnL: {pnl_usdt:+,.2f} USDT | "
+                f"일일 PnL: {self.daily_pnl_usdt:+,.2f} USDT | "
+                f"연속 손실: {self.consecutive_losses}"
+            )
+
+    def get_daily_summary(self) -> dict:
+        """당일 거래 집계 (기록 시점에 갱신된 카운터 스냅샷)"""
+        self._check_daily_reset()
+        return {
+            "total_trades": self.daily_trades,
+            "wins": self.daily_wins,
+            "losses": self.daily_losses,
+            "daily_pnl_usdt": self.daily_pnl_usdt,
+        }
 
     def calculate_fees(self, amount_usdt: float) -> float:
         """수수료 계산 (편도)"""
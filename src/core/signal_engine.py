@@ -3,8 +3,31 @@ from __future__ import annotations
 
 import pandas as pd
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from loguru import logger
-from src.utils.helpers import now_kst
+from src.core.position_tracker import PositionTracker
+from src.utils.helpers import log_enabled, now_kst
+
+
+# 진입 조건별 점수 가중치 (롱/숏 각각 합계 100)
+_SIGNAL_WEIGHTS = MappingProxyType({
+    # 롱
+    "ema_bullish": 25,
+    "rsi_in_range": 15,
+    "above_bb_mid": 15,
+    "volume_surge": 20,
+    "above_vwap": 10,
+    "trend_bullish": 15,
+    # 숏
+    "ema_bearish": 25,
+    "rsi_overbought": 15,
+    "below_bb_mid": 15,
+    "below_vwap": 10,
+    "trend_bearish": 15,
+})
+
+# 설정에 없는 페어의 기본 익절 비율
+_DEFAULT_TP_PCT = 0.01
 
 
 @dataclass
@@ -31,6 +54,29 @@ class SignalEngine:
         self.cfg_ind = config["indicators"]
         self.cfg_risk = config["risk"]
         self._last_signal_time: dict[str, str] = {}  # 중복 방지
+        self._log_info_enabled = log_enabled("INFO")
+
+        # 진입 판정 기준 (신호마다 설정을 다시 읽지 않음)
+        self._require_all_conditions = bool(
+            self.cfg_trading.get("buy_require_all_conditions", True)
+        )
+        min_conditions = self.cfg_trading.get("buy_min_conditions")
+        self._min_conditions = int(min_conditions) if min_conditions is not None else None
+        self._min_score = float(self.cfg_trading.get("buy_min_score", 70))
+
+        # 페어·방향별 (익절 배수, 손절 배수) 테이블 — 신호마다 설정을 다시 읽지 않음
+        sl_pct = self.cfg_risk["stop_loss_pct"]
+        self._targets: dict[str, dict[str, tuple[float, float]]] = {
+            "long": {},
+            "short": {},
+        }
+        for pair, tp_pct in self.cfg_risk.get("take_profit_pct", {}).items():
+            self._targets["long"][pair] = (1 + tp_pct, 1 - sl_pct)
+            self._targets["short"][pair] = (1 - tp_pct, 1 + sl_pct)
+        self._targets_default = {
+            "long": (1 + _DEFAULT_TP_PCT, 1 - sl_pct),
+            "short": (1 - _DEFAULT_TP_PCT, 1 + sl_pct),
+        }
 
     # ═══════════════════════════════════════════
     #  롱 신호 (= 기존 매수 신호)
@@ -85,49 +131,25 @@ class SignalEngine:
         conditions["trend_bullish"] = bool(trend_latest.get("ema_bullish", False))
 
         # 점수 계산 (가중치)
-        weights = {
-            "ema_bullish": 25,
-            "rsi_in_range": 15,
-            "above_bb_mid": 15,
-            "volume_surge": 20,
-            "above_vwap": 10,
-            "trend_bullish": 15,
-        }
-        score = sum(weights[k] for k, v in conditions.items() if v)
+        score = self.calc_signal_score(conditions)
 
         # 중복 신호 방지
         candle_time = str(df_main.index[-1])
         long_key = f"{pair}_long"
         last_time = self._last_signal_time.get(long_key, "")
 
-        require_all_conditions = bool(
-            self.cfg_trading.get("buy_require_all_conditions", True)
-        )
-        min_conditions = int(
-            self.cfg_trading.get("buy_min_conditions", len(conditions))
-        )
-        min_score = float(self.cfg_trading.get("buy_min_score", 70))
-        met_conditions_count = sum(1 for v in conditions.values() if v)
-        all_conditions_met = all(conditions.values())
-        conditions_ok = (
-            all_conditions_met
-            if require_all_conditions
-            else (met_conditions_count >= min_conditions)
-        )
         is_duplicate = candle_time == last_time
 
-        if conditions_ok and score >= min_score and not is_duplicate:
+        if not is_duplicate and self._passes_entry_gate(conditions, score):
             self._last_signal_time[long_key] = candle_time
 
-            sl_pct = self.cfg_risk["stop_loss_pct"]
-            tp_pct = self.cfg_risk["take_profit_pct"].get(pair, 0.01)
-            stop_loss = close * (1 - sl_pct)
-            take_profit = close * (1 + tp_pct)
+            take_profit, stop_loss = self.calc_targets(close, pair, "long")
 
-            logger.info(
-                f"🟢 [Signal] {pair} 롱 신호! "
-                f"Score={score}, Price={close:,.2f}"
-            )
+            if self._log_info_enabled:
+                logger.info(
+                    f"🟢 [Signal] {pair} 롱 신호! "
+                    f"Score={score}, Price={close:,.2f}"
+                )
 
             return Signal(
                 pair=pair,
@@ -203,50 +225,26 @@ class SignalEngine:
         )
 
         # 점수 계산 (가중치)
-        weights = {
-            "ema_bearish": 25,
-            "rsi_overbought": 15,
-            "below_bb_mid": 15,
-            "volume_surge": 20,
-            "below_vwap": 10,
-            "trend_bearish": 15,
-        }
-        score = sum(weights[k] for k, v in conditions.items() if v)
+        score = self.calc_signal_score(conditions)
 
         # 중복 신호 방지
         candle_time = str(df_main.index[-1])
         short_key = f"{pair}_short"
         last_time = self._last_signal_time.get(short_key, "")
 
-        require_all_conditions = bool(
-            self.cfg_trading.get("buy_require_all_conditions", True)
-        )
-        min_conditions = int(
-            self.cfg_trading.get("buy_min_conditions", len(conditions))
-        )
-        min_score = float(self.cfg_trading.get("buy_min_score", 70))
-        met_conditions_count = sum(1 for v in conditions.values() if v)
-        all_conditions_met = all(conditions.values())
-        conditions_ok = (
-            all_conditions_met
-            if require_all_conditions
-            else (met_conditions_count >= min_conditions)
-        )
         is_duplicate = candle_time == last_time
 
-        if conditions_ok and score >= min_score and not is_duplicate:
+        if not is_duplicate and self._passes_entry_gate(conditions, score):
             self._last_signal_time[short_key] = candle_time
 
-            sl_pct = self.cfg_risk["stop_loss_pct"]
-            tp_pct = self.cfg_risk["take_profit_pct"].get(pair, 0.01)
             # 숏은 방향이 반대
-            stop_loss = close * (1 + sl_pct)
-            take_profit = close * (1 - tp_pct)
+            take_profit, stop_loss = self.calc_targets(close, pair, "short")
 
-            logger.info(
-                f"🔴 [Signal] {pair} 숏 신호! "
-                f"Score={score}, Price={close:,.2f}"
-            )
+            if self._log_info_enabled:
+                logger.info(
+                    f"🔴 [Signal] {pair} 숏 신호! "
+                    f"Score={score}, Price={close:,.2f}"
+                )
 
             return Signal(
                 pair=pair,
@@ -291,51 +289,64 @@ class SignalEngine:
         tp_stage = position.get("tp_stage_hit", 0)
         peak_price = position.get("peak_price", entry_price)
 
+        # 진입 시 계산된 TP/SL 가격 테이블 (복구/외부 포지션은 즉석 계산)
+        levels = (
+            position
+            if "sl_fixed_price" in position
+            else PositionTracker.calc_exit_levels(entry_price, position_side)
+        )
+
         if position_side == "long":
-            pnl_pct = (close - entry_price) / entry_price
             # 고점 업데이트
             if close > peak_price:
                 peak_price = close
+            in_profit = close > entry_price
+            in_loss = close < entry_price
+            sl_fixed_hit = close <= levels["sl_fixed_price"]
+            tp1_hit = close >= levels["tp1_price"]
+            tp2_hit = close >= levels["tp2_price"]
+            tp3_hit = close >= levels["tp3_price"]
         else:  # short
-            pnl_pct = (entry_price - close) / entry_price
             # 저점 업데이트
             if close < peak_price:
                 peak_price = close
+            in_profit = close < entry_price
+            in_loss = close > entry_price
+            sl_fixed_hit = close >= levels["sl_fixed_price"]
+            tp1_hit = close <= levels["tp1_price"]
+            tp2_hit = close <= levels["tp2_price"]
+            tp3_hit = close <= levels["tp3_price"]
 
         # 1. 손절(SL) 로직
         # 1-1. 고정 손절 (1.0%)
-        sl_fixed_pct = 0.010
-        if pnl_pct <= -sl_fixed_pct:
+        if sl_fixed_hit:
             return Signal(pair=pair, signal_type="exit", reason="SL", price=close, timestamp=now_kst().isoformat(), position_side=position_side)
 
         # 1-2. 동적 손절 (10캔들 기반, 최대 2.0% 캡)
-        # 캡 가격 계산
         if position_side == "long":
-            sl_cap_price = entry_price * 0.98
             recent_low = df_main["low"].iloc[-10:].min()
             # "캡"이라는 것은 손절선이 이 가격보다 더 아래로 내려가지 않음을 의미 (즉, max 로직)
-            dynamic_sl = max(recent_low, sl_cap_price)
+            dynamic_sl = max(recent_low, levels["sl_cap_price"])
             if close < dynamic_sl:
                 return Signal(pair=pair, signal_type="exit", reason="SL", price=close, timestamp=now_kst().isoformat(), position_side=position_side)
         else:
-            sl_cap_price = entry_price * 1.02
             recent_high = df_main["high"].iloc[-10:].max()
-            dynamic_sl = min(recent_high, sl_cap_price)
+            dynamic_sl = min(recent_high, levels["sl_cap_price"])
             if close > dynamic_sl:
                 return Signal(pair=pair, signal_type="exit", reason="SL", price=close, timestamp=now_kst().isoformat(), position_side=position_side)
 
         # 2. 익절(TP) 로직 (다단계)
         # TP1: +0.8% (30%), TP2: +1.5% (30%), TP3: +2.5% (전량)
-        if tp_stage < 1 and pnl_pct >= 0.008:
+        if tp_stage < 1 and tp1_hit:
             return Signal(pair=pair, signal_type="exit", reason="TP1", price=close, quantity_pct=0.3, timestamp=now_kst().isoformat(), position_side=position_side)
         
-        if tp_stage < 2 and pnl_pct >= 0.015:
+        if tp_stage < 2 and tp2_hit:
             # TP1을 건너뛰고 바로 TP2로 올 수도 있으므로, 남은 수량의 적절한 비율을 계산해야 함.
             # 하지만 여기서는 단순화를 위해 "현재 수량의 30%를 추가로 턴다"는 개념으로 0.3 반환.
             # (MainController에서 처리 방식에 따라 다름)
             return Signal(pair=pair, signal_type="exit", reason="TP2", price=close, quantity_pct=0.3, timestamp=now_kst().isoformat(), position_side=position_side)
             
-        if pnl_pct >= 0.025:
+        if tp3_hit:
             return Signal(pair=pair, signal_type="exit", reason="TP3", price=close, quantity_pct=1.0, timestamp=now_kst().isoformat(), position_side=position_side)
 
         # 3. 트레일링 스톱 (TP1 이후 활성화, 고점 대비 0.4% 되돌림)
@@ -349,7 +360,7 @@ class SignalEngine:
                 return Signal(pair=pair, signal_type="exit", reason="Trailing", price=close, quantity_pct=1.0, timestamp=now_kst().isoformat(), position_side=position_side)
 
         # 4. EMA 크로스 청산 (미실현 손실 중일 때만)
-        if pnl_pct < 0:
+        if in_loss:
             ema_cross = latest.get("ema_cross", 0)
             if position_side == "long" and ema_cross == -1:
                 return Signal(pair=pair, signal_type="exit", reason="EMA", price=close, timestamp=now_kst().isoformat(), position_side=position_side)
@@ -363,7 +374,7 @@ class SignalEngine:
         max_hold = self.cfg_trading.get("max_hold_minutes", 60)
 
         if hold_minutes >= max_hold:
-            if pnl_pct > 0:
+            if in_profit:
                 # 수익권이면 트레일링 스탑으로 전환 (이미 전환되었을 수도 있음)
                 # 여기서는 별도 시그널 대신 관망을 리턴하여 루프에서 peak_price 업데이트를 계속하도록 함.
                 pass
@@ -380,6 +391,39 @@ class SignalEngine:
             position_side=position_side,
         )
 
+    def _passes_entry_gate(self, conditions: dict, score: float) -> bool:
+        """진입 기준 충족 여부 (최소 점수 + 전체/최소 개수 조건)"""
+        if score < self._min_score:
+            return False
+        if self._require_all_conditions:
+            return all(conditions.values())
+        min_conditions = (
+            self._min_conditions if self._min_conditions is not None else len(conditions)
+        )
+        return sum(map(bool, conditions.values())) >= min_conditions
+
+    @staticmethod
+    def calc_signal_score(conditions: dict) -> int:
+        """충족된 조건의 가중치 합 (0~100)
+
+        Raises:
+            ValueError: 가중치 표에 없는 조건 키가 있을 때
+        """
+        unknown = conditions.keys() - _SIGNAL_WEIGHTS.keys()
+        if unknown:
+            raise ValueError(f"알 수 없는 신호 조건: {', '.join(sorted(unknown))}")
+        return sum(_SIGNAL_WEIGHTS[k] for k, v in conditions.items() if v)
+
+    def calc_targets(
+        self, price: float, pair: str, position_side: str = "long"
+    ) -> tuple[float, float]:
+        """진입가 기준 (익절가, 손절가)"""
+        tp_mult, sl_mult = (
+            self._targets[position_side].get(pair)
+            or self._targets_default[position_side]
+        )
+        return price * tp_mult, price * sl_mult
+
     # 레거시 호환
     def check_buy_signal(self, pair, df_main, df_trend):
         return self.check_long_signal(pair, df_main, df_trend)
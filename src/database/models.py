@@ -1,11 +1,52 @@
 """SQLite 데이터베이스 스키마 및 기본 CRUD (OKX)"""
 
+from __future__ import annotations
+
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from loguru import logger
 from pathlib import Path
 
 DB_PATH = Path("data/trades.db")
 
+# 스키마 버전 (PRAGMA user_version) — 컬럼 추가 시 증가
+SCHEMA_VERSION = 1
+
+# 연결마다 적용하는 PRAGMA (WAL 모드에서 NORMAL 동기화로 커밋당 fsync 제거)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA wal_autocheckpoint=10000",  # 연결 단위 설정 (기본 1000페이지)
+)
+
+
+# 연결별 prepared statement 캐시 크기 (기본 128)
+_CACHED_STATEMENTS = 256
+
+
+def _is_memory_db() -> bool:
+    """인메모리 DB 여부 (WAL/mmap 미적용 대상)"""
+    return str(DB_PATH) == ":memory:"
+
+
+def _apply_pragmas(conn: sqlite3.Connection):
+    """연결 단위 PRAGMA 적용"""
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _optimize_and_close(conn: sqlite3.Connection):
+    """PRAGMA optimize 후 연결 종료"""
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
 
 def init_database():
     """데이터베이스 초기화 (테이블 생성)"""
@@ -13,6 +54,17 @@ def init_database():
     conn = sqlite3.connect(str(DB_PATH))
     cur = conn.cursor()
 
+    # WAL 저널 (DB 파일에 영속) + 연결 PRAGMA
+    if not _is_memory_db():
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA mmap_size=268435456")
+    _apply_pragmas(conn)
+
+    # 삭제된 페이지를 incremental_vacuum으로 회수 (기존 DB는 1회 VACUUM으로 전환)
+    if cur.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        cur.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cur.execute("VACUUM")
+
     # trades 테이블
     cur.execute("""
     CREATE TABLE IF NOT EXISTS trades (
@@ -37,29 +89,6 @@ def init_database():
     )
     """)
 
-    # 기존 테이블에 신규 컬럼 추가 (마이그레이션 호환)
-    for col, col_type, default in [
-        ("position_side", "TEXT", "'long'"),
-        ("market_type", "TEXT", "'swap'"),
-        ("pnl_usdt", "REAL", "NULL"),
-        ("fee_usdt", "REAL", "NULL"),
-    ]:
-        try:
-            cur.execute(f"ALTER TABLE trades ADD COLUMN {col} {col_type} DEFAULT {default}")
-        except sqlite3.OperationalError:
-            pass  # 이미 존재
-
-    # daily_summary 마이그레이션
-    for col, col_type, default in [
-        ("total_pnl_usdt", "REAL", "0.0"),
-        ("max_drawdown_pct", "REAL", "0.0"),
-        ("balance_end", "REAL", "0.0"),
-    ]:
-        try:
-            cur.execute(f"ALTER TABLE daily_summary ADD COLUMN {col} {col_type} DEFAULT {default}")
-        except sqlite3.OperationalError:
-            pass
-
     # daily_summary 테이블
     cur.execute("""
     CREATE TABLE IF NOT EXISTS daily_summary (
@@ -90,17 +119,153 @@ def init_database():
     )
     """)
 
+    # 기존 테이블에 신규 컬럼 추가 (스키마 버전이 낮을 때만)
+    if cur.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        for col, col_type, default in [
+            ("position_side", "TEXT", "'long'"),
+            ("market_type", "TEXT", "'swap'"),
+            ("pnl_usdt", "REAL", "NULL"),
+            ("fee_usdt", "REAL", "NULL"),
+        ]:
+            try:
+                cur.execute(f"ALTER TABLE trades ADD COLUMN {col} {col_type} DEFAULT {default}")
+            except sqlite3.OperationalError:
+                pass  # 이미 존재
+
+        # daily_summary 마이그레이션
+        for col, col_type, default in [
+            ("total_pnl_usdt", "REAL", "0.0"),
+            ("max_drawdown_pct", "REAL", "0.0"),
+            ("balance_end", "REAL", "0.0"),
+        ]:
+            try:
+                cur.execute(f"ALTER TABLE daily_summary ADD COLUMN {col} {col_type} DEFAULT {default}")
+            except sqlite3.OperationalError:
+                pass
+
+        cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # 조회 인덱스 (기간 조회 / 최근순 정렬)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_exit_time ON trades(exit_time)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_entry_time ON trades(entry_time)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_created_at ON trades(created_at DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at)")
+
+    # 쿼리 플래너 통계 갱신 (sqlite_stat1)
+    cur.execute("ANALYZE")
+
     conn.commit()
     conn.close()
+
+    # 재초기화(DB 파일 재생성) 시 기존 풀 연결 폐기
+    reset_pool()
     logger.info("[DB] ✅ 데이터베이스 초기화 완료")
 
 
 def get_connection():
-    """DB 연결 반환"""
-    return sqlite3.connect(str(DB_PATH))
+    """DB 연결 반환 (PRAGMA 적용)"""
+    conn = sqlite3.connect(str(DB_PATH), cached_statements=_CACHED_STATEMENTS)
+    _apply_pragmas(conn)
+    return conn
 
 
 def close_connection(conn):
-    """DB 연결 종료"""
+    """DB 연결 종료 (종료 전 플래너 통계 최적화)"""
     if conn:
-        conn.close()
+        _optimize_and_close(conn)
+
+
+class ConnectionPool:
+    """스레드 안전 SQLite 연결 풀
+
+    연결 생성/종료 비용(PRAGMA 재적용, 페이지 캐시 콜드 스타트)을 피하기 위해
+    PRAGMA가 적용된 연결을 최대 size개까지 재사용한다.
+    """
+
+    def __init__(self, size: int = 5):
+        self._size = size
+        self._pool: queue.Queue = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(DB_PATH),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        _apply_pragmas(conn)
+        return conn
+
+    def get_connection(self, timeout: float = 5.0) -> sqlite3.Connection:
+        """풀에서 연결 획득 (부족하면 생성, 한도 도달 시 대기)"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self._size:
+                    self._created += 1
+                    return self._create_connection()
+            conn = self._pool.get(timeout=timeout)
+
+        # 연결 생존 확인
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.Error:
+            conn = self._create_connection()
+        return conn
+
+    def return_connection(self, conn: sqlite3.Connection):
+        """연결 반납 (미완료 트랜잭션은 롤백)"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+            self._pool.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+    @contextmanager
+    def borrow(self, timeout: float = 5.0):
+        """with 블록 동안 연결 대여"""
+        conn = self.get_connection(timeout)
+        try:
+            yield conn
+        finally:
+            self.return_connection(conn)
+
+    def close_all(self):
+        """풀의 모든 유휴 연결 종료"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            _optimize_and_close(conn)
+        with self._lock:
+            self._created = 0
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """모듈 공용 연결 풀 반환 (지연 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def reset_pool():
+    """공용 연결 풀 폐기 (다음 사용 시 재생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _pool = None
@@ -2,10 +2,256 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import queue
 import sqlite3
 import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
 from loguru import logger
-from src.database.models import get_connection, close_connection
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+from src.database.models import get_pool
+from src.utils.helpers import now_kst
+
+# JSON으로 그대로 직렬화 가능한 타입 (빠른 경로)
+_JSON_PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+
+# SQL 문자열을 모듈 상수로 고정해 연결별 statement 캐시가 항상 적중하도록 한다
+# trade_id 충돌 시 OR REPLACE(삭제 후 재삽입) 대신 제자리 갱신 (id/created_at 유지)
+_INSERT_TRADE_SQL = """
+INSERT INTO trades (
+    trade_id, pair, side, position_side, market_type,
+    entry_price, exit_price, quantity,
+    entry_time, exit_time, pnl_pct, pnl_usdt, fee_usdt,
+    signal_score, exit_reason, trade_mode
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(trade_id) DO UPDATE SET
+    pair = excluded.pair,
+    side = excluded.side,
+    position_side = excluded.position_side,
+    market_type = excluded.market_type,
+    entry_price = excluded.entry_price,
+    exit_price = excluded.exit_price,
+    quantity = excluded.quantity,
+    entry_time = excluded.entry_time,
+    exit_time = excluded.exit_time,
+    pnl_pct = excluded.pnl_pct,
+    pnl_usdt = excluded.pnl_usdt,
+    fee_usdt = excluded.fee_usdt,
+    signal_score = excluded.signal_score,
+    exit_reason = excluded.exit_reason,
+    trade_mode = excluded.trade_mode
+"""
+
+_INSERT_SIGNAL_SQL = """
+INSERT INTO signals (timestamp, pair, signal_type, score, conditions, acted, reason_skipped)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 일일 요약: 거래 집계는 trades에서 SQL로 계산, 잔고/MDD만 파라미터로 전달
+_UPSERT_SUMMARY_SQL = """
+INSERT INTO daily_summary (
+    date, total_trades, wins, losses, win_rate,
+    total_pnl_usdt, max_drawdown_pct, balance_end
+)
+SELECT
+    ?,
+    COUNT(*),
+    COALESCE(SUM(pnl_usdt > 0), 0),
+    COALESCE(SUM(COALESCE(pnl_usdt, 0) <= 0), 0),
+    COALESCE(100.0 * SUM(pnl_usdt > 0) / NULLIF(COUNT(*), 0), 0.0),
+    COALESCE(SUM(pnl_usdt), 0.0),
+    ?,
+    ?
+FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+ON CONFLICT(date) DO UPDATE SET
+    total_trades = excluded.total_trades,
+    wins = excluded.wins,
+    losses = excluded.losses,
+    win_rate = excluded.win_rate,
+    total_pnl_usdt = excluded.total_pnl_usdt,
+    max_drawdown_pct = excluded.max_drawdown_pct,
+    balance_end = excluded.balance_end
+"""
+
+# get_detailed_stats 집계 쿼리 (exit_time [start, end) 구간, pnl/fee NULL은 0 취급)
+_STATS_TOTALS_SQL = """
+SELECT
+    COUNT(*) AS total_trades,
+    COALESCE(SUM(pnl_usdt > 0), 0) AS wins,
+    COALESCE(SUM(COALESCE(pnl_usdt, 0)), 0.0) AS total_pnl,
+    COALESCE(SUM(COALESCE(fee_usdt, 0)), 0.0) AS total_fees,
+    COALESCE(SUM(CASE WHEN pnl_usdt > 0 THEN pnl_usdt ELSE 0 END), 0.0) AS gross_profit,
+    COALESCE(SUM(CASE WHEN pnl_usdt < 0 THEN -pnl_usdt ELSE 0 END), 0.0) AS gross_loss,
+    AVG((julianday(exit_time) - julianday(entry_time)) * 1440.0) AS avg_hold_minutes
+FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+"""
+
+_STATS_GROUP_SQL = """
+SELECT
+    {col} AS grp,
+    COALESCE(SUM(COALESCE(pnl_usdt, 0)), 0.0) AS pnl,
+    COALESCE(SUM(pnl_usdt > 0), 0) AS wins,
+    COUNT(*) AS total
+FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+GROUP BY grp
+ORDER BY MIN(exit_time)
+"""
+_STATS_BY_PAIR_SQL = _STATS_GROUP_SQL.format(col="pair")
+_STATS_BY_SIDE_SQL = _STATS_GROUP_SQL.format(col="COALESCE(position_side, 'long')")
+
+# 보유 시간(초)은 SQL에서 계산해 Python 측 datetime 파싱을 없앤다
+_HOLD_SEC_EXPR = "(julianday(exit_time) - julianday(entry_time)) * 86400.0 AS hold_sec"
+
+# 베스트/워스트는 리포트에 필요한 컬럼만 조회
+_STATS_TRADE_COLUMNS = (
+    "trade_id, pair, position_side, entry_price, exit_price, "
+    "entry_time, exit_time, pnl_pct, pnl_usdt, exit_reason, " + _HOLD_SEC_EXPR
+)
+
+_STATS_BEST_SQL = f"""
+SELECT {_STATS_TRADE_COLUMNS} FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+ORDER BY COALESCE(pnl_usdt, 0) DESC, exit_time ASC
+LIMIT 1
+"""
+_STATS_WORST_SQL = f"""
+SELECT {_STATS_TRADE_COLUMNS} FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+ORDER BY COALESCE(pnl_usdt, 0) ASC, exit_time ASC
+LIMIT 1
+"""
+_STATS_TRADES_SQL = f"""
+SELECT *, {_HOLD_SEC_EXPR} FROM trades
+WHERE exit_time >= ? AND exit_time < ?
+ORDER BY exit_time ASC
+"""
+
+
+class _SignalWriter:
+    """신호 INSERT 배치 기록기
+
+    save_signal은 원본 신호 dict를 큐에 넣기만 하고, 백그라운드 스레드가 최대
+    BATCH_SIZE개 또는 FLUSH_INTERVAL초 단위로 모아 JSON 직렬화 후
+    한 트랜잭션(executemany)으로 커밋한다.
+    """
+
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 0.25  # 초
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def put(self, signal: SignalRow):
+        """신호 적재 (논블로킹)"""
+        if self._thread is None:
+            self._start()
+        self._queue.put(signal)
+
+    def flush(self):
+        """적재된 신호가 모두 기록될 때까지 대기"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="signal-writer", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write(signals: list[SignalRow]):
+        rows = []
+        for signal in signals:
+            try:
+                rows.append(TradeLogger._signal_row(signal))
+            except Exception as e:
+                logger.error(f"[TradeLogger] 신호 직렬화 오류: {signal.pair} {e}")
+        if not rows:
+            return
+
+        try:
+            with get_pool().borrow() as conn, conn:
+                conn.executemany(_INSERT_SIGNAL_SQL, rows)
+            logger.debug(f"[TradeLogger] 신호 {len(rows)}건 일괄 기록")
+        except Exception as e:
+            logger.error(f"[TradeLogger] 신호 일괄 저장 오류 ({len(rows)}건): {e}")
+
+
+@dataclass(slots=True)
+class SignalRow:
+    """signals 테이블 한 행 (신호 평가마다 생성되는 기록)"""
+
+    timestamp: str
+    pair: str
+    signal_type: str
+    score: float = 0
+    conditions: Any = field(default_factory=dict)
+    acted: bool = False
+    reason_skipped: str = ""
+
+    @classmethod
+    def from_dict(cls, signal: dict) -> "SignalRow":
+        return cls(
+            timestamp=signal.get("timestamp"),
+            pair=signal.get("pair"),
+            signal_type=signal.get("signal_type"),
+            score=signal.get("score"),
+            conditions=signal.get("conditions", {}),
+            acted=signal.get("acted"),
+            reason_skipped=signal.get("reason_skipped"),
+        )
+
+
+_signal_writer = _SignalWriter()
+
+# 지난 날짜(KST)의 calculate_daily_stats 결과 캐시 {date: stats}
+_closed_day_stats: dict[str, dict] = {}
+
+# 거래 기록 세대 번호 — 거래가 저장될 때마다 증가 (당일 통계 캐시 무효화 기준)
+_trade_generation = 0
+_generation_lock = threading.Lock()
+
+# 진행 중인 날짜의 calculate_daily_stats 결과 캐시 {date: (generation, stats)}
+_open_day_stats: dict[str, tuple[int, dict]] = {}
+
+# 마지막으로 기록한 일일 요약 입력 {date: (generation, max_drawdown_pct, balance_end)}
+_last_summary_write: dict[str, tuple] = {}
 
 
 class TradeLogger:
@@ -14,266 +260,310 @@ class TradeLogger:
     @staticmethod
     def _to_json_safe(value):
         """numpy 타입 등을 JSON 직렬화 가능한 기본 타입으로 변환"""
-        if isinstance(value, dict):
+        t = type(value)
+        if t in _JSON_PRIMITIVES:
+            return value
+        if t is dict:
             return {str(k): TradeLogger._to_json_safe(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple)):
+        if t is list or t is tuple:
             return [TradeLogger._to_json_safe(v) for v in value]
 
-        if hasattr(value, "item"):
+        # numpy 스칼라
+        if getattr(value, "dtype", None) is not None:
             try:
                 return value.item()
             except Exception:
                 pass
 
-        if isinstance(value, (str, int, float, bool)) or value is None:
+        # 기본 타입 하위 클래스
+        if isinstance(value, dict):
+            return {str(k): TradeLogger._to_json_safe(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [TradeLogger._to_json_safe(v) for v in value]
+        if isinstance(value, (str, int, float, bool)):
             return value
 
         return str(value)
 
+    @staticmethod
+    def _day_range(date: str) -> tuple[str, str]:
+        """YYYY-MM-DD → [당일, 익일) 반열림 구간 (인덱스 범위 탐색용)"""
+        next_day = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        return date, next_day
+
+    @staticmethod
+    def _trade_row(trade: dict) -> tuple:
+        """거래 dict → _INSERT_TRADE_SQL 파라미터"""
+        return (
+            trade.get("trade_id"),
+            trade.get("pair"),
+            trade.get("side"),
+            trade.get("position_side", "long"),
+            trade.get("market_type", "swap"),
+            trade.get("entry_price"),
+            trade.get("exit_price"),
+            trade.get("quantity"),
+            trade.get("entry_time"),
+            trade.get("exit_time"),
+            trade.get("pnl_pct"),
+            trade.get("pnl_usdt"),
+            trade.get("fee_usdt"),
+            trade.get("signal_score"),
+            trade.get("exit_reason"),
+            trade.get("trade_mode"),
+        )
+
+    @staticmethod
+    def _dumps_conditions(conditions) -> str:
+        """조건 dict → JSON 문자열 (orjson 우선, 미지원 타입은 변환 후 json)"""
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    conditions,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ).decode()
+            except TypeError:
+                pass
+        return json.dumps(TradeLogger._to_json_safe(conditions), ensure_ascii=False)
+
+    @staticmethod
+    def _signal_row(signal: SignalRow | dict) -> tuple:
+        """신호 → _INSERT_SIGNAL_SQL 파라미터"""
+        if type(signal) is not SignalRow:
+            signal = SignalRow.from_dict(signal)
+        return (
+            signal.timestamp,
+            signal.pair,
+            signal.signal_type,
+            TradeLogger._to_json_safe(signal.score),
+            TradeLogger._dumps_conditions(signal.conditions),
+            int(bool(signal.acted)),
+            signal.reason_skipped,
+        )
+
+    @staticmethod
+    def _bump_generation():
+        """거래 기록 세대 증가 (당일 통계 캐시 무효화)"""
+        global _trade_generation
+        with _generation_lock:
+            _trade_generation += 1
+
     @staticmethod
     def save_trade(trade: dict):
         """거래 기록 저장 (매수/매도 통합)"""
-        conn = get_connection()
-        cur = conn.cursor()
+        if TradeLogger.save_trades([trade]):
+            logger.debug(f"[TradeLogger] ✅ 거래 저장 완료: {trade.get('trade_id')}")
 
+    @staticmethod
+    def save_trades(trades: list[dict]) -> bool:
+        """거래 기록 일괄 저장 (단일 트랜잭션)"""
+        if not trades:
+            return True
+
+        rows = [TradeLogger._trade_row(t) for t in trades]
         try:
-            cur.execute("""
-            INSERT OR REPLACE INTO trades (
-                trade_id, pair, side, position_side, market_type,
-                entry_price, exit_price, quantity,
-                entry_time, exit_time, pnl_pct, pnl_usdt, fee_usdt,
-                signal_score, exit_reason, trade_mode
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.get("trade_id"),
-                trade.get("pair"),
-                trade.get("side"),
-                trade.get("position_side", "long"),
-                trade.get("market_type", "swap"),
-                trade.get("entry_price"),
-                trade.get("exit_price"),
-                trade.get("quantity"),
-                trade.get("entry_time"),
-                trade.get("exit_time"),
-                trade.get("pnl_pct"),
-                trade.get("pnl_usdt"),
-                trade.get("fee_usdt"),
-                trade.get("signal_score"),
-                trade.get("exit_reason"),
-                trade.get("trade_mode"),
-            ))
-            conn.commit()
-            logger.debug(f"[TradeLogger] ✅ 거래 저장 완료: {trade.get('trade_id')}")
-        except sqlite3.IntegrityError:
-            logger.warning(f"[TradeLogger] 중복 거래 ID: {trade.get('trade_id')}")
+            with get_pool().borrow() as conn, conn:
+                conn.executemany(_INSERT_TRADE_SQL, rows)
+            TradeLogger._bump_generation()
+            return True
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"[TradeLogger] 거래 저장 무결성 오류 ({len(rows)}건): {e}")
         except Exception as e:
-            logger.error(f"[TradeLogger] 거래 저장 오류: {e}")
-        finally:
-            close_connection(conn)
+            logger.error(f"[TradeLogger] 거래 저장 오류 ({len(rows)}건): {e}")
+        return False
 
     @staticmethod
-    def save_signal(signal: dict):
-        """신호 기록 저장"""
-        conn = get_connection()
-        cur = conn.cursor()
-
+    def save_signal(signal: SignalRow | dict):
+        """신호 기록 저장 (배치 기록기에 적재)"""
         try:
-            conditions = TradeLogger._to_json_safe(signal.get("conditions", {}))
-            acted = TradeLogger._to_json_safe(signal.get("acted"))
-
-            cur.execute("""
-            INSERT INTO signals (timestamp, pair, signal_type, score, conditions, acted, reason_skipped)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                signal.get("timestamp"),
-                signal.get("pair"),
-                signal.get("signal_type"),
-                signal.get("score"),
-                json.dumps(conditions, ensure_ascii=False),
-                int(bool(acted)),
-                signal.get("reason_skipped"),
-            ))
-            conn.commit()
+            if type(signal) is not SignalRow:
+                signal = SignalRow.from_dict(signal)
+            _signal_writer.put(signal)
             logger.debug(
-                f"[TradeLogger] 신호 기록: {signal.get('pair')} "
-                f"{signal.get('signal_type')}"
+                f"[TradeLogger] 신호 기록: {signal.pair} {signal.signal_type}"
             )
         except Exception as e:
             logger.error(f"[TradeLogger] 신호 저장 오류: {e}")
-        finally:
-            close_connection(conn)
+
+    @staticmethod
+    def save_signals(signals: list[SignalRow | dict]) -> bool:
+        """신호 기록 일괄 저장 (단일 트랜잭션, 즉시 반영)"""
+        if not signals:
+            return True
+
+        try:
+            rows = [TradeLogger._signal_row(s) for s in signals]
+            with get_pool().borrow() as conn, conn:
+                conn.executemany(_INSERT_SIGNAL_SQL, rows)
+            return True
+        except Exception as e:
+            logger.error(f"[TradeLogger] 신호 일괄 저장 오류 ({len(signals)}건): {e}")
+        return False
+
+    @staticmethod
+    def flush_signals():
+        """대기 중인 신호 기록을 DB에 반영"""
+        _signal_writer.flush()
 
     @staticmethod
     def save_daily_summary(date: str, summary: dict):
-        """일일 요약 저장"""
-        conn = get_connection()
-        cur = conn.cursor()
+        """일일 요약 저장
+
+        거래 수/승패/손익은 해당 일자에 종료된 거래로부터 SQL에서 직접 집계하고,
+        summary에서는 잔고(balance_end)와 MDD(max_drawdown_pct)만 사용한다.
+        """
+        max_dd = summary.get("max_drawdown_pct", 0.0)
+        balance_end = summary.get("balance_end", 0.0)
 
+        # 이후 거래 저장이 없고 잔고/MDD도 같으면 결과 행이 동일하므로 커밋 생략
+        key = (_trade_generation, max_dd, balance_end)
+        if _last_summary_write.get(date) == key:
+            logger.debug(f"[TradeLogger] 일일 요약 변경 없음 — 저장 생략: {date}")
+            return
+
+        start_time, end_time = TradeLogger._day_range(date)
         try:
-            cur.execute("""
-            INSERT OR REPLACE INTO daily_summary (
-                date, total_trades, wins, losses, win_rate,
-                total_pnl_usdt, max_drawdown_pct, balance_end
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                date,
-                summary.get("total_trades", 0),
-                summary.get("wins", 0),
-                summary.get("losses", 0),
-                summary.get("win_rate", 0.0),
-                summary.get("total_pnl_usdt", 0.0),
-                summary.get("max_drawdown_pct", 0.0),
-                summary.get("balance_end", 0.0),
-            ))
-            conn.commit()
+            with get_pool().borrow() as conn, conn:
+                conn.execute(_UPSERT_SUMMARY_SQL, (
+                    date,
+                    max_dd,
+                    balance_end,
+                    start_time,
+                    end_time,
+                ))
+            _last_summary_write[date] = key
             logger.info(f"[TradeLogger] ✅ 일일 요약 저장: {date}")
         except Exception as e:
             logger.error(f"[TradeLogger] 일일 요약 저장 오류: {e}")
-        finally:
-            close_connection(conn)
 
     @staticmethod
     def get_trades_by_date(date: str) -> list[dict]:
         """특정 날짜 거래 조회"""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        rows = cur.execute(
-            "SELECT * FROM trades WHERE date(entry_time) = ? ORDER BY entry_time",
-            (date,),
-        ).fetchall()
-
-        close_connection(conn)
+        with get_pool().borrow() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+
+            rows = cur.execute(
+                "SELECT * FROM trades WHERE entry_time >= ? AND entry_time < ? ORDER BY entry_time",
+                TradeLogger._day_range(date),
+            ).fetchall()
         return [dict(row) for row in rows]
 
     @staticmethod
     def get_all_trades(limit: int = 100) -> list[dict]:
         """최근 거래 조회"""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        rows = cur.execute(
-            "SELECT * FROM trades ORDER BY created_at DESC LIMIT ?",
-            (limit,),
-        ).fetchall()
-
-        close_connection(conn)
+        with get_pool().borrow() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+
+            rows = cur.execute(
+                "SELECT * FROM trades ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
         return [dict(row) for row in rows]
 
     @staticmethod
     def get_daily_summary(date: str) -> dict | None:
         """특정 날짜 요약 조회"""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        row = cur.execute(
-            "SELECT * FROM daily_summary WHERE date = ?",
-            (date,),
-        ).fetchone()
-
-        close_connection(conn)
+        with get_pool().borrow() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+
+            row = cur.execute(
+                "SELECT * FROM daily_summary WHERE date = ?",
+                (date,),
+            ).fetchone()
         return dict(row) if row else None
 
     @staticmethod
     def calculate_daily_stats(date: str) -> dict:
-        """특정 날짜 통계 계산 (보안됨)"""
-        return TradeLogger.get_detailed_stats(start_time=f"{date} 00:00:00", end_time=f"{date} 23:59:59")
+        """특정 날짜 통계 계산 (보안됨)
 
-    @staticmethod
-    def get_detailed_stats(start_time: str, end_time: str) -> dict:
-        """기간별 상세 통계 계산"""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        # 해당 기간에 종료된 거래들
-        query = """
-            SELECT * FROM trades 
-            WHERE exit_time >= ? AND exit_time <= ? 
-            ORDER BY exit_time ASC
+        지난 날짜는 더 이상 거래가 추가되지 않으므로 계산 결과를 재사용한다.
+        진행 중인 날짜는 마지막 계산 이후 거래가 저장되지 않았다면 재사용한다.
+        중첩 dict(pair_stats 등)까지 캐시와 공유하지 않도록 깊은 복사본을 반환한다.
         """
-        rows = cur.execute(query, (start_time, end_time)).fetchall()
-        trades = [dict(row) for row in rows]
-        close_connection(conn)
+        cached = _closed_day_stats.get(date)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        generation = _trade_generation
+        entry = _open_day_stats.get(date)
+        if entry is not None and entry[0] == generation:
+            return copy.deepcopy(entry[1])
+
+        start_time, end_time = TradeLogger._day_range(date)
+        stats = TradeLogger.get_detailed_stats(start_time=start_time, end_time=end_time)
+        if date < now_kst().strftime("%Y-%m-%d"):
+            _closed_day_stats[date] = stats
+            _open_day_stats.pop(date, None)
+        else:
+            _open_day_stats.clear()
+            _open_day_stats[date] = (generation, stats)
+        return copy.deepcopy(stats)
 
-        if not trades:
-            return {
-                "total_trades": 0, "wins": 0, "losses": 0, "win_rate": 0.0,
-                "total_pnl": 0.0, "total_fees": 0.0, "net_pnl": 0.0,
-                "pf": 0.0, "avg_hold_minutes": 0.0, "pairs": {}, "sides": {}
+    @staticmethod
+    def get_detailed_stats(start_time: str, end_time: str, include_trades: bool = False) -> dict:
+        """기간별 상세 통계 계산 (SQL 집계)
+
+        start_time 이상 end_time 미만에 종료된 거래 대상. 경계는 저장 형식(ISO 8601)과
+        사전식 비교가 맞도록 날짜 또는 isoformat 문자열을 사용한다.
+        include_trades=True일 때만 원본 거래 목록(trades_list)을 함께 조회한다.
+        """
+        params = (start_time, end_time)
+        with get_pool().borrow() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+
+            # 해당 기간에 종료된 거래 합계
+            totals = cur.execute(_STATS_TOTALS_SQL, params).fetchone()
+            total_trades = totals["total_trades"]
+
+            if not total_trades:
+                return {
+                    "total_trades": 0, "wins": 0, "losses": 0, "win_rate": 0.0,
+                    "total_pnl": 0.0, "total_fees": 0.0, "total_funding": 0.0,
+                    "net_pnl": 0.0, "pf": 0.0, "avg_hold_minutes": 0.0,
+                    "pair_stats": {}, "side_stats": {},
+                    "best_trade": {}, "worst_trade": {}, "trades_list": [],
+                }
+
+            # 페어별 / 사이드별
+            pair_stats = {
+                row["grp"]: {"pnl": row["pnl"], "wins": row["wins"], "total": row["total"]}
+                for row in cur.execute(_STATS_BY_PAIR_SQL, params)
             }
+            side_stats = {"long": {"pnl": 0, "wins": 0, "total": 0}, "short": {"pnl": 0, "wins": 0, "total": 0}}
+            for row in cur.execute(_STATS_BY_SIDE_SQL, params):
+                side_stats[row["grp"]] = {"pnl": row["pnl"], "wins": row["wins"], "total": row["total"]}
 
-        total_trades = len(trades)
-        wins = 0
-        losses = 0
-        total_pnl = 0.0
-        total_fees = 0.0
-        gross_profit = 0.0
-        gross_loss = 0.0
-        
-        pair_stats = {} # {pair: {"pnl": 0, "wins": 0, "total": 0}}
-        side_stats = {"long": {"pnl": 0, "wins": 0, "total": 0}, "short": {"pnl": 0, "wins": 0, "total": 0}}
-        
-        total_hold_seconds = 0
-        best_trade = trades[0]
-        worst_trade = trades[0]
-
-        from datetime import datetime
-        for t in trades:
-            pnl = t.get("pnl_usdt") or 0.0
-            fee = t.get("fee_usdt") or 0.0
-            total_pnl += pnl
-            total_fees += fee
-            
-            # Profit Factor용
-            if pnl > 0:
-                wins += 1
-                gross_profit += pnl
-            else:
-                losses += 1
-                gross_loss += abs(pnl)
-            
             # 베스트/워스트
-            if pnl > best_trade["pnl_usdt"]: best_trade = t
-            if pnl < worst_trade["pnl_usdt"]: worst_trade = t
-            
-            # 페어별
-            p = t["pair"]
-            if p not in pair_stats: pair_stats[p] = {"pnl": 0.0, "wins": 0, "total": 0}
-            pair_stats[p]["pnl"] += pnl
-            pair_stats[p]["total"] += 1
-            if pnl > 0: pair_stats[p]["wins"] += 1
-            
-            # 사이드별
-            side = t.get("position_side", "long")
-            if side not in side_stats: side_stats[side] = {"pnl": 0.0, "wins": 0, "total": 0}
-            side_stats[side]["pnl"] += pnl
-            side_stats[side]["total"] += 1
-            if pnl > 0: side_stats[side]["wins"] += 1
-            
-            # 보유 시간
-            e_time = datetime.fromisoformat(t["entry_time"])
-            x_time = datetime.fromisoformat(t["exit_time"])
-            hold_sec = (x_time - e_time).total_seconds()
-            total_hold_seconds += hold_sec
-
+            best_trade = dict(cur.execute(_STATS_BEST_SQL, params).fetchone())
+            worst_trade = dict(cur.execute(_STATS_WORST_SQL, params).fetchone())
+
+            trades = []
+            if include_trades:
+                trades = [dict(row) for row in cur.execute(_STATS_TRADES_SQL, params)]
+
+        wins = totals["wins"]
+        total_pnl = totals["total_pnl"]
+        total_fees = totals["total_fees"]
+        gross_profit = totals["gross_profit"]
+        gross_loss = totals["gross_loss"]
         net_pnl = total_pnl - total_fees
         pf = (gross_profit / gross_loss) if gross_loss > 0 else (gross_profit if gross_profit > 0 else 0.0)
-        
+
         return {
             "total_trades": total_trades,
             "wins": wins,
-            "losses": losses,
+            "losses": total_trades - wins,
             "win_rate": (wins / total_trades * 100),
             "total_pnl": total_pnl,
             "total_fees": total_fees,
             "total_funding": 0.0, # 펀딩비는 현재 추적 불가 -> 0
             "net_pnl": net_pnl,
             "pf": pf,
-            "avg_hold_minutes": (total_hold_seconds / total_trades / 60) if total_trades > 0 else 0,
+            "avg_hold_minutes": totals["avg_hold_minutes"] or 0.0,
             "pair_stats": pair_stats,
             "side_stats": side_stats,
             "best_trade": best_trade,
@@ -282,17 +572,29 @@ class TradeLogger:
         }
 
     @staticmethod
-    def delete_old_signals(days: int = 30):
-        """오래된 신호 기록 삭제"""
-        conn = get_connection()
-        cur = conn.cursor()
+    def maintenance():
+        """WAL 체크포인트 (대기 신호 반영 후 -wal 파일 병합/축소)"""
+        _signal_writer.flush()
+        try:
+            with get_pool().borrow() as conn:
+                busy, log_pages, ckpt_pages = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            logger.debug(f"[TradeLogger] WAL 체크포인트: {ckpt_pages}/{log_pages} 페이지 (busy={busy})")
+        except Exception as e:
+            logger.error(f"[TradeLogger] WAL 체크포인트 오류: {e}")
 
-        cur.execute("""
-        DELETE FROM signals WHERE created_at < datetime('now', '-{} days')
-        """.format(days))
+    @staticmethod
+    def prune_signals(days: int = 30, vacuum_pages: int = 1000):
+        """오래된 신호 삭제 후 빈 페이지 일부 회수 (주기 작업용)"""
+        TradeLogger.delete_old_signals(days)
+        with get_pool().borrow() as conn:
+            conn.execute(f"PRAGMA incremental_vacuum({int(vacuum_pages)})").fetchall()
 
-        deleted = cur.rowcount
-        conn.commit()
-        close_connection(conn)
+    @staticmethod
+    def delete_old_signals(days: int = 30):
+        """오래된 신호 기록 삭제"""
+        # created_at은 CURRENT_TIMESTAMP(UTC) 형식
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+        with get_pool().borrow() as conn, conn:
+            deleted = conn.execute("DELETE FROM signals WHERE created_at < ?", (cutoff,)).rowcount
 
         logger.info(f"[TradeLogger] 🗑️ {deleted}개 오래된 신호 삭제 (>{days}일)")
@@ -5,10 +5,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import signal
 import sys
+import time
 import ccxt
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Dict, Optional
 
 from loguru import logger
@@ -20,12 +25,14 @@ from src.core.order_executor import OrderExecutor
 from src.core.position_tracker import PositionTracker
 from src.core.risk_manager import RiskManager
 from src.core.signal_engine import SignalEngine
-from src.database.models import init_database
-from src.database.trade_logger import TradeLogger
+from src.database.models import init_database, reset_pool
+from src.database.trade_logger import SignalRow, TradeLogger
 from src.notifications.discord_notifier import DiscordNotifier
 from src.utils.helpers import (
+    ScheduleCfg,
     create_okx_exchange,
     format_usdt,
+    is_trading_session,
     load_config,
     now_kst,
     symbol_to_base,
@@ -47,6 +54,7 @@ class MainController:
     def __init__(self):
         self.running = False
         self._shutdown_requested = False
+        self._main_task: Optional[asyncio.Task] = None
         self._shutdown_completed = False
         self.config: Dict = {}
 
@@ -63,9 +71,32 @@ class MainController:
         # 스케줄러
         self.scheduler = AsyncIOScheduler()
 
-        # 스케줄 카운터
+        # 스케줄 카운터 / 리포트 슬롯 [주기(초), 작업] / 슬롯별 다음 실행 시각 (monotonic)
         self._loop_count = 0
         self._start_time = now_kst()
+        self._sched_slots: list[tuple[float, object]] = []
+        self._next_due: list[float] = []
+
+        # 페어 동시 처리 시 진입/청산(잔고·포지션 변경) 직렬화
+        self._trade_lock = asyncio.Lock()
+
+        # 블로킹 I/O 전용 스레드 풀 (initialize에서 페어 수 기준으로 생성)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # 루프 1회 내 잔고 스냅샷 재사용 (loop_count, snapshot)
+        self._snapshot_cache: tuple[int, dict] | None = None
+
+        # 루프에서 매 틱 읽는 설정값 (initialize에서 1회 계산)
+        self._mode = "paper"
+        self._market_type = "swap"
+        self._min_score = 70.0
+        self._pairs_tuple: tuple[str, ...] = ()
+        self._pair_bases: Dict[str, str] = {}
+        self._interval = 10
+        self._tf_main = "5m"
+        self._tf_trend = "1h"
+        self._fee_rate = 0.0
+        self._schedule = ScheduleCfg()
 
     # ═══════════════════════════════════════════
     #  초기화
@@ -90,6 +121,22 @@ class MainController:
         trading = self.config.get("trading", {})
         mode = trading.get("mode", "paper")
 
+        self._mode = mode
+        self._market_type = trading.get("market_type", "swap")
+        self._min_score = float(trading.get("buy_min_score", 70))
+        self._pairs_tuple = tuple(trading.get("pairs", ["BTC/USDT:USDT"]))
+        self._pair_bases = {p: p.split("/")[0] for p in self._pairs_tuple}
+        self._interval = trading.get("loop_interval_seconds", 10)
+        self._tf_main = trading.get("timeframe_main", "5m")
+        self._tf_trend = trading.get("timeframe_trend", "1h")
+        self._schedule = ScheduleCfg.from_config(self.config)
+
+        # 페어당 캔들 2건 동시 요청 기준
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self._pairs_tuple)),
+            thread_name_prefix="io",
+        )
+
         # 2. OKX Exchange 생성
         try:
             self.exchange = create_okx_exchange(mode)
@@ -111,6 +158,7 @@ class MainController:
 
         # 5. 기술적 지표
         self.indicators = Indicators(self.config)
+        Indicators.warmup()
 
         # 6. 신호 엔진
         self.signal_engine = SignalEngine(self.config)
@@ -131,7 +179,7 @@ class MainController:
             usdt_balance = self.order_executor.get_paper_balance().get("usdt", 0)
         else:
             balances = self.data_fetcher.get_balance(
-                market_type=trading.get("market_type", "swap")
+                market_type=self._market_type
             )
             usdt_balance = balances.get("USDT", {}).get("total", 0)
             if not usdt_balance:
@@ -142,6 +190,7 @@ class MainController:
 
         # 9. 리스크 매니저
         self.risk_manager = RiskManager(self.config, usdt_balance)
+        self._fee_rate = self.risk_manager.fee_rate  # 진입 수수료 계산용 (편도)
         logger.info(f"💰 시작 잔고: {format_usdt(usdt_balance)}")
 
         # 10. 디스코드 알림
@@ -151,7 +200,7 @@ class MainController:
                 "봇 시작",
                 f"거래소: OKX\n"
                 f"매매 모드: {mode}\n"
-                f"마켓: {trading.get('market_type', 'swap')}\n"
+                f"마켓: {self._market_type}\n"
                 f"레버리지: {trading.get('leverage', 1)}x\n"
                 f"페어: {', '.join(trading.get('pairs', []))}\n"
                 f"잔고: {format_usdt(usdt_balance)}",
@@ -168,28 +217,44 @@ class MainController:
             minute=55,
             timezone="Asia/Seoul",
         )
+        self.scheduler.add_job(self._db_maintenance_task, "interval", hours=1)
         self.scheduler.start()
 
+        # 루프 내 리포트 슬롯 (Discord.md 기준: 1분/5분/15분/1시간)
+        conf = self.config.get("discord", {})
+        self._sched_slots = [
+            (float(conf.get("report_1m_interval_seconds", 60)), self._send_position_report_1m),
+            (float(conf.get("report_5m_interval_seconds", 300)), self._send_market_snapshot_5m),
+            (float(conf.get("report_15m_interval_seconds", 900)), self._send_performance_report_15m),
+            (float(conf.get("report_1h_interval_seconds", 3600)), self._send_hourly_report_1h),
+        ]
+        self._next_due = [0.0] * len(self._sched_slots)
+
         logger.info("═══ 초기화 완료 ═══")
         return True
 
     # ═══════════════════════════════════════════
     #  잔고 조회 헬퍼
     # ═══════════════════════════════════════════
-    def _get_wallet_balance_usdt(self) -> float:
+    async def _run_io(self, fn, *args, **kwargs):
+        """블로킹 호출(ccxt REST, DB)을 I/O 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_pool, functools.partial(fn, *args, **kwargs)
+        )
+
+    def _wallet_usdt(self) -> float:
         """
         실제 지갑 잔고(Wallet Balance)를 조회한다.
         Paper 모드 → OrderExecutor의 가상 지갑 잔고
         Live/Demo 모드 → DataFetcher를 통한 거래소 지갑 잔고
         """
-        mode = self.config.get("trading", {}).get("mode", "paper")
-        if mode == "paper":
+        if self._mode == "paper":
             return float(
                 self.order_executor.get_paper_balance().get("usdt", 0.0)
             )
         else:
-            market_type = self.config["trading"].get("market_type", "swap")
-            balances = self.data_fetcher.get_balance(market_type=market_type)
+            balances = self.data_fetcher.get_balance(market_type=self._market_type)
             return float(balances.get("USDT", {}).get("total", 0.0))
 
     def _sync_risk_manager_balance(self) -> None:
@@ -197,22 +262,18 @@ class MainController:
         RiskManager의 current_balance를 실제 지갑 잔고와 동기화한다.
         매수/매도 후 반드시 호출하여 잔고 불일치를 방지한다.
         """
-        wallet_balance = self._get_wallet_balance_usdt()
+        self.data_fetcher.invalidate_balance()
+        wallet_balance = self._wallet_usdt()
         self.risk_manager.update_balance(wallet_balance)
+        self._snapshot_cache = None
 
     # ═══════════════════════════════════════════
     #  메인 루프
     # ═══════════════════════════════════════════
     async def main_loop(self) -> None:
         """메인 매매 루프"""
-        from src.utils.helpers import is_trading_session
-
-        trading = self.config.get("trading", {})
-        pairs = trading.get("pairs", ["BTC/USDT:USDT"])
-        interval = trading.get("loop_interval_seconds", 10)
-        timeframe_main = trading.get("timeframe_main", "5m")
-        timeframe_trend = trading.get("timeframe_trend", "1h")
-        market_type = trading.get("market_type", "swap")
+        pairs = self._pairs_tuple
+        interval = self._interval
 
         self.running = True
         logger.info(f"메인 루프 시작 (간격: {interval}초, 페어: {pairs})")
@@ -223,24 +284,20 @@ class MainController:
                 if self._loop_count % 6 == 0:  # 약 1분마다
                     logger.info(f"[Main] Loop Heartbeat #{self._loop_count} | Uptime: {self._loop_count * interval}s")
 
-                # 매매 가능 여부 확인
-                if not self.risk_manager.can_trade():
-                    await self._scheduled_tasks()
-                    await asyncio.sleep(interval)
-                    continue
-
-                # 세션 확인
-                if not is_trading_session(self.config):
+                # 매매 가능 여부 + 세션 확인
+                if not (
+                    self.risk_manager.can_trade()
+                    and is_trading_session(self._schedule)
+                ):
                     await self._scheduled_tasks()
                     await asyncio.sleep(interval)
                     continue
 
-                for pair in pairs:
-                    if not self.running:
-                        break
-                    await self._process_pair(
-                        pair, timeframe_main, timeframe_trend, market_type
-                    )
+                # 페어별 처리 동시 실행 (진입/청산은 _trade_lock으로 직렬화)
+                await asyncio.gather(
+                    *(self._process_pair(pair) for pair in pairs),
+                    return_exceptions=True,
+                )
 
                 # 0. 교차 검증 (Sync Check)
                 await self._sync_with_exchange()
@@ -255,127 +312,130 @@ class MainController:
 
             await asyncio.sleep(interval)
 
-    async def _process_pair(
-        self,
-        pair: str,
-        timeframe_main: str,
-        timeframe_trend: str,
-        market_type: str,
-    ) -> None:
+    async def _process_pair(self, pair: str) -> None:
         """페어별 처리 (롱+숏)"""
+        if not self.running:
+            return
         try:
-            # 1. 데이터 수집
-            df_5m = self.data_fetcher.get_candles(pair, timeframe_main)
-            df_1h = self.data_fetcher.get_candles(pair, timeframe_trend)
-
-            if df_5m is None or df_1h is None:
-                return
+            # 1. 포지션 체크 (보유 중이면 청산 판단에 5m만 사용)
+            position = self.position_tracker.get_position(pair)
 
-            # 2. 지표 계산
-            df_5m = self.indicators.calculate_all(df_5m)
-            df_1h = self.indicators.calculate_all(df_1h)
+            # 2. 데이터 수집 + 지표 계산
+            if position:
+                df_5m = await self._run_io(
+                    self.data_fetcher.get_candles, pair, self._tf_main
+                )
+                if df_5m is None:
+                    return
+                df_5m = self.indicators.calculate_all(df_5m)
+            else:
+                # 5m/1h 동시 요청
+                df_5m, df_1h = await asyncio.gather(
+                    self._run_io(self.data_fetcher.get_candles, pair, self._tf_main),
+                    self._run_io(self.data_fetcher.get_candles, pair, self._tf_trend),
+                )
+                if df_5m is None or df_1h is None:
+                    return
+                df_5m = self.indicators.calculate_all(df_5m)
+                df_1h = self.indicators.calculate_trend(df_1h)  # 최신 봉 EMA 추세만 필요
 
-            # 3. 포지션 체크
-            position = self.position_tracker.get_position(pair)
+                # 급락 감지 시 당일 매매 중단 (신규 진입 전)
+                if self.risk_manager.check_emergency(df_5m):
+                    if self.notifier:
+                        await self.notifier.notify_error(
+                            f"{pair} {self.risk_manager.stop_reason}", "EMERGENCY"
+                        )
+                    return
 
             if position:
                 # ── 고점/저점(peak_price) 업데이트 ──
-                current_price = df_5m.iloc[-1]["close"]
+                # 고점 갱신 시에만 저장 (position은 트래커가 보관 중인 dict 자체)
+                current_price = df_5m["close"].iat[-1]
                 peak_price = position.get("peak_price", position["entry_price"])
-                pos_side = position.get("position_side", "long")
-                
-                if pos_side == "long":
-                    if current_price > peak_price:
-                        self.position_tracker.update_position(pair, {"peak_price": current_price})
-                else: 
-                    if current_price < peak_price:
-                        self.position_tracker.update_position(pair, {"peak_price": current_price})
-
-                # 최신 상태로 다시 가져옴 (peak_price가 반영된 상태)
-                position = self.position_tracker.get_position(pair)
+                if (
+                    current_price > peak_price
+                    if position.get("position_side", "long") == "long"
+                    else current_price < peak_price
+                ):
+                    self.position_tracker.update_position(pair, {"peak_price": current_price})
 
                 # 청산 조건 체크
                 exit_signal = self.signal_engine.check_exit_signal(
                     pair, df_5m, position
                 )
 
-                TradeLogger.save_signal({
-                    "timestamp": exit_signal.timestamp,
-                    "pair": pair,
-                    "signal_type": exit_signal.signal_type,
-                    "score": exit_signal.score,
-                    "conditions": exit_signal.conditions,
-                    "acted": exit_signal.signal_type == "exit",
-                    "reason_skipped": (
-                        exit_signal.reason
-                        if exit_signal.signal_type != "exit"
-                        else ""
+                TradeLogger.save_signal(SignalRow(
+                    timestamp=exit_signal.timestamp,
+                    pair=pair,
+                    signal_type=exit_signal.signal_type,
+                    score=exit_signal.score,
+                    conditions=exit_signal.conditions,
+                    acted=exit_signal.signal_type == "exit",
+                    reason_skipped=(
+                        exit_signal.reason if exit_signal.signal_type != "exit" else ""
                     ),
-                })
+                ))
 
                 if exit_signal.signal_type == "exit":
-                    await self._execute_close(
-                        pair, position, exit_signal.reason, df_5m, 
-                        quantity_pct=getattr(exit_signal, "quantity_pct", 1.0)
-                    )
+                    async with self._trade_lock:
+                        await self._execute_close(
+                            pair, position, exit_signal.reason, df_5m,
+                            quantity_pct=getattr(exit_signal, "quantity_pct", 1.0)
+                        )
             else:
                 # ── 롱 신호 확인 ──
                 long_signal = self.signal_engine.check_long_signal(
                     pair, df_5m, df_1h
                 )
 
-                TradeLogger.save_signal({
-                    "timestamp": long_signal.timestamp,
-                    "pair": pair,
-                    "signal_type": long_signal.signal_type,
-                    "score": long_signal.score,
-                    "conditions": long_signal.conditions,
-                    "acted": long_signal.signal_type == "long",
-                    "reason_skipped": (
-                        long_signal.reason
-                        if long_signal.signal_type != "long"
-                        else ""
+                TradeLogger.save_signal(SignalRow(
+                    timestamp=long_signal.timestamp,
+                    pair=pair,
+                    signal_type=long_signal.signal_type,
+                    score=long_signal.score,
+                    conditions=long_signal.conditions,
+                    acted=long_signal.signal_type == "long",
+                    reason_skipped=(
+                        long_signal.reason if long_signal.signal_type != "long" else ""
                     ),
-                })
+                ))
 
-                min_score = float(
-                    self.config.get("trading", {}).get("buy_min_score", 70)
-                )
+                min_score = self._min_score
 
                 if (
                     long_signal.signal_type == "long"
                     and long_signal.score >= min_score
                 ):
-                    await self._execute_open(
-                        pair, df_5m, long_signal, "long"
-                    )
-                elif market_type in ("swap", "both"):
+                    async with self._trade_lock:
+                        await self._execute_open(
+                            pair, df_5m, long_signal, "long"
+                        )
+                elif self._market_type in ("swap", "both"):
                     # ── 숏 신호 확인 (선물 모드에서만) ──
                     short_signal = self.signal_engine.check_short_signal(
                         pair, df_5m, df_1h
                     )
 
-                    TradeLogger.save_signal({
-                        "timestamp": short_signal.timestamp,
-                        "pair": pair,
-                        "signal_type": short_signal.signal_type,
-                        "score": short_signal.score,
-                        "conditions": short_signal.conditions,
-                        "acted": short_signal.signal_type == "short",
-                        "reason_skipped": (
-                            short_signal.reason
-                            if short_signal.signal_type != "short"
-                            else ""
+                    TradeLogger.save_signal(SignalRow(
+                        timestamp=short_signal.timestamp,
+                        pair=pair,
+                        signal_type=short_signal.signal_type,
+                        score=short_signal.score,
+                        conditions=short_signal.conditions,
+                        acted=short_signal.signal_type == "short",
+                        reason_skipped=(
+                            short_signal.reason if short_signal.signal_type != "short" else ""
                         ),
-                    })
+                    ))
 
                     if (
                         short_signal.signal_type == "short"
                         and short_signal.score >= min_score
                     ):
-                        await self._execute_open(
-                            pair, df_5m, short_signal, "short"
-                        )
+                        async with self._trade_lock:
+                            await self._execute_open(
+                                pair, df_5m, short_signal, "short"
+                            )
 
         except Exception as e:
             logger.error(f"페어 처리 에러: {pair} — {e}")
@@ -388,11 +448,17 @@ class MainController:
         position_side: str,
     ) -> None:
         """롱/숏 포지션 진입 (개선된 사이징 반영)"""
-        current_price = df_5m.iloc[-1]["close"]
-        current_atr_pct = df_5m.iloc[-1].get("atr_pct", 0.0)
+        # 같은 루프에서 다른 페어가 급락으로 매매를 중단시켰을 수 있음
+        if self.risk_manager.is_stopped:
+            return
+
+        current_price = df_5m["close"].iat[-1]
+        current_atr_pct = (
+            float(df_5m["atr_pct"].iat[-1]) if "atr_pct" in df_5m.columns else 0.0
+        )
 
         # 1. 현재 계계 상태 스냅샷 (Equity, Used Margin 등)
-        snapshot = self._collect_balance_snapshot()
+        snapshot = await self._run_io(self._collect_balance_snapshot)
         total_equity = snapshot["total_value_usdt"]
         available_usdt = snapshot["cash_usdt"]
         total_used_margin = snapshot["total_used_margin"]
@@ -425,9 +491,9 @@ class MainController:
 
         # 주문 실행
         if position_side == "long":
-            trade_result = self.order_executor.open_long(pair, amount_usdt)
+            trade_result = await self._run_io(self.order_executor.open_long, pair, amount_usdt)
         else:
-            trade_result = self.order_executor.open_short(pair, amount_usdt)
+            trade_result = await self._run_io(self.order_executor.open_short, pair, amount_usdt)
 
         if not trade_result:
             logger.error(f"포지션 진입 실패: {pair} ({position_side})")
@@ -443,11 +509,12 @@ class MainController:
             trade_id=trade_result["trade_id"],
             initial_margin=trade_result["initial_margin"],
             position_side=position_side,
-            market_type=self.config["trading"].get("market_type", "swap"),
+            market_type=self._market_type,
+            entry_time_ts=time.time(),
         )
 
-        # 거래 기록
-        TradeLogger.save_trade({
+        # 거래 기록 (DB 커밋은 워커 스레드에서)
+        await self._run_io(TradeLogger.save_trade, {
             "trade_id": trade_result["trade_id"],
             "pair": pair,
             "side": trade_result["side"],
@@ -461,7 +528,7 @@ class MainController:
         })
 
         # ★ 매수 후 RiskManager 잔고 동기화 (총자산 계산 오류 방지)
-        self._sync_risk_manager_balance()
+        await self._run_io(self._sync_risk_manager_balance)
 
         # 디스코드 알림
         if self.notifier:
@@ -471,7 +538,6 @@ class MainController:
         self, pair: str, position: dict, exit_reason: str, df_5m: pd.DataFrame, quantity_pct: float = 1.0
     ) -> None:
         """포지션 청산 (부분 청산 지원)"""
-        current_price = df_5m.iloc[-1]["close"]
         full_quantity = position["quantity"]
         initial_qty = position.get("initial_quantity", full_quantity)
         
@@ -489,8 +555,8 @@ class MainController:
         position_side = position.get("position_side", "long")
 
         # 주문 실행
-        trade_result = self.order_executor.close_position(
-            pair, qty_to_close, position_side
+        trade_result = await self._run_io(
+            self.order_executor.close_position, pair, qty_to_close, position_side
         )
         if not trade_result:
             logger.error(f"포지션 청산 실패: {pair} ({exit_reason})")
@@ -504,20 +570,20 @@ class MainController:
         else:  # short
             gross_pnl_usdt = (entry_price - exit_price) * qty_to_close
 
-        if self.config.get("trading", {}).get("mode", "paper") == "paper":
+        if self._mode == "paper":
             self.order_executor.add_paper_pnl(gross_pnl_usdt)
 
-        pnl_usdt = gross_pnl_usdt - trade_result.get("fee_usdt", 0)
-        pnl_usdt -= self.risk_manager.calculate_fees(entry_price * qty_to_close)
+        # 순손익 = 총손익 - 진입 수수료(편도) - 청산 수수료(체결 결과)
+        entry_fee = entry_price * qty_to_close * self._fee_rate
+        exit_fee = trade_result.get("fee_usdt", 0.0)
+        pnl_usdt = gross_pnl_usdt - entry_fee - exit_fee
 
         if position_side == "long":
             pnl_pct = (exit_price - entry_price) / entry_price
         else:
             pnl_pct = (entry_price - exit_price) / entry_price
 
-        from datetime import datetime
-        entry_time = datetime.fromisoformat(position["entry_time"])
-        hold_minutes = (now_kst() - entry_time).total_seconds() / 60
+        hold_minutes = (time.time() - position["entry_time_ts"]) / 60.0
 
         # 포지션 상태 업데이트
         is_full_close = (qty_to_close >= full_quantity) or (quantity_pct >= 1.0)
@@ -545,10 +611,10 @@ class MainController:
             # 부분 익절도 실현 손익으로 기록
             self.risk_manager.record_trade_result(pnl_usdt, pnl_pct >= 0)
 
-        self._sync_risk_manager_balance()
+        await self._run_io(self._sync_risk_manager_balance)
 
-        # 거래 기록 저장
-        TradeLogger.save_trade({
+        # 거래 기록 저장 (DB 커밋은 워커 스레드에서)
+        await self._run_io(TradeLogger.save_trade, {
             "trade_id": position["trade_id"],
             "pair": pair,
             "side": trade_result["side"],
@@ -581,37 +647,38 @@ class MainController:
         봇 DB(PositionTracker)와 실제 거래소 포지션 교차 검증 (Strict Mode)
         """
         try:
-            exchange_positions = self.order_executor.get_all_positions_standardized()
+            exchange_positions = await self._run_io(self.order_executor.get_all_positions_standardized)
             db_positions = self.position_tracker.get_all_positions() # {pair: pos_dict}
             
+            # (pair, side) → 거래소 포지션 인덱스 (1회 구성)
+            ex_index = {(p['pair'], p['side']): p for p in exchange_positions}
+
             # 1. DB에는 있으나 거래소에는 없는 경우 (강제청산 또는 수동청산 의심)
-            for pair in list(db_positions.keys()):
-                db_pos = db_positions[pair]
-                match = next((p for p in exchange_positions if p['pair'] == pair and p['side'] == db_pos['position_side']), None)
-                
-                if not match:
-                    logger.warning(f"[Sync] 포지션 증량 감지 (Exchange에서 사라짐): {pair} ({db_pos['position_side']})")
+            for pair, db_pos in db_positions.items():
+                db_side = db_pos['position_side']
+
+                if (pair, db_side) not in ex_index:
+                    logger.warning(f"[Sync] 포지션 증량 감지 (Exchange에서 사라짐): {pair} ({db_side})")
                     if self.notifier:
                         await self.notifier.notify_sync_warning(
                             f"**⚠️ [포지션 증발 감지]**\n"
                             f"• 종목: {pair}\n"
-                            f"• 방향: {db_pos['position_side'].upper()}\n"
+                            f"• 방향: {db_side.upper()}\n"
                             f"• DB에는 존재하나 거래소에서 사라졌습니다. DB를 리셋합니다."
                         )
                     self.position_tracker.close_position(pair)
+                    self._snapshot_cache = None
 
             # 2. 거래소에는 있으나 DB에는 없는 경우 (미관리 포지션 → 즉시 청산)
-            for ex_pos in exchange_positions:
-                pair = ex_pos['pair']
-                side = ex_pos['side']
+            for (pair, side), ex_pos in ex_index.items():
                 qty = ex_pos['qty']
-                
+
                 db_pos = db_positions.get(pair)
                 if not db_pos or db_pos['position_side'] != side:
                     logger.critical(f"[Sync] 미관리 포지션 감지 및 즉시 청산: {pair} ({side}) {qty}")
                     
                     # 즉시 시장가 청산
-                    self.order_executor.close_position(pair, qty, side)
+                    await self._run_io(self.order_executor.close_position, pair, qty, side)
                     
                     if self.notifier:
                         msg = (
@@ -630,45 +697,54 @@ class MainController:
     #  스케줄 작업
     # ═══════════════════════════════════════════
     def _collect_balance_snapshot(self) -> dict:
-        """현금/보유평가/총자산 스냅샷 수집 (봇 DB 기준)"""
-        mode = self.config.get("trading", {}).get("mode", "paper")
+        """현금/보유평가/총자산 스냅샷 수집 (봇 DB 기준)
+
+        같은 루프 안의 반복 호출은 캐시를 반환한다 (진입/청산 후 무효화).
+        """
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self._loop_count:
+            return cached[1]
+
+        snapshot = self._build_balance_snapshot()
+        self._snapshot_cache = (self._loop_count, snapshot)
+        return snapshot
+
+    def _build_balance_snapshot(self) -> dict:
+        """잔고 스냅샷 실제 수집 (잔고 RPC + 현재가 조회)"""
+        mode = self._mode
         now_str = now_kst().strftime("%Y-%m-%d %H:%M:%S")
         holdings_items = []
-        total_unrealized_pnl = 0.0
-        holdings_value_usdt = 0.0
 
         # [지침 3.3] 모든 지표는 봇 DB 기준으로 계산
-        if mode == "paper":
-            paper_balance = self.order_executor.get_paper_balance()
-            wallet_balance = float(paper_balance.get("usdt", 0.0))
-        else:
-            market_type = self.config["trading"].get("market_type", "swap")
-            balances = self.data_fetcher.get_balance(market_type=market_type)
-            wallet_balance = float(balances.get("USDT", {}).get("total", 0.0))
-
-        # 봇 DB 관리 포지션만 순회
-        managed_positions = self.position_tracker.get_all_positions()
-        pairs = list(managed_positions.keys())
-        prices = self.data_fetcher.get_current_prices(pairs) if pairs else {}
-
-        for pair, pos in managed_positions.items():
-            price = prices.get(pair, pos["entry_price"])
-            pnl_info = self.position_tracker.get_unrealized_pnl(pair, price)
-            
-            if pnl_info:
-                margin = pos.get("initial_margin", 0.0)
-                eval_total = margin + pnl_info["pnl_usdt"]
-                total_unrealized_pnl += pnl_info["pnl_usdt"]
-                holdings_value_usdt += eval_total
-                
-                holdings_items.append({
-                    "symbol": f"{'SHORT_' if pos.get('position_side') == 'short' else ''}{pair.split('/')[0]}",
-                    "buy_total_usdt": margin,
-                    "eval_total_usdt": eval_total,
-                    "diff_usdt": pnl_info["pnl_usdt"],
-                    "diff_pct": (pnl_info["pnl_usdt"] / margin * 100) if margin > 0 else 0.0,
-                    "side": pos.get("position_side", "long")
-                })
+        wallet_balance = self._wallet_usdt()
+
+        # 봇 DB 관리 포지션 (열 단위 배열로 손익 일괄 계산)
+        arr = self.position_tracker.portfolio_arrays()
+        pairs = arr["pairs"]
+        prices = self.data_fetcher.get_current_prices(list(pairs)) if pairs else {}
+
+        entry = arr["entry"]
+        margin = arr["margin"]
+        price_arr = np.array(
+            [prices.get(p, entry[i]) for i, p in enumerate(pairs)], dtype=np.float64
+        )
+        pnl_arr = arr["sign"] * (price_arr - entry) * arr["qty"]
+        eval_arr = margin + pnl_arr
+        total_unrealized_pnl = float(pnl_arr.sum())
+        total_used_margin = float(margin.sum())
+
+        pair_bases = self._pair_bases
+        for pair, side, m, pnl, ev in zip(
+            pairs, arr["sides"], margin.tolist(), pnl_arr.tolist(), eval_arr.tolist()
+        ):
+            holdings_items.append({
+                "symbol": f"{'SHORT_' if side == 'short' else ''}{pair_bases.get(pair) or pair.split('/')[0]}",
+                "buy_total_usdt": m,
+                "eval_total_usdt": ev,
+                "diff_usdt": pnl,
+                "diff_pct": (pnl / m * 100) if m > 0 else 0.0,
+                "side": side,
+            })
 
         # [지침 3.3] 총자산 = 현금 + 미실현손익 (봇 DB 기준)
         total_equity = wallet_balance + total_unrealized_pnl
@@ -680,7 +756,7 @@ class MainController:
             "unrealized_pnl_usdt": total_unrealized_pnl,
             "total_value_usdt": total_equity,
             "holdings_items": holdings_items,
-            "total_used_margin": sum(item["buy_total_usdt"] for item in holdings_items)
+            "total_used_margin": total_used_margin,
         }
 
     async def _scheduled_tasks(self) -> None:
@@ -688,33 +764,26 @@ class MainController:
         if not self.notifier:
             return
 
-        conf = self.config.get("discord", {})
-        interval = self.config.get("trading", {}).get("loop_interval_seconds", 10)
-        
-        # 1. 1분 주기: 포지션 모니터링
-        interval_1m = int(conf.get("report_1m_interval_seconds", 60))
-        if (self._loop_count * interval) % interval_1m < interval:
-            await self._send_position_report_1m()
-
-        # 2. 5분 주기: 시장 스냅샷
-        interval_5m = int(conf.get("report_5m_interval_seconds", 300))
-        if (self._loop_count * interval) % interval_5m < interval:
-            await self._send_market_snapshot_5m()
-
-        # 3. 15분 주기: 성과 리포트
-        interval_15m = int(conf.get("report_15m_interval_seconds", 900))
-        if (self._loop_count * interval) % interval_15m < interval:
-            await self._send_performance_report_15m()
-
-        # 4. 1시간 주기: 종합 리포트
-        interval_1h = int(conf.get("report_1h_interval_seconds", 3600))
-        if (self._loop_count * interval) % interval_1h < interval:
-            logger.info(f"[Scheduled] 1시간 종합 리포트 전송 시작 (Loop #{self._loop_count})")
-            await self._send_hourly_report_1h()
+        # 슬롯별 마감 시각 도달 시 1회 실행 후 다음 마감 설정 (중복/누락 없음)
+        now = time.monotonic()
+        next_due = self._next_due
+        pending = []
+        for i, (period, task) in enumerate(self._sched_slots):
+            if now >= next_due[i]:
+                next_due[i] = now + period
+                pending.append(task())
+        if not pending:
+            return
+
+        # 서로 독립적인 리포트는 동시에 전송 (한 리포트 실패가 나머지를 막지 않음)
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"[Scheduled] 리포트 전송 실패: {result}")
 
     async def _send_position_report_1m(self):
         """1분 잔고 스냅샷 리포트"""
-        snapshot = self._collect_balance_snapshot()
+        snapshot = await self._run_io(self._collect_balance_snapshot)
         initial_capital = self.config.get("risk", {}).get("initial_capital", 10000.0)
         
         cash_usdt = snapshot["cash_usdt"]
@@ -735,27 +804,33 @@ class MainController:
 
     async def _send_market_snapshot_5m(self):
         """5분 시장 스냅샷"""
-        pairs = self.config["trading"].get("pairs", [])
-        prices = self.data_fetcher.get_current_prices(pairs)
-        markets = {p.split('/')[0]: {"price": prices.get(p, 0), "chg_5m": 0.0, "chg_1h": 0.0} for p in pairs}
+        pairs = self._pairs_tuple
+        prices = await self._run_io(self.data_fetcher.get_current_prices, list(pairs))
+        markets = {
+            base: {"price": prices.get(p, 0), "chg_5m": 0.0, "chg_1h": 0.0}
+            for p, base in self._pair_bases.items()
+        }
         snapshot = {"time": now_kst().strftime("%Y-%m-%d %H:%M:%S"), "markets": markets, "signals": {}}
         await self.notifier.notify_market_snapshot_5m(snapshot)
 
     async def _send_performance_report_15m(self):
         """15분 성과 리포트"""
         rm = self.risk_manager
-        snapshot = self._collect_balance_snapshot()
+        snapshot = await self._run_io(self._collect_balance_snapshot)
         total_assets = snapshot["total_value_usdt"]
         margin_ratio = (snapshot.get("total_used_margin", 0) / total_assets * 100) if total_assets > 0 else 0.0
         
+        daily = rm.get_daily_summary()
+        trades = daily["total_trades"]
+
         stats = {
             "time": snapshot["time"],
-            "realized_pnl": rm.daily_pnl_usdt,
+            "realized_pnl": daily["daily_pnl_usdt"],
             "unrealized_pnl": snapshot.get("unrealized_pnl_usdt", 0.0),
-            "trades": rm.daily_trades,
-            "wins": max(0, rm.daily_trades - rm.consecutive_losses),
-            "losses": rm.consecutive_losses,
-            "win_rate": (rm.daily_trades - rm.consecutive_losses) / rm.daily_trades * 100 if rm.daily_trades > 0 else 0,
+            "trades": trades,
+            "wins": daily["wins"],
+            "losses": daily["losses"],
+            "win_rate": daily["wins"] / trades * 100 if trades > 0 else 0,
             "total_assets": total_assets,
             "free_balance": snapshot["cash_usdt"],
             "margin_ratio": margin_ratio,
@@ -766,22 +841,23 @@ class MainController:
 
     async def _send_hourly_report_1h(self):
         """1시간 주기 종합 리포트 전송"""
+        logger.info(f"[Scheduled] 1시간 종합 리포트 전송 시작 (Loop #{self._loop_count})")
         now = now_kst()
         one_hour_ago = now - timedelta(hours=1)
         
-        start_str = one_hour_ago.strftime("%Y-%m-%d %H:%M:%S")
-        end_str = now.strftime("%Y-%m-%d %H:%M:%S")
-        
-        stats = TradeLogger.get_detailed_stats(start_str, end_str)
-        snapshot = self._collect_balance_snapshot()
+        # 저장된 exit_time(isoformat)과 사전식 비교가 맞도록 동일 형식 사용
+        start_str = one_hour_ago.isoformat()
+        end_str = now.isoformat()
         
-        # 시장 환경 데이터 (BTC 기준)
+        # 통계 집계(DB) + 잔고 스냅샷 + 시장 환경 데이터(BTC 기준) 동시 조회
+        stats, snapshot, ticker = await asyncio.gather(
+            self._run_io(TradeLogger.get_detailed_stats, start_str, end_str),
+            self._run_io(self._collect_balance_snapshot),
+            self._run_io(self.data_fetcher.get_ticker, "BTC/USDT:USDT"),
+        )
         btc_info = {"chg_24h": 0.0, "volume_ratio": 1.0}
-        try:
-            ticker = self.data_fetcher.get_ticker("BTC/USDT:USDT")
-            if ticker:
-                btc_info["chg_24h"] = ticker.get("percentage", 0.0)
-        except: pass
+        if ticker:
+            btc_info["chg_24h"] = ticker.get("percentage") or 0.0
 
         report_data = {
             "time": now.strftime("%Y-%m-%d %H:%M:%S"),
@@ -794,9 +870,10 @@ class MainController:
     async def _daily_summary_task(self):
         """매일 23:55에 당일 요약 생성"""
         today = now_kst().strftime("%Y-%m-%d")
-        stats = TradeLogger.calculate_daily_stats(today)
-        
-        snapshot = self._collect_balance_snapshot()
+        stats, snapshot = await asyncio.gather(
+            self._run_io(TradeLogger.calculate_daily_stats, today),
+            self._run_io(self._collect_balance_snapshot),
+        )
         stats["balance_start"] = self.config.get("risk", {}).get("initial_capital", 10000.0)
         stats["balance_end"] = snapshot["total_value_usdt"]
         
@@ -804,17 +881,30 @@ class MainController:
         uptime = now_kst() - self._start_time
         stats["day_num"] = uptime.days + 1
 
-        TradeLogger.save_daily_summary(today, stats)
-
+        # DB 저장과 리포트 전송은 서로 독립적이므로 동시 진행
+        pending = [self._run_io(TradeLogger.save_daily_summary, today, stats)]
         if self.notifier:
-            await self.notifier.notify_daily_report({"date": today, **stats})
+            pending.append(self.notifier.notify_daily_report({"date": today, **stats}))
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"[Bot] 일일 요약 처리 실패: {result}")
 
         logger.info(f"[Bot] 📊 일일 요약 완료: {today}")
 
+    async def _db_maintenance_task(self):
+        """매시간 오래된 신호 정리 + WAL 체크포인트"""
+        days = int(self.config.get("database", {}).get("signal_retention_days", 30))
+        try:
+            await self._run_io(TradeLogger.prune_signals, days)
+            await self._run_io(TradeLogger.maintenance)
+        except Exception as e:
+            logger.error(f"[Bot] DB 정리 오류: {e}")
+
     # ═══════════════════════════════════════════
     #  그레이스풀 셧다운
     # ═══════════════════════════════════════════
-    def _signal_handler(self, signum, frame) -> None:
+    def _signal_handler(self, signum, frame=None) -> None:
         """SIGINT/SIGTERM 핸들러"""
         if self._shutdown_requested:
             return
@@ -823,6 +913,30 @@ class MainController:
         logger.warning(f"시그널 수신: {sig_name} — 셧다운 시작")
         self.running = False
 
+        # 주문 처리 중이 아니면 메인 루프를 즉시 취소 (대기 중인 sleep/I/O를 기다리지 않음)
+        # 주문 처리 중이면 해당 거래의 상태 반영까지 마친 뒤 루프가 스스로 종료
+        task = self._main_task
+        if task is not None and not task.done() and not self._trade_lock.locked():
+            task.cancel()
+
+    def _install_signal_handlers(self) -> None:
+        """이벤트 루프에 시그널 핸들러 등록 (Windows는 signal.signal로 대체)"""
+        if sys.platform == "win32":
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            return
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._signal_handler, sig)
+
+    @staticmethod
+    def _finalize_db(today: str, balance_end: float) -> None:
+        """종료 시 DB 정리 — 일일 요약 저장, WAL 체크포인트, 풀 연결 종료"""
+        TradeLogger.save_daily_summary(today, {"balance_end": balance_end})
+        TradeLogger.maintenance()
+        reset_pool()  # 풀 연결 종료 (PRAGMA optimize)
+
     async def shutdown(self) -> None:
         """그레이스풀 셧다운"""
         if self._shutdown_completed:
@@ -838,16 +952,24 @@ class MainController:
                 "(포지션/종이잔고 상태는 파일로 유지됨)"
             )
 
+        # DB 마무리(일일 요약 + WAL 체크포인트)와 종료 알림은 서로 독립적이므로 동시 진행
+        # 일일 요약의 거래 집계는 SQL에서 계산되므로 잔고만 전달
         today = now_kst().strftime("%Y-%m-%d")
-        stats = TradeLogger.calculate_daily_stats(today)
-        stats["balance_end"] = self.risk_manager.current_balance
-        TradeLogger.save_daily_summary(today, stats)
+        pending = [self._run_io(
+            self._finalize_db, today, self.risk_manager.current_balance
+        )]
+        if self.notifier:
+            pending.append(self.notifier.notify_shutdown(self.risk_manager.get_status()))
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"[Bot] 셧다운 처리 오류: {result}")
 
         if self.notifier:
-            status = self.risk_manager.get_status()
-            await self.notifier.notify_shutdown(status)
             await self.notifier.close()
 
+        if self._io_pool:
+            self._io_pool.shutdown(wait=False)
+
         self._shutdown_completed = True
         logger.info("═══ 봇 셧다운 완료 ═══")
 
@@ -860,11 +982,13 @@ class MainController:
             logger.critical("초기화 실패 — 종료")
             return
 
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._main_task = asyncio.create_task(self.main_loop())
+        self._install_signal_handlers()
 
         try:
-            await self.main_loop()
+            await self._main_task
+        except asyncio.CancelledError:
+            logger.info("메인 루프 취소됨")
         except KeyboardInterrupt:
             logger.info("KeyboardInterrupt 수신")
         finally:
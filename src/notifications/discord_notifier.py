@@ -4,14 +4,131 @@ from __future__ import annotations
 
 import aiohttp
 import asyncio
-from datetime import datetime
+import heapq
+import io
+import itertools
+import json
+import random
+import time
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from typing import Final
 from loguru import logger
-from src.utils.helpers import get_env, format_usdt, format_pct
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+from src.utils.helpers import get_env, format_usdt
+
+# Discord 메시지 1건당 한도: embed 10개, embed 전체 글자 수 6000자
+_BATCH_MAX_EMBEDS = 10
+_BATCH_MAX_CHARS = 6000
+# 같은 웹훅으로 가는 embed를 모으는 대기 시간(초)
+_BATCH_WINDOW = 0.2
+# 전송 실패 시 최대 시도 횟수 / 지수 백오프 기본·상한(초)
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE = 0.5
+_BACKOFF_MAX = 30.0
+# 웹훅별 전송 큐 최대 길이 / BLOCK_THEN_DROP 정책의 적재 대기 한도(초)
+_QUEUE_MAXSIZE = 256
+_PUT_TIMEOUT = 5.0
+# 웹훅별 전용 연결 풀 (버스트 사이에도 TLS 연결 재사용, 채널 간 연결 경쟁 없음)
+_CONN_LIMIT_PER_WEBHOOK = 2
+_KEEPALIVE_TIMEOUT = 120
+_DNS_CACHE_TTL = 600
+_REQUEST_TIMEOUT = 10
+# 알림 본문 구분선 (거래 알림용 / 리포트용)
+SEP: Final[str] = "**━━━━━━━━━━━━━━━━━━━**"
+REPORT_SEP: Final[str] = "━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# 유효한 웹훅 URL 접두사
+_WEBHOOK_PREFIX: Final[str] = "https://discord.com/api/webhooks/"
+
+# POST 공통 헤더 (본문은 미리 직렬화한 bytes로 전송)
+PAYLOAD_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps_payload(payload: dict) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class QueuePolicy(Enum):
+    """전송 큐가 가득 찼을 때의 처리 방식"""
+    BLOCK = "block"                      # 빈자리 날 때까지 대기 (유실 없음)
+    DROP_OLDEST = "drop_oldest"          # 가장 낮은 우선순위 중 가장 오래된 알림을 버리고 적재
+    BLOCK_THEN_DROP = "block_then_drop"  # _PUT_TIMEOUT 대기 후 DROP_OLDEST
+
+
+class Priority(IntEnum):
+    """알림 전송 우선순위 (작을수록 먼저 전송)"""
+    EMERGENCY = 0  # 청산 임박, 에러, 포지션 불일치
+    SIGNAL = 1     # 매수/매도 체결
+    REPORT = 2     # 1시간/일일 리포트
+    SYSTEM = 3     # 하트비트, 주기 스냅샷, 시스템 메시지
+
+
+# 워커 종료 신호 우선순위 (대기 중인 알림을 모두 보낸 뒤 처리)
+_STOP_PRIORITY = len(Priority)
+
+
+class _NotifyQueue(asyncio.PriorityQueue):
+    """(우선순위, 순번, embed) 항목 큐 — 포화 시 가장 덜 중요한 항목 교체 지원"""
+
+    def replace_lowest(self, item: tuple) -> tuple:
+        """가장 낮은 우선순위 중 가장 오래된 항목을 item으로 교체하고 버린 항목 반환
+
+        item이 큐의 어떤 항목보다도 우선순위가 낮으면 item 자체를 버린다.
+        종료 신호는 버리지 않는다.
+        """
+        heap = self._queue
+        victim = -1
+        for i, queued in enumerate(heap):
+            if queued[0] >= _STOP_PRIORITY:
+                continue
+            if victim < 0 or (queued[0], -queued[1]) > (heap[victim][0], -heap[victim][1]):
+                victim = i
+        if victim < 0 or item[0] > heap[victim][0]:
+            return item
+        dropped = heap[victim]
+        heap[victim] = item
+        heapq.heapify(heap)
+        return dropped
+
+
+def _embed_size(embed: dict) -> int:
+    """Discord 글자 수 한도 계산 대상(title/description/fields/footer) 길이"""
+    size = len(embed.get("title") or "") + len(embed.get("description") or "")
+    for f in embed.get("fields") or ():
+        size += len(f.get("name", "")) + len(f.get("value", ""))
+    footer = embed.get("footer")
+    if footer:
+        size += len(footer.get("text", ""))
+    return size
+
+
+# embed timestamp 캐시 (초 단위, UTC) — 같은 초에 만든 embed는 문자열 재사용
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """현재 UTC 시각 ISO 8601 문자열 (초 단위 캐시)"""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
 
 
 class DiscordNotifier:
     """디스코드 Webhook 기반 알림 전송"""
 
+    # 검증을 통과한 웹훅 URL (재생성 시 재검증 생략)
+    _validated_urls: set[str] = set()
+
     def __init__(self, config: dict):
         self.webhook_signal = self._validate_webhook(
             get_env("DISCORD_WEBHOOK_SIGNAL"), "DISCORD_WEBHOOK_SIGNAL"
@@ -26,51 +143,238 @@ class DiscordNotifier:
             get_env("DISCORD_WEBHOOK_SYSTEM"), "DISCORD_WEBHOOK_SYSTEM"
         )
         self.colors = config["discord"]["embed_colors"]
-        self._session: aiohttp.ClientSession | None = None
+
+        # 알림 유형별 고정 필드 (호출 시 동적 필드만 덧붙여 embed 구성)
+        c = self.colors
+        self._tmpl_buy = {"color": c["buy"]}
+        self._tmpl_sell_profit = {"color": c["sell_profit"]}
+        self._tmpl_sell_loss = {"color": c["sell_loss"]}
+        self._tmpl_system = {"color": c["system"]}
+        self._tmpl_error = {"color": c["emergency"]}
+        self._tmpl_liquidation = {"title": "🚨 [긴급] 강제청산 임박", "color": c["emergency"]}
+        self._tmpl_sync_warning = {"title": "⚠️ [위험] 포지션 불일치 감지", "color": c["emergency"]}
+        self._tmpl_unmanaged = {"title": "⚠️ [주의] 미관리 포지션 감지", "color": c["emergency"]}
+        self._tmpl_shutdown = {"title": "⚙️ [시스템] 봇 종료", "color": c["system"]}
+        self._tmpl_heartbeat = {"title": "💓 [하트비트] 봇 생존 확인", "color": 0x2ecc71}
+        self._footers: dict[str, dict] = {}  # 매매 모드 → footer
+        # 채널별 큐 포화 정책 (같은 URL을 여러 채널이 쓰면 뒤쪽의 엄격한 정책 적용)
+        self._policies: dict[str, QueuePolicy] = {
+            self.webhook_system: QueuePolicy.DROP_OLDEST,
+            self.webhook_report: QueuePolicy.BLOCK_THEN_DROP,
+            self.webhook_signal: QueuePolicy.BLOCK_THEN_DROP,
+            self.webhook_error: QueuePolicy.BLOCK,
+        }
+        # 채널별 기본 우선순위 (같은 URL을 여러 채널이 쓰면 뒤쪽의 높은 우선순위 적용)
+        self._priorities: dict[str, Priority] = {
+            self.webhook_system: Priority.SYSTEM,
+            self.webhook_report: Priority.REPORT,
+            self.webhook_signal: Priority.SIGNAL,
+            self.webhook_error: Priority.EMERGENCY,
+        }
+        self._seq = itertools.count()  # 같은 우선순위 내 FIFO 보장용 순번
+        self._dropped = 0
+        # 웹훅 URL별 HTTP 세션 (한 채널의 429/지연이 다른 채널 연결을 점유하지 않음)
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        # 웹훅 URL별 전송 큐 + 묶음 전송 워커 (첫 전송 시 생성)
+        self._queues: dict[str, _NotifyQueue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        # 웹훅 URL별 레이트리밋 상태 (남은 요청 수, 리셋 시각 monotonic)
+        self._buckets: dict[str, tuple[float, float]] = {}
 
     @staticmethod
     def _validate_webhook(url: str, key: str) -> str:
+        if url in DiscordNotifier._validated_urls:
+            return url
         if (
-            not url.startswith("https://discord.com/api/webhooks/")
+            not url
+            or not url.startswith(_WEBHOOK_PREFIX)
             or "..." in url
         ):
             raise ValueError(f"{key} 값이 비어있거나 placeholder 입니다.")
+        DiscordNotifier._validated_urls.add(url)
         return url
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    async def _get_session(self, webhook_url: str) -> aiohttp.ClientSession:
+        session = self._sessions.get(webhook_url)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_CONN_LIMIT_PER_WEBHOOK,
+                limit_per_host=_CONN_LIMIT_PER_WEBHOOK,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT),
+            )
+            self._sessions[webhook_url] = session
+        return session
 
     async def close(self):
-        """내부 HTTP 세션 정리"""
-        if self._session is not None and not self._session.closed:
-            await self._session.close()
-        self._session = None
-
-    async def _send_webhook(self, webhook_url: str, embed: dict):
-        """Webhook으로 Embed 메시지 전송"""
-        payload = {"embeds": [embed]}
+        """대기 중인 알림 전송 후 내부 HTTP 세션 정리"""
+        workers = [t for t in self._workers.values() if not t.done()]
+        for url, task in self._workers.items():
+            if not task.done():
+                await self._queues[url].put((_STOP_PRIORITY, next(self._seq), None))
+        if workers:
+            done, pending = await asyncio.wait(workers, timeout=15)
+            for task in pending:
+                task.cancel()
+        self._queues.clear()
+        self._workers.clear()
+
+        sessions = [s for s in self._sessions.values() if not s.closed]
+        self._sessions.clear()
+        if sessions:
+            await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+    def _get_queue(self, webhook_url: str) -> _NotifyQueue:
+        queue = self._queues.get(webhook_url)
+        if queue is None:
+            queue = self._queues[webhook_url] = _NotifyQueue(maxsize=_QUEUE_MAXSIZE)
+            self._workers[webhook_url] = asyncio.create_task(
+                self._webhook_worker(webhook_url, queue)
+            )
+        return queue
+
+    def stats(self) -> dict:
+        """전송 대기 중인 embed 수 / 큐 포화로 버린 embed 누적 수"""
+        return {
+            "queued": sum(q.qsize() for q in self._queues.values()),
+            "dropped": self._dropped,
+        }
+
+    async def _send_webhook(
+        self, webhook_url: str, embed: dict, priority: Priority | None = None
+    ):
+        """Embed를 웹훅별 전송 큐에 적재 (워커가 우선순위순으로 묶어서 전송, 포화 시 채널 정책 적용)"""
+        queue = self._get_queue(webhook_url)
+        if priority is None:
+            priority = self._priorities.get(webhook_url, Priority.SYSTEM)
+        item = (priority, next(self._seq), embed)
+        policy = self._policies.get(webhook_url, QueuePolicy.BLOCK)
+        if policy is QueuePolicy.BLOCK:
+            await queue.put(item)
+            return
+        if policy is QueuePolicy.BLOCK_THEN_DROP:
+            try:
+                await asyncio.wait_for(queue.put(item), _PUT_TIMEOUT)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+        try:
+            queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+        queue.replace_lowest(item)
+        self._dropped += 1
+        logger.warning(
+            f"[Discord] 전송 큐 포화 — 알림 1건 버림 (누적 {self._dropped}건)"
+        )
+
+    async def _webhook_worker(self, webhook_url: str, queue: _NotifyQueue):
+        """큐에서 우선순위가 높은 embed부터 최대 _BATCH_WINDOW 동안 모아 한 번에 POST (None = 종료)"""
+        loop = asyncio.get_running_loop()
+        carry = None
+        while True:
+            embed = carry if carry is not None else (await queue.get())[2]
+            carry = None
+            if embed is None:
+                return
+
+            embeds = [embed]
+            size = _embed_size(embed)
+            stop = False
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(embeds) < _BATCH_MAX_EMBEDS:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = (await asyncio.wait_for(queue.get(), remaining))[2]
+                except asyncio.TimeoutError:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                n = _embed_size(nxt)
+                if size + n > _BATCH_MAX_CHARS:
+                    carry = nxt  # 글자 수 한도 초과분은 다음 묶음으로
+                    break
+                embeds.append(nxt)
+                size += n
+
+            await self._post(webhook_url, embeds)
+            if stop:
+                return
+
+    async def _wait_bucket(self, webhook_url: str):
+        """남은 요청 수가 0이면 리셋 시각까지 미리 대기 (429 왕복 회피)"""
+        remaining, reset_at = self._buckets.get(webhook_url, (1.0, 0.0))
+        if remaining <= 0:
+            delay = reset_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay + random.uniform(0, 0.1))
+
+    def _update_bucket(self, webhook_url: str, headers) -> None:
+        """응답 헤더(X-RateLimit-Remaining / Reset-After)로 버킷 갱신"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
         try:
-            session = await self._get_session()
-            async with session.post(
-                webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 204:
-                    logger.debug("[Discord] 알림 전송 성공")
-                elif resp.status == 429:
-                    retry_after = (await resp.json()).get("retry_after", 1)
-                    logger.warning(f"[Discord] Rate limit — {retry_after}s 대기")
-                    await asyncio.sleep(retry_after)
-                    await self._send_webhook(webhook_url, embed)
-                else:
-                    body = await resp.text()
-                    logger.error(f"[Discord] 전송 실패 ({resp.status}): {body}")
-        except Exception as e:
-            logger.error(f"[Discord] 전송 예외: {e}")
+            self._buckets[webhook_url] = (
+                float(remaining),
+                time.monotonic() + float(reset_after),
+            )
+        except ValueError:
+            pass
+
+    async def _post(self, webhook_url: str, embeds: list[dict]):
+        """Webhook으로 Embed 메시지 묶음 전송 (429는 대기 후, 5xx/예외는 백오프 후 재시도)"""
+        body = _dumps_payload({"embeds": embeds})  # 재시도 시에도 1회만 직렬화
+        for attempt in range(_MAX_ATTEMPTS):
+            await self._wait_bucket(webhook_url)
+            try:
+                session = await self._get_session(webhook_url)
+                async with session.post(
+                    webhook_url,
+                    data=body,
+                    headers=PAYLOAD_HEADERS,
+                ) as resp:
+                    self._update_bucket(webhook_url, resp.headers)
+                    if resp.status in (200, 204):
+                        logger.debug("[Discord] 알림 전송 성공")
+                        return
+                    if resp.status == 429:
+                        try:
+                            data = await resp.json(content_type=None)
+                            retry_after = float(data.get("retry_after", 1))
+                        except Exception:
+                            retry_after = float(resp.headers.get("Retry-After", 1))
+                        logger.warning(f"[Discord] Rate limit — {retry_after}s 대기")
+                        self._buckets[webhook_url] = (0.0, time.monotonic() + retry_after)
+                        continue
+                    text = await resp.text()
+                    logger.error(f"[Discord] 전송 실패 ({resp.status}): {text}")
+                    if resp.status < 500:
+                        return  # 요청 자체 오류는 재시도해도 동일
+            except Exception as e:
+                logger.error(f"[Discord] 전송 예외: {e}")
+
+            if attempt + 1 < _MAX_ATTEMPTS:
+                backoff = min(_BACKOFF_MAX, _BACKOFF_BASE * (2 ** attempt))
+                await asyncio.sleep(backoff + random.uniform(0, backoff / 2))
+
+        logger.error(f"[Discord] {_MAX_ATTEMPTS}회 시도 후 전송 포기 (embed {len(embeds)}건)")
+
+    def _footer(self, mode: str) -> dict:
+        footer = self._footers.get(mode)
+        if footer is None:
+            footer = self._footers[mode] = {"text": f"Mode: {mode}"}
+        return footer
 
     # ── 알림 유형별 메서드 ──
 
@@ -86,23 +390,22 @@ class DiscordNotifier:
         
         side_emoji = "✅" if position_side == "long" else "❌"
         side_label = "롱" if position_side == "long" else "숏"
-        color = self.colors["buy"]
 
         embed = {
+            **self._tmpl_buy,
             "title": f"📌 포지션 진입 | {pair}",
-            "color": color,
             "description": (
-                f"**━━━━━━━━━━━━━━━━━━━**\n"
+                f"{SEP}\n"
                 f"**{side_emoji} {side_label} 진입 | {pair} | {price:,.2f}**\n"
                 f"   레버리지: {leverage}x | 수량: {qty:.6f}\n"
                 f"   진입가: {price:,.2f} | 목표가: {tp:,.2f}\n"
                 f"   손절가: {sl:,.2f}\n"
                 f"   마진: {format_usdt(price * qty / leverage)}"
             ),
-            "timestamp": datetime.utcnow().isoformat(),
-            "footer": {"text": f"Mode: {trade_info.get('mode', 'paper')}"},
+            "timestamp": _iso_now(),
+            "footer": self._footer(trade_info.get("mode", "paper")),
         }
-        await self._send_webhook(self.webhook_signal, embed)
+        await self._send_webhook(self.webhook_signal, embed, Priority.SIGNAL)
 
     async def notify_sell(
         self,
@@ -121,242 +424,248 @@ class DiscordNotifier:
         is_profit = pnl_pct >= 0
         emoji = "✅" if is_profit else "❌"
         side_label = "롱" if position_side == "long" else "숏"
-        color = self.colors["sell_profit"] if is_profit else self.colors["sell_loss"]
 
         embed = {
+            **(self._tmpl_sell_profit if is_profit else self._tmpl_sell_loss),
             "title": f"📌 포지션 청산 | {pair}",
-            "color": color,
             "description": (
-                f"**━━━━━━━━━━━━━━━━━━━**\n"
+                f"{SEP}\n"
                 f"**{emoji} {side_label} 청산 | {pair} | {exit_price:,.2f}**\n"
                 f"   진입가: {entry_price:,.2f} → 청산가: {exit_price:,.2f}\n"
-                f"   **PnL: {pnl_usdt:+,.2f} USDT ({format_pct(pnl_pct * 100)})**\n"
+                f"   **PnL: {pnl_usdt:+,.2f} USDT ({pnl_pct * 100:+.2f}%)**\n"
                 f"   보유시간: {int(hold_minutes // 60)}h {int(hold_minutes % 60)}m\n"
                 f"   사유: {exit_reason}"
             ),
-            "timestamp": datetime.utcnow().isoformat(),
-            "footer": {"text": f"Mode: {trade_info.get('mode', 'paper')}"},
+            "timestamp": _iso_now(),
+            "footer": self._footer(trade_info.get("mode", "paper")),
         }
-        await self._send_webhook(self.webhook_signal, embed)
+        await self._send_webhook(self.webhook_signal, embed, Priority.SIGNAL)
 
     async def notify_liquidation_warning(self, pos_info: dict):
         """강제청산 임박 경고"""
         embed = {
-            "title": "🚨 [긴급] 강제청산 임박",
-            "color": self.colors["emergency"],
+            **self._tmpl_liquidation,
             "description": (
-                f"**━━━━━━━━━━━━━━━━━━━**\n"
+                f"{SEP}\n"
                 f"**{pos_info['pair']} {pos_info['side'].upper()} | 청산가까지 {pos_info['dist']:.1f}% 남음**\n"
                 f"현재가: {pos_info['current_price']:,.2f} | 청산가: {pos_info['liq_price']:,.2f}\n"
                 f"마진비율: {pos_info['margin_ratio']:.1f}%"
             ),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_error, embed)
+        await self._send_webhook(self.webhook_error, embed, Priority.EMERGENCY)
 
     async def notify_position_report_1m(self, stats: dict):
         """1분 주기 잔고 스냅샷 리포트 — 사용자 상세 요청 스타일"""
-        lines = [
-            "💼 **잔고 스냅샷**",
-            "**💰 총자산**",
-            f"{stats['total_assets']:,.2f} USDT ({format_pct(stats['total_pnl_pct'] * 100)})",
-            "",
-            "**💵 현금**",
-            f"{stats['cash_usdt']:,.2f} USDT",
-            "",
-            "**📦 평가총액**",
-            f"{stats['eval_total_usdt']:,.2f} USDT ({stats['unrealized_pnl_usdt']:+,.2f} USDT, {format_pct(stats['unrealized_pnl_pct'])})",
-            "",
-            "**🧾 종목별 현황**"
-        ]
-        
+        buf = io.StringIO()
+        w = buf.write
+        w("💼 **잔고 스냅샷**\n")
+        w("**💰 총자산**\n")
+        w(f"{stats['total_assets']:,.2f} USDT ({stats['total_pnl_pct'] * 100:+.2f}%)\n\n")
+        w("**💵 현금**\n")
+        w(f"{stats['cash_usdt']:,.2f} USDT\n\n")
+        w("**📦 평가총액**\n")
+        w(f"{stats['eval_total_usdt']:,.2f} USDT ({stats['unrealized_pnl_usdt']:+,.2f} USDT, {stats['unrealized_pnl_pct']:+.2f}%)\n\n")
+        w("**🧾 종목별 현황**\n")
+
         holdings = stats.get("holdings", [])
         if not holdings:
-            lines.append("• 없음")
-        else:
-            for h in holdings:
-                lines.append(f"• {h['symbol']}: 평가 {h['eval_usdt']:,.2f} USDT | 손익 {format_pct(h['pnl_pct'])}")
-        
-        lines.append(f"\nTime: {stats['time']}")
+            w("• 없음\n")
+        for h in holdings:
+            w(f"• {h['symbol']}: 평가 {h['eval_usdt']:,.2f} USDT | 손익 {h['pnl_pct']:+.2f}%\n")
+
+        w(f"\nTime: {stats['time']}")
 
         embed = {
-            "description": "\n".join(lines),
-            "color": self.colors["system"],
+            **self._tmpl_system,
+            "description": buf.getvalue(),
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
 
     async def notify_market_snapshot_5m(self, snapshot: dict):
         """5분 주기 시장 스냅샷"""
-        lines = [
-            "📈 [5분 시장 스냅샷]",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            f"⏰ {snapshot['time']} KST\n",
-            "📊 시장 현황"
-        ]
-        
+        buf = io.StringIO()
+        w = buf.write
+        w("📈 [5분 시장 스냅샷]\n")
+        w(f"{REPORT_SEP}\n")
+        w(f"⏰ {snapshot['time']} KST\n\n")
+        w("📊 시장 현황")
         for k, v in snapshot['markets'].items():
-            lines.append(f" {k}: {v['price']:,.2f} (5m: {v['chg_5m']:+.2f}% | 1h: {v['chg_1h']:+.2f}%)")
-            
-        lines.append("\n📉 전략 시그널")
+            w(f"\n {k}: {v['price']:,.2f} (5m: {v['chg_5m']:+.2f}% | 1h: {v['chg_1h']:+.2f}%)")
+
+        w("\n\n📉 전략 시그널")
         for k, v in snapshot['signals'].items():
-            lines.append(f" {k}: RSI {v['rsi']:.1f} | {v['trend']} | {v['bb']}")
-            
+            w(f"\n {k}: RSI {v['rsi']:.1f} | {v['trend']} | {v['bb']}")
+
         embed = {
-            "description": "\n".join(lines),
-            "color": self.colors["system"],
-            "timestamp": datetime.utcnow().isoformat(),
+            **self._tmpl_system,
+            "description": buf.getvalue(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
 
     async def notify_performance_report_15m(self, stats: dict):
         """15분 성과 리포트"""
-        lines = [
-            "📊 [15분 성과 리포트]",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            f"⏰ {stats['time']} KST\n",
-            "♜ 세션 성과 (오늘)",
-            f"  실현 PnL: {stats['realized_pnl']:+,.2f} USDT",
-            f"  미실현 PnL: {stats['unrealized_pnl']:+,.2f} USDT",
-            f"  거래 횟수: {stats['trades']}회 (승: {stats['wins']} | 패: {stats['losses']})",
-            f"  승률: {stats['win_rate']:.1f}%\n",
-            "📊 자산 현황",
-            f"  총 자산: {stats['total_assets']:,.2f} USDT",
-            f"  가용 잔고: {stats['free_balance']:,.2f} USDT",
-            f"  마진 비율: {stats['margin_ratio']:.1f}%\n",
-            "📉 드로다운",
-            f"  오늘 최대 DD: {stats['max_dd']:.1f}%",
-            f"  연속 손실: {stats['consec_losses']}회"
-        ]
-        
+        buf = io.StringIO()
+        w = buf.write
+        w("📊 [15분 성과 리포트]\n")
+        w(f"{REPORT_SEP}\n")
+        w(f"⏰ {stats['time']} KST\n\n")
+        w("♜ 세션 성과 (오늘)\n")
+        w(f"  실현 PnL: {stats['realized_pnl']:+,.2f} USDT\n")
+        w(f"  미실현 PnL: {stats['unrealized_pnl']:+,.2f} USDT\n")
+        w(f"  거래 횟수: {stats['trades']}회 (승: {stats['wins']} | 패: {stats['losses']})\n")
+        w(f"  승률: {stats['win_rate']:.1f}%\n\n")
+        w("📊 자산 현황\n")
+        w(f"  총 자산: {stats['total_assets']:,.2f} USDT\n")
+        w(f"  가용 잔고: {stats['free_balance']:,.2f} USDT\n")
+        w(f"  마진 비율: {stats['margin_ratio']:.1f}%\n\n")
+        w("📉 드로다운\n")
+        w(f"  오늘 최대 DD: {stats['max_dd']:.1f}%\n")
+        w(f"  연속 손실: {stats['consec_losses']}회")
+
         embed = {
-            "description": "\n".join(lines),
-            "color": self.colors["system"],
-            "timestamp": datetime.utcnow().isoformat(),
+            **self._tmpl_system,
+            "description": buf.getvalue(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
 
-    async def notify_hourly_report_1h(self, stats_pkg: dict):
-        """1시간 주기 종합 리포트 — 사용자 상세 요청 스타일"""
+    @staticmethod
+    def _render_hourly_report(stats_pkg: dict) -> str:
+        """1시간 리포트 본문 생성 (순수 함수 — 실행기 스레드에서 호출)"""
         stats = stats_pkg["stats"]
         snap = stats_pkg["snapshot"]
         market = stats_pkg["market"]
-        
-        lines = [
-            "📋 **[1시간 종합 리포트]**",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            f"⏰ {stats_pkg['time']} KST\n",
-            "═══ **거래 요약 (최근 1시간)** ═══",
-            f" 총 거래: {stats['total_trades']}회",
-            f" 실현 손익: {stats['total_pnl']:+,.2f} USDT",
-            f" 수수료 합계: {stats['total_fees']:-.2f} USDT",
-            f" 펀딩비 합계: {stats['total_funding']:-.2f} USDT",
-            f" **순이익: {stats['net_pnl']:+,.2f} USDT**\n",
-            "═══ **페어별 손익** ═══"
-        ]
-        
+
+        buf = io.StringIO()
+        w = buf.write
+        w("📋 **[1시간 종합 리포트]**\n")
+        w(f"{REPORT_SEP}\n")
+        w(f"⏰ {stats_pkg['time']} KST\n\n")
+        w("═══ **거래 요약 (최근 1시간)** ═══\n")
+        w(f" 총 거래: {stats['total_trades']}회\n")
+        w(f" 실현 손익: {stats['total_pnl']:+,.2f} USDT\n")
+        w(f" 수수료 합계: {stats['total_fees']:-.2f} USDT\n")
+        w(f" 펀딩비 합계: {stats['total_funding']:-.2f} USDT\n")
+        w(f" **순이익: {stats['net_pnl']:+,.2f} USDT**\n\n")
+        w("═══ **페어별 손익** ═══\n")
+
         pair_stats = stats.get("pair_stats", {})
         if not pair_stats:
-            lines.append(" (거래 없음)")
-        else:
-            for pair, p_stat in pair_stats.items():
-                emoji = " ⚠️" if p_stat["pnl"] < 0 else ""
-                lines.append(f" {pair}: {p_stat['pnl']:+,.2f} ({p_stat['wins']}승 {p_stat['total'] - p_stat['wins']}패){emoji}")
-        
-        lines.append("\n═══ **전략 분석** ═══")
+            w(" (거래 없음)\n")
+        for pair, p_stat in pair_stats.items():
+            emoji = " ⚠️" if p_stat["pnl"] < 0 else ""
+            w(f" {pair}: {p_stat['pnl']:+,.2f} ({p_stat['wins']}승 {p_stat['total'] - p_stat['wins']}패){emoji}\n")
+
+        w("\n═══ **전략 분석** ═══\n")
         side_stats = stats.get("side_stats", {})
         for side in ["long", "short"]:
             s_stat = side_stats.get(side, {"pnl": 0.0, "wins": 0, "total": 0})
             wr = (s_stat["wins"] / s_stat["total"] * 100) if s_stat["total"] > 0 else 0
             emoji = " ⚠️" if wr < 40 and s_stat["total"] > 0 else ""
-            lines.append(f" {side.capitalize()} 성과: {s_stat['pnl']:+,.2f} ({s_stat['total']}거래, 승률 {wr:.0f}%){emoji}")
-            
-        lines.append(f" 평균 보유시간: {int(stats['avg_hold_minutes'])}분")
+            w(f" {side.capitalize()} 성과: {s_stat['pnl']:+,.2f} ({s_stat['total']}거래, 승률 {wr:.0f}%){emoji}\n")
+
+        w(f" 평균 보유시간: {int(stats['avg_hold_minutes'])}분\n")
         bt = stats.get("best_trade", {})
-        lines.append(f" 최대 단일 수익: {bt.get('pnl_usdt', 0):+,.2f} ({bt.get('pair', 'N/A')} {bt.get('position_side', '').upper()})")
-        lines.append(f" Profit Factor: {stats['pf']:.2f}\n")
-        
-        lines.append("═══ **리스크 지표** ═══")
-        lines.append(f" 최대 동시 포지션: {len(snap.get('holdings_items', []))}개")
+        w(f" 최대 단일 수익: {bt.get('pnl_usdt', 0):+,.2f} ({bt.get('pair', 'N/A')} {bt.get('position_side', '').upper()})\n")
+        w(f" Profit Factor: {stats['pf']:.2f}\n\n")
+
+        w("═══ **리스크 지표** ═══\n")
+        w(f" 최대 동시 포지션: {len(snap.get('holdings_items', []))}개\n")
         margin_usage = (snap.get("total_used_margin", 0) / snap.get("total_value_usdt", 1) * 100)
-        lines.append(f" 현재 마진 사용률: {margin_usage:.1f}%\n")
-        
-        lines.append("═══ **시장 환경** ═══")
-        lines.append(f" BTC 24h 변동률: {market['chg_24h']:+.2f}%")
-        lines.append(f" 거래량 (vs 24h평균): {market.get('volume_ratio', 1.0):.1f}x")
+        w(f" 현재 마진 사용률: {margin_usage:.1f}%\n\n")
+
+        w("═══ **시장 환경** ═══\n")
+        w(f" BTC 24h 변동률: {market['chg_24h']:+.2f}%\n")
+        w(f" 거래량 (vs 24h평균): {market.get('volume_ratio', 1.0):.1f}x")
+        return buf.getvalue()
 
+    async def notify_hourly_report_1h(self, stats_pkg: dict):
+        """1시간 주기 종합 리포트 — 사용자 상세 요청 스타일"""
+        # 숫자 포맷팅이 많은 본문 생성은 이벤트 루프 밖에서 수행
+        description = await asyncio.get_running_loop().run_in_executor(
+            None, self._render_hourly_report, stats_pkg
+        )
         embed = {
-            "description": "\n".join(lines),
-            "color": self.colors["system"],
+            **self._tmpl_system,
+            "description": description,
         }
-        await self._send_webhook(self.webhook_report, embed)
+        await self._send_webhook(self.webhook_report, embed, Priority.REPORT)
+
+    @staticmethod
+    def _render_daily_report(report: dict) -> str:
+        """일일 리포트 본문 생성 (순수 함수 — 실행기 스레드에서 호출)"""
+        buf = io.StringIO()
+        w = buf.write
+        w("📊 **[일일 종합 리포트]**\n")
+        w(f"{REPORT_SEP}\n")
+        w(f"📅 {report['date']} | Day #{report.get('day_num', 1)}\n\n")
+        w("═══════ **💰 손익 요약** ═══════\n")
+        w(f" 총 실현 PnL:    {report['total_pnl']:+,.2f} USDT\n")
+        w(f" 수수료 합계:     {report['total_fees']:-.2f} USDT\n")
+        w(f" 펀딩비 합계:     {report['total_funding']:-.2f} USDT\n")
+        w(f" **순이익:         {report['net_pnl']:+,.2f} USDT ({report['net_pnl']/report['balance_start']*100:+.2f}%)**\n\n")
+        w("═══════ **📊 거래 통계** ═══════\n")
+        w(f" 총 거래: {report['total_trades']}회\n")
+        w(f" 승/패: {report['wins']}/{report['losses']} (승률 {report['win_rate']:.1f}%)\n")
+        w(f" 평균 수익: {report['total_pnl']/report['total_trades'] if report['total_trades'] > 0 else 0:+,.2f} USDT\n")
+        w(f" Profit Factor: {report.get('pf', 0):.2f}\n\n")
+        w("═══════ **🏆 Best & Worst** ═══════\n")
 
-    async def notify_daily_report(self, report: dict):
-        """일일 종합 리포트 — 사용자 상세 요청 스타일"""
-        lines = [
-            "📊 **[일일 종합 리포트]**",
-            "━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            f"📅 {report['date']} | Day #{report.get('day_num', 1)}\n",
-            "═══════ **💰 손익 요약** ═══════",
-            f" 총 실현 PnL:    {report['total_pnl']:+,.2f} USDT",
-            f" 수수료 합계:     {report['total_fees']:-.2f} USDT",
-            f" 펀딩비 합계:     {report['total_funding']:-.2f} USDT",
-            f" **순이익:         {report['net_pnl']:+,.2f} USDT ({report['net_pnl']/report['balance_start']*100:+.2f}%)**\n",
-            "═══════ **📊 거래 통계** ═══════",
-            f" 총 거래: {report['total_trades']}회",
-            f" 승/패: {report['wins']}/{report['losses']} (승률 {report['win_rate']:.1f}%)",
-            f" 평균 수익: {report['total_pnl']/report['total_trades'] if report['total_trades'] > 0 else 0:+,.2f} USDT",
-            f" Profit Factor: {report.get('pf', 0):.2f}\n",
-            "═══════ **🏆 Best & Worst** ═══════"
-        ]
-        
         bt = report.get("best_trade", {})
         wt = report.get("worst_trade", {})
-        lines.append(f" 최고 수익: {bt.get('pnl_usdt', 0):+,.2f} {bt.get('pair', '')} {bt.get('position_side', '').upper()}")
-        lines.append(f" 최고 손실: {wt.get('pnl_usdt', 0):+,.2f} {wt.get('pair', '')} {wt.get('position_side', '').upper()}")
-        lines.append(f" 평균 보유: {int(report.get('avg_hold_minutes', 0))}m\n")
-        
-        lines.append("═══════ **💼 자산 변화** ═══════")
-        lines.append(f" 시작 자산: {report['balance_start']:,.2f} USDT")
-        lines.append(f" 종료 자산: {report['balance_end']:,.2f} USDT")
+        w(f" 최고 수익: {bt.get('pnl_usdt', 0):+,.2f} {bt.get('pair', '')} {bt.get('position_side', '').upper()}\n")
+        w(f" 최고 손실: {wt.get('pnl_usdt', 0):+,.2f} {wt.get('pair', '')} {wt.get('position_side', '').upper()}\n")
+        w(f" 평균 보유: {int(report.get('avg_hold_minutes', 0))}m\n\n")
+
+        w("═══════ **💼 자산 변화** ═══════\n")
+        w(f" 시작 자산: {report['balance_start']:,.2f} USDT\n")
+        w(f" 종료 자산: {report['balance_end']:,.2f} USDT\n")
         change = report['balance_end'] - report['balance_start']
-        lines.append(f" 변화: {change:+,.2f} ({change/report['balance_start']*100:+.2f}%)")
-        lines.append(f" MDD (당일): {report.get('mdd', 0.0):.1f}%\n")
-        
-        lines.append("═══════ **📈 누적 성과** ═══════")
-        lines.append(f" 운영 기간: {report.get('day_num', 1)}일")
-        lines.append(" (누적 통계는 DB에서 점진적으로 확장 예정)")
+        w(f" 변화: {change:+,.2f} ({change/report['balance_start']*100:+.2f}%)\n")
+        w(f" MDD (당일): {report.get('mdd', 0.0):.1f}%\n\n")
+
+        w("═══════ **📈 누적 성과** ═══════\n")
+        w(f" 운영 기간: {report.get('day_num', 1)}일\n")
+        w(" (누적 통계는 DB에서 점진적으로 확장 예정)")
+        return buf.getvalue()
 
+    async def notify_daily_report(self, report: dict):
+        """일일 종합 리포트 — 사용자 상세 요청 스타일"""
+        description = await asyncio.get_running_loop().run_in_executor(
+            None, self._render_daily_report, report
+        )
         embed = {
-            "description": "\n".join(lines),
-            "color": self.colors["system"],
-            "timestamp": datetime.utcnow().isoformat(),
+            **self._tmpl_system,
+            "description": description,
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_report, embed)
+        await self._send_webhook(self.webhook_report, embed, Priority.REPORT)
 
     async def notify_error(self, error_msg: str, severity: str = "ERROR"):
         """에러 알림"""
         embed = {
+            **self._tmpl_error,
             "title": f"🔴 [시스템] {severity}",
             "description": f"```\n{error_msg}\n```",
-            "color": self.colors["emergency"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_error, embed)
+        await self._send_webhook(self.webhook_error, embed, Priority.EMERGENCY)
 
     async def notify_sync_warning(self, message: str):
         """포지션 불일치 경고"""
         embed = {
-            "title": "⚠️ [위험] 포지션 불일치 감지",
+            **self._tmpl_sync_warning,
             "description": message,
-            "color": self.colors["emergency"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_error, embed)
+        await self._send_webhook(self.webhook_error, embed, Priority.EMERGENCY)
 
     async def notify_unmanaged_position(self, pair: str, side: str, qty: float):
         """미관리 포지션 감지 알림"""
         embed = {
-            "title": "⚠️ [주의] 미관리 포지션 감지",
+            **self._tmpl_unmanaged,
             "description": (
                 f"**거래소에는 있으나 봇 DB에 없는 포지션을 발견했습니다.**\n\n"
                 f"• 종목: {pair}\n"
@@ -364,20 +673,19 @@ class DiscordNotifier:
                 f"• 수량: {qty:.6f}\n\n"
                 f"*이 포지션은 자동 청산되지 않으며 리포트에서 별도로 표시됩니다.*"
             ),
-            "color": self.colors["emergency"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_error, embed)
+        await self._send_webhook(self.webhook_error, embed, Priority.EMERGENCY)
 
     async def notify_system(self, title: str, message: str):
         """시스템 메시지"""
         embed = {
+            **self._tmpl_system,
             "title": f"⚙️ [시스템] {title}",
             "description": message,
-            "color": self.colors["system"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
 
     async def notify_shutdown(self, stats: dict):
         """봇 종료 알림 — 사용자 요청 스타일"""
@@ -397,23 +705,22 @@ class DiscordNotifier:
         ]
         
         embed = {
-            "title": "⚙️ [시스템] 봇 종료",
+            **self._tmpl_shutdown,
             "description": "\n".join(lines),
-            "color": self.colors["system"],
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
 
     async def notify_heartbeat(self, status: dict, uptime_str: str = ""):
         """생존 확인 리포트"""
         embed = {
-            "title": "💓 [하트비트] 봇 생존 확인",
-            "color": 0x2ecc71,
+            **self._tmpl_heartbeat,
             "fields": [
                 {"name": "상태", "value": "🟢 정상 운영중", "inline": True},
                 {"name": "업타임", "value": uptime_str or "계산중", "inline": True},
                 {"name": "총자산", "value": format_usdt(status.get("total_balance", 0)), "inline": True},
                 {"name": "포지션", "value": f"{status.get('pos_count', 0)}개", "inline": True},
+                {"name": "알림 유실", "value": f"{self._dropped}건", "inline": True},
             ],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
-        await self._send_webhook(self.webhook_system, embed)
+        await self._send_webhook(self.webhook_system, embed, Priority.SYSTEM)
@@ -1,25 +1,26 @@
 """상수 정의 (OKX)"""
 
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 
-class TradeMode(Enum):
+class TradeMode(StrEnum):
     PAPER = "paper"
     DEMO = "demo"
     LIVE = "live"
 
-class Side(Enum):
+class Side(StrEnum):
     BUY = "buy"
     SELL = "sell"
 
-class PositionSide(Enum):
+class PositionSide(StrEnum):
     LONG = "long"
     SHORT = "short"
 
-class MarketType(Enum):
+class MarketType(StrEnum):
     SPOT = "spot"
     SWAP = "swap"
 
-class ExitReason(Enum):
+class ExitReason(StrEnum):
     TAKE_PROFIT = "tp"
     STOP_LOSS = "sl"
     DEAD_CROSS = "dead_cross"
@@ -27,23 +28,35 @@ class ExitReason(Enum):
     EMERGENCY = "emergency"
     MANUAL = "manual"
 
-class SignalType(Enum):
+class SignalType(StrEnum):
     LONG = "long"
     SHORT = "short"
     EXIT = "exit"
     HOLD = "hold"
 
+# 문자열 → 멤버 역조회 (Enum 생성자 디스패치 없이 dict 조회)
+TRADE_MODES = MappingProxyType(TradeMode._value2member_map_)
+
 # OKX API 제한
 OKX_API_RATE_LIMIT = 20          # 초당 최대 요청
 OKX_API_DELAY = 0.06             # 요청 간 최소 딜레이(초)
 OKX_MIN_ORDER_USDT = 5           # 최소 주문 금액 (USDT)
+PRICE_CACHE_TTL = 2.0            # 현재가 재사용 허용 시간(초)
+BALANCE_CACHE_TTL = 1.0          # 잔고 재사용 허용 시간(초)
+
+# 청산 기준 (진입가 대비 비율)
+EXIT_SL_FIXED_PCT = 0.010        # 고정 손절
+EXIT_SL_CAP_PCT = 0.020          # 동적 손절 최대 캡
+EXIT_TP1_PCT = 0.008             # TP1 (30% 부분 청산)
+EXIT_TP2_PCT = 0.015             # TP2 (30% 부분 청산)
+EXIT_TP3_PCT = 0.025             # TP3 (전량 청산)
 
 # 캔들 데이터 설정
 MIN_CANDLES_FOR_INDICATORS = 50  # 지표 계산 최소 캔들 수
 MAX_CANDLES_CACHE = 200          # 캐시 유지 캔들 수
 
 # 타임프레임 매핑 (레거시 → ccxt 형식)
-TIMEFRAME_MAP = {
+TIMEFRAME_MAP = MappingProxyType({
     "minute1": "1m",
     "minute5": "5m",
     "minute15": "15m",
@@ -55,4 +68,4 @@ TIMEFRAME_MAP = {
     "15m": "15m",
     "1h": "1h",
     "1d": "1d",
-}
+})
@@ -1,20 +1,28 @@
 """유틸리티 함수"""
+from __future__ import annotations
 
+import itertools
 import os
-import yaml
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
-import ccxt
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
+if TYPE_CHECKING:
+    import ccxt
+
 KST = ZoneInfo("Asia/Seoul")
 
 
 def load_config(path: str = "config/settings.yaml") -> dict:
     """YAML 설정 파일 로드"""
+    import yaml  # 지연 임포트 (설정 로드 시에만 필요)
+
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
@@ -24,48 +32,77 @@ def now_kst() -> datetime:
     return datetime.now(KST)
 
 
-def is_trading_session(config: dict) -> bool:
-    """현재 시간이 매매 세션 내인지 확인"""
-    schedule_cfg = config.get("schedule", {})
-    if bool(schedule_cfg.get("always_on", False)):
+def log_enabled(level: str = "INFO") -> bool:
+    """해당 레벨 로그를 받는 loguru 싱크가 하나라도 있는지 확인
+
+    f-string 포맷팅 비용을 피하기 위해 초기화 시점에 한 번 평가해 캐시한다.
+    """
+    return logger.level(level).no >= logger._core.min_level
+
+
+def _hhmm_to_min(hhmm: str) -> int:
+    """"HH:MM" → 자정 기준 분 ("16:30" → 990)"""
+    return int(hhmm[:2]) * 60 + int(hhmm[3:5])
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduleCfg:
+    """매매 세션 설정 (schedule 섹션을 분 단위 정수로 변환한 불변 구조)"""
+
+    always_on: bool = False
+    no_entry_before_end_minutes: int = 15
+    # (시작분, 종료분, 진입 마감분) — 분은 자정 기준 (예: "16:30" → 990)
+    windows: tuple[tuple[int, int, int], ...] = ()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ScheduleCfg":
+        """설정 dict → ScheduleCfg (설정 로드 시 한 번만 변환)"""
+        schedule_cfg = config.get("schedule", {})
+        no_entry_min = int(schedule_cfg.get("no_entry_before_end_minutes", 15))
+        windows = []
+        for session in schedule_cfg.get("sessions", []):
+            start = _hhmm_to_min(session["start"])
+            end = _hhmm_to_min(session["end"])
+            # 마감 이전 차단이 없으면 종료 시각까지 진입 허용
+            cutoff = end - no_entry_min if no_entry_min > 0 else end
+            windows.append((start, end, cutoff))
+        return cls(
+            always_on=bool(schedule_cfg.get("always_on", False)),
+            no_entry_before_end_minutes=no_entry_min,
+            windows=tuple(windows),
+        )
+
+
+def is_trading_session(schedule: ScheduleCfg | dict) -> bool:
+    """현재 시간이 매매 세션 내인지 확인
+
+    schedule은 ScheduleCfg (설정 dict를 넘기면 매번 변환).
+    """
+    if type(schedule) is not ScheduleCfg:
+        schedule = ScheduleCfg.from_config(schedule)
+    if schedule.always_on:
         return True
 
     current = now_kst()
-    current_time = current.strftime("%H:%M")
-    sessions = schedule_cfg.get("sessions", [])
+    now_min = current.hour * 60 + current.minute
 
-    def _in_session(start: str, end: str, now_hhmm: str) -> bool:
-        # 자정을 넘지 않는 세션
+    for start, end, cutoff in schedule.windows:
         if start <= end:
-            return start <= now_hhmm <= end
-        # 자정을 넘는 세션 (예: 16:00~00:00, 22:00~06:00)
-        return now_hhmm >= start or now_hhmm <= end
-
-    for session in sessions:
-        start = session["start"]
-        end = session["end"]
-        if _in_session(start, end, current_time):
-            # 세션 종료 N분 전 신규 진입 차단 체크
-            no_entry_min = int(schedule_cfg.get("no_entry_before_end_minutes", 15))
-            if no_entry_min <= 0:
-                return True
-
-            now_dt = current.replace(second=0, microsecond=0)
-            end_dt = current.replace(
-                hour=int(end[:2]),
-                minute=int(end[3:5]),
-                second=0,
-                microsecond=0,
-            )
-            if start > end and current_time >= start:
-                end_dt += timedelta(days=1)
-
-            cutoff_dt = end_dt - timedelta(minutes=no_entry_min)
-            if now_dt <= cutoff_dt:
-                return True
-
-            logger.debug(f"세션 종료 {no_entry_min}분 전 — 신규 진입 차단")
-            return False
+            # 자정을 넘지 않는 세션
+            if not start <= now_min <= end:
+                continue
+        elif now_min >= start:
+            # 자정을 넘는 세션 (예: 16:00~00:00, 22:00~06:00) — 종료는 익일
+            cutoff += 1440
+        elif now_min > end:
+            continue
+
+        # 세션 종료 N분 전 신규 진입 차단 체크
+        if now_min <= cutoff:
+            return True
+
+        logger.debug(f"세션 종료 {schedule.no_entry_before_end_minutes}분 전 — 신규 진입 차단")
+        return False
     return False
 
 
@@ -118,6 +155,8 @@ def get_okx_credentials(mode: str = "live") -> dict:
 
 def create_okx_exchange(mode: str = "paper") -> ccxt.okx:
     """모드별 OKX exchange 인스턴스 생성"""
+    import ccxt  # 지연 임포트 (거래소 생성 시에만 로드 비용 발생)
+
     mode = (mode or "").lower().strip()
     params = {"enableRateLimit": True}
 
@@ -133,12 +172,19 @@ def create_okx_exchange(mode: str = "paper") -> ccxt.okx:
     return exchange
 
 
+# 거래 ID = 심볼_프로세스접두사_순번 (접두사: PID + 시작 시각, 재시작 간 충돌 방지)
+_TRADE_ID_PREFIX = f"{os.getpid():x}{int(time.time()):x}"
+_trade_id_counter = itertools.count(1)
+_clean_pairs: dict[str, str] = {}
+
+
 def generate_trade_id(pair: str) -> str:
     """고유 거래 ID 생성"""
-    ts = now_kst().strftime("%Y%m%d%H%M%S%f")
-    # OKX 심볼의 /와 : 를 제거하여 ID에 사용
-    clean_pair = pair.replace("/", "").replace(":", "_")
-    return f"{clean_pair}_{ts}"
+    clean_pair = _clean_pairs.get(pair)
+    if clean_pair is None:
+        # OKX 심볼의 /와 : 를 제거하여 ID에 사용
+        clean_pair = _clean_pairs[pair] = pair.replace("/", "").replace(":", "_")
+    return f"{clean_pair}_{_TRADE_ID_PREFIX}_{next(_trade_id_counter):x}"
 
 
 def symbol_to_base(pair: str) -> str:
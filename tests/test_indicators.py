@@ -9,9 +9,9 @@ import pytest
 from src.core.indicators import Indicators
 
 
-@pytest.fixture
-def sample_ohlcv():
-    """테스트용 OHLCV 데이터 생성"""
+@pytest.fixture(scope="session")
+def _sample_ohlcv_session():
+    """테스트용 OHLCV 데이터 생성 (세션당 1회)"""
     np.random.seed(42)
     n = 100
     dates = pd.date_range("2024-01-01", periods=n, freq="5min")
@@ -28,11 +28,17 @@ def sample_ohlcv():
         "low": low,
         "close": close,
         "volume": volume,
-    }, index=dates)
+    }, index=dates, copy=False)
 
     return df
 
 
+@pytest.fixture
+def sample_ohlcv(_sample_ohlcv_session):
+    """테스트별 얕은 복사본 (열 추가가 다른 테스트에 새지 않도록)"""
+    return _sample_ohlcv_session.copy(deep=False)
+
+
 @pytest.fixture
 def indicators():
     config = {
@@ -95,6 +101,12 @@ class TestBollinger:
         assert (valid["bb_upper"] >= valid["bb_mid"]).all()
         assert (valid["bb_mid"] >= valid["bb_lower"]).all()
 
+    def test_bb_arrays_match_dataframe(self, indicators, sample_ohlcv):
+        bands = indicators.calc_bollinger_arr(sample_ohlcv["close"].to_numpy())
+        bb = indicators.calc_bollinger(sample_ohlcv)
+        np.testing.assert_array_equal(bands.mid, bb["bb_mid"].to_numpy())
+        pd.testing.assert_frame_equal(bands.as_dataframe(sample_ohlcv.index), bb)
+
 
 class TestVWAP:
     def test_vwap_returns_series(self, indicators, sample_ohlcv):
@@ -140,6 +152,31 @@ class TestCalculateAll:
         result = indicators.calculate_all(pd.DataFrame())
         assert result is not None
 
+    def test_batch_matches_single(self, indicators, sample_ohlcv, monkeypatch):
+        # numba 미설치 환경에서도 병렬 커널 경로(prange → range)를 실제로 통과시킨다
+        import src.core.indicators as indicators_module
+
+        frames = [sample_ohlcv, sample_ohlcv.iloc[::-1].set_axis(sample_ohlcv.index)]
+        expected = [indicators.calculate_all(frame) for frame in frames]
+
+        kernel = indicators_module._calculate_all_batch_numba
+        calls = []
+
+        def spy(ohlcv, *args):
+            calls.append(ohlcv.shape)
+            return kernel(ohlcv, *args)
+
+        monkeypatch.setattr(indicators_module, "HAS_NUMBA", True)
+        monkeypatch.setattr(indicators_module, "_calculate_all_batch_numba", spy)
+        indicators._use_pandas_ta = False
+        results = indicators.calculate_all_batch(frames)
+        assert calls == [(2, 4, len(sample_ohlcv))]
+        assert len(results) == 2
+        for frame, result, reference in zip(frames, results, expected):
+            assert "ema_fast" not in frame.columns
+            pd.testing.assert_frame_equal(result, indicators.calculate_all(frame))
+            pd.testing.assert_frame_equal(result, reference, check_exact=False, rtol=1e-6)
+
 
 class TestEMACross:
     def test_cross_values(self, indicators, sample_ohlcv):
@@ -90,6 +90,30 @@ class TestEmergencyStop:
         assert rm.check_emergency(df) is True
         assert rm.is_stopped is True
 
+    @staticmethod
+    def _close_df(prices):
+        import pandas as pd
+
+        return pd.DataFrame({"close": prices})
+
+    def test_drop_inside_window(self, rm):
+        # 창(5봉) 안에서 고점 102 → 98.9 (-3.04%)
+        df = self._close_df([100, 100, 102, 101, 100, 99.5, 98.9])
+        assert rm.check_emergency(df) is True
+        assert rm.is_stopped is True
+        assert "급락" in rm.stop_reason
+
+    def test_drop_outside_window(self, rm):
+        # 급락은 창 이전에 발생, 최근 5봉은 보합
+        df = self._close_df([105, 104, 100, 98, 96.9, 97, 97.1, 96.95, 97, 97.05])
+        assert rm.check_emergency(df) is False
+        assert rm.is_stopped is False
+
+    def test_frame_shorter_than_window(self, rm):
+        df = self._close_df([100, 97, 95])
+        assert rm.check_emergency(df) is False
+        assert rm.is_stopped is False
+
 
 class TestManualControl:
     def test_emergency_stop(self, rm):
@@ -106,20 +130,67 @@ class TestManualControl:
 
 class TestRecordResult:
     def test_win_record(self, rm):
-        rm.record_trade_result(1000, 0.001, "KRW-BTC", "take_profit")
+        rm.record_trade_result(10.0, True)
         summary = rm.get_daily_summary()
         assert summary["total_trades"] == 1
         assert summary["wins"] == 1
         assert summary["losses"] == 0
-        assert summary["daily_pnl_krw"] == 1000
+        assert summary["daily_pnl_usdt"] == 10.0
 
     def test_loss_record(self, rm):
-        rm.record_trade_result(-500, -0.0005, "KRW-BTC", "stop_loss")
+        rm.record_trade_result(-5.0, False)
         summary = rm.get_daily_summary()
         assert summary["total_trades"] == 1
         assert summary["wins"] == 0
         assert summary["losses"] == 1
-        assert summary["daily_pnl_krw"] == -500
+        assert summary["daily_pnl_usdt"] == -5.0
+
+    def test_mixed_with_break_even(self, rm):
+        # main은 pnl_pct >= 0 을 승리로 기록 → 본전도 승
+        rm.record_trade_result(10.0, True)
+        rm.record_trade_result(-4.0, False)
+        rm.record_trade_result(0.0, True)
+        summary = rm.get_daily_summary()
+        assert summary == {
+            "total_trades": 3,
+            "wins": 2,
+            "losses": 1,
+            "daily_pnl_usdt": 6.0,
+        }
+        assert rm.consecutive_losses == 0
+
+    def test_counters_reset_after_midnight(self, rm, monkeypatch):
+        import types
+        from datetime import timedelta
+
+        import src.core.risk_manager as risk_module
+
+        rm.record_trade_result(10.0, True)
+        rm.record_trade_result(-4.0, False)
+
+        # 다음 KST 자정 이후로 시간 이동
+        next_day = rm.daily_date + timedelta(days=1)
+        reset_ts = rm._next_reset_ts
+        monkeypatch.setattr(
+            risk_module, "time", types.SimpleNamespace(time=lambda: reset_ts + 1)
+        )
+        monkeypatch.setattr(
+            risk_module,
+            "now_kst",
+            lambda: risk_module.datetime.combine(
+                next_day, risk_module.datetime.min.time(), risk_module.KST
+            ),
+        )
+
+        summary = rm.get_daily_summary()
+        assert summary == {
+            "total_trades": 0,
+            "wins": 0,
+            "losses": 0,
+            "daily_pnl_usdt": 0.0,
+        }
+        assert rm.daily_date == next_day
+        assert rm._next_reset_ts > reset_ts
 
 
 class TestFeeCalculation:
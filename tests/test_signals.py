@@ -24,8 +24,10 @@ def config():
         },
         "risk": {
             "stop_loss_pct": 0.008,
-            "take_profit_btc_pct": 0.007,
-            "take_profit_alt_pct": 0.012,
+            "take_profit_pct": {
+                "BTC/USDT:USDT": 0.007,
+                "XRP/USDT:USDT": 0.012,
+            },
         },
         "trading": {
             "max_hold_minutes": 60,
@@ -44,25 +46,30 @@ def engine(config):
     return SignalEngine(config)
 
 
+_ONES5 = np.ones(5, dtype=np.float64)
+
+
 def make_df(
     ema_fast=101, ema_slow=100, rsi=47, close=105,
     bb_mid=100, vol_ratio=2.0, vwap=100, rows=5,
 ):
     """조건 충족하는 기본 DataFrame 생성"""
+    ones = _ONES5 if rows == 5 else np.ones(rows, dtype=np.float64)
+    close_arr = ones * close
     data = {
-        "close": [close] * rows,
-        "open": [close] * rows,
-        "high": [close + 1] * rows,
-        "low": [close - 1] * rows,
-        "volume": [1000] * rows,
-        "ema_fast": [ema_fast] * rows,
-        "ema_slow": [ema_slow] * rows,
-        "rsi": [rsi] * rows,
-        "bb_mid": [bb_mid] * rows,
-        "vol_ratio": [vol_ratio] * rows,
-        "vwap": [vwap] * rows,
+        "close": close_arr,
+        "open": close_arr,
+        "high": close_arr + 1,
+        "low": close_arr - 1,
+        "volume": ones * 1000,
+        "ema_fast": ones * ema_fast,
+        "ema_slow": ones * ema_slow,
+        "rsi": ones * rsi,
+        "bb_mid": ones * bb_mid,
+        "vol_ratio": ones * vol_ratio,
+        "vwap": ones * vwap,
     }
-    return pd.DataFrame(data)
+    return pd.DataFrame(data, copy=False)
 
 
 class TestBuySignal:
@@ -161,48 +168,75 @@ class TestSellSignal:
 class TestSignalScore:
     def test_all_met_score(self, engine):
         conditions = {
-            "ema_cross": True,
-            "rsi_range": True,
+            "ema_bullish": True,
+            "rsi_in_range": True,
             "above_bb_mid": True,
             "volume_surge": True,
             "above_vwap": True,
-            "trend_ok": True,
+            "trend_bullish": True,
         }
         score = engine.calc_signal_score(conditions)
         assert score == 100
 
     def test_none_met_score(self, engine):
         conditions = {
-            "ema_cross": False,
-            "rsi_range": False,
+            "ema_bullish": False,
+            "rsi_in_range": False,
             "above_bb_mid": False,
             "volume_surge": False,
             "above_vwap": False,
-            "trend_ok": False,
+            "trend_bullish": False,
         }
         score = engine.calc_signal_score(conditions)
         assert score == 0
 
     def test_partial_score(self, engine):
         conditions = {
-            "ema_cross": True,     # 20
-            "rsi_range": True,     # 15
+            "ema_bullish": True,   # 25
+            "rsi_in_range": True,  # 15
             "above_bb_mid": False,
             "volume_surge": False,
             "above_vwap": False,
-            "trend_ok": False,
+            "trend_bullish": False,
         }
         score = engine.calc_signal_score(conditions)
-        assert score == 35
+        assert score == 40
+
+    def test_short_score(self, engine):
+        conditions = {
+            "ema_bearish": True,     # 25
+            "rsi_overbought": False,
+            "below_bb_mid": True,    # 15
+            "volume_surge": True,    # 20
+            "below_vwap": False,
+            "trend_bearish": True,   # 15
+        }
+        score = engine.calc_signal_score(conditions)
+        assert score == 75
+
+    def test_unknown_key_rejected(self, engine):
+        with pytest.raises(ValueError, match="ema_cross"):
+            engine.calc_signal_score({"ema_cross": True, "above_vwap": True})
 
 
 class TestTargets:
     def test_btc_targets(self, engine):
-        target, stop = engine.calc_targets(100_000_000, "KRW-BTC")
-        assert target == 100_000_000 * 1.007
-        assert stop == 100_000_000 * 0.992
+        target, stop = engine.calc_targets(100_000, "BTC/USDT:USDT")
+        assert target == pytest.approx(100_000 * 1.007)
+        assert stop == pytest.approx(100_000 * 0.992)
 
     def test_alt_targets(self, engine):
-        target, stop = engine.calc_targets(1000, "KRW-XRP")
-        assert target == 1000 * 1.012
-        assert stop == 1000 * 0.992
+        target, stop = engine.calc_targets(1000, "XRP/USDT:USDT")
+        assert target == pytest.approx(1000 * 1.012)
+        assert stop == pytest.approx(1000 * 0.992)
+
+    def test_short_targets(self, engine):
+        target, stop = engine.calc_targets(1000, "XRP/USDT:USDT", "short")
+        assert target == pytest.approx(1000 * 0.988)
+        assert stop == pytest.approx(1000 * 1.008)
+
+    def test_unlisted_pair_uses_default(self, engine):
+        # 설정에 없는 페어는 기본 익절 1%
+        target, stop = engine.calc_targets(50, "DOGE/USDT:USDT")
+        assert target == pytest.approx(50 * 1.01)
+        assert stop == pytest.approx(50 * 0.992)
@@ -0,0 +1,56 @@
+"""
+테스트 — 거래 기록 모듈 (일일 통계 캐시)
+"""
+
+import pytest
+
+import src.database.trade_logger as trade_logger_module
+from src.database.trade_logger import TradeLogger
+
+
+@pytest.fixture
+def stats_calls(monkeypatch):
+    """get_detailed_stats 호출을 기록하는 가짜 집계 (DB 미사용)"""
+    calls = []
+
+    def fake_stats(start_time, end_time, include_trades=False):
+        calls.append((start_time, end_time))
+        return {
+            "total_trades": 2,
+            "pair_stats": {"BTC/USDT:USDT": {"pnl": 5.0, "wins": 1, "total": 2}},
+            "best_trade": {"pnl_usdt": 7.0},
+        }
+
+    monkeypatch.setattr(TradeLogger, "get_detailed_stats", staticmethod(fake_stats))
+    monkeypatch.setattr(trade_logger_module, "_closed_day_stats", {})
+    monkeypatch.setattr(trade_logger_module, "_open_day_stats", {})
+    return calls
+
+
+class TestDailyStatsCache:
+    def test_past_date_hit(self, stats_calls):
+        first = TradeLogger.calculate_daily_stats("2020-01-01")
+        second = TradeLogger.calculate_daily_stats("2020-01-01")
+        assert len(stats_calls) == 1
+        assert second == first
+        assert "2020-01-01" in trade_logger_module._closed_day_stats
+
+    def test_past_date_copy_is_deep(self, stats_calls):
+        first = TradeLogger.calculate_daily_stats("2020-01-01")
+        first["pair_stats"]["BTC/USDT:USDT"]["pnl"] = -999.0
+        first["best_trade"].clear()
+        second = TradeLogger.calculate_daily_stats("2020-01-01")
+        assert len(stats_calls) == 1
+        assert second["pair_stats"]["BTC/USDT:USDT"]["pnl"] == 5.0
+        assert second["best_trade"] == {"pnl_usdt": 7.0}
+
+    def test_open_day_invalidated_by_new_trade(self, stats_calls, monkeypatch):
+        today = trade_logger_module.now_kst().strftime("%Y-%m-%d")
+        first = TradeLogger.calculate_daily_stats(today)
+        first["pair_stats"]["BTC/USDT:USDT"]["wins"] = 0
+        assert TradeLogger.calculate_daily_stats(today)["pair_stats"]["BTC/USDT:USDT"]["wins"] == 1
+        assert len(stats_calls) == 1
+
+        monkeypatch.setattr(trade_logger_module, "_trade_generation", trade_logger_module._trade_generation + 1)
+        TradeLogger.calculate_daily_stats(today)
+        assert len(stats_calls) == 2